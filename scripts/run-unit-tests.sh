@@ -16,9 +16,15 @@ cd "$(dirname "$0")/.."
 # Set coverage file for unit tests
 export COVERAGE_FILE=.coverage.unit
 
-# Run unit tests with coverage
+# Keep pytest's tmp_path directories in memory-backed storage when available
+if [ -d /dev/shm ]; then
+    export TMPDIR=/dev/shm
+fi
+
+# Run unit tests with coverage, spread across CPU cores (one module per worker)
 echo -e "${YELLOW}📊 Running unit tests with coverage...${NC}"
-uv run pytest tests/unit/ -v --cov-report=term-missing
+uv run pytest tests/unit/ -v --cov-report=term-missing \
+    -n auto --dist=loadfile
 
 echo ""
 echo -e "${GREEN}✅ Unit tests completed!${NC}"
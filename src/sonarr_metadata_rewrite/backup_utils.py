@@ -25,10 +25,41 @@ New backups are always written in the new format; the legacy path is only ever
 *read*, never written.
 """
 
+import os
 import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
 
+def _name_stem(name: str) -> str:
+    """Return the stem of a file name, following the rules of Path.stem."""
+    dot = name.rfind(".")
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+
+def _iter_same_stem_files(directory: Path, stem: str) -> Iterator[Path]:
+    """Yield files in a directory whose stem equals ``stem``.
+
+    Names are compared as strings straight from the directory listing, so a
+    Path is only built for matching entries.
+
+    Args:
+        directory: Directory to search (a missing directory yields nothing)
+        stem: File stem to match, e.g. "poster"
+
+    Yields:
+        Paths of matching regular files
+    """
+    try:
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            if _name_stem(entry.name) == stem and entry.is_file():
+                yield Path(entry.path)
+
+
 def _legacy_backup_path(
     file_path: Path, backup_dir: Path, root_dir: Path
 ) -> Path | None:
@@ -82,11 +113,11 @@ def get_backup_path(
     if backup_path.exists():
         return backup_path
 
-    if backup_path.parent.exists():
-        stem = backup_path.stem
-        for existing_file in backup_path.parent.iterdir():
-            if existing_file.is_file() and existing_file.stem == stem:
-                return existing_file
+    existing_file = next(
+        _iter_same_stem_files(backup_path.parent, backup_path.stem), None
+    )
+    if existing_file is not None:
+        return existing_file
 
     # --- Legacy format fallback (backward compat) ---
     if root_dirs:
@@ -96,11 +127,11 @@ def get_backup_path(
                 continue
             if legacy.exists():
                 return legacy
-            if legacy.parent.exists():
-                stem = legacy.stem
-                for existing_file in legacy.parent.iterdir():
-                    if existing_file.is_file() and existing_file.stem == stem:
-                        return existing_file
+            existing_file = next(
+                _iter_same_stem_files(legacy.parent, legacy.stem), None
+            )
+            if existing_file is not None:
+                return existing_file
 
     return None
 
@@ -170,11 +201,9 @@ def restore_from_backup(
 
     # Delete files with same stem but different extensions
     # This handles cases like poster.jpg existing when restoring poster.png
-    if file_path.parent.exists():
-        stem = file_path.stem
-        for existing_file in file_path.parent.iterdir():
-            if existing_file.is_file() and existing_file.stem == stem:
-                existing_file.unlink()
+    # Collect first so the directory is not modified while it is being listed
+    for existing_file in list(_iter_same_stem_files(file_path.parent, file_path.stem)):
+        existing_file.unlink()
 
     # Copy backup to original location
     shutil.copy2(backup_path, file_path)
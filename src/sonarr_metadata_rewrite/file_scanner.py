@@ -6,7 +6,7 @@ from collections.abc import Callable
 from pathlib import Path
 
 from sonarr_metadata_rewrite.config import Settings
-from sonarr_metadata_rewrite.file_utils import find_target_files
+from sonarr_metadata_rewrite.file_utils import iter_target_files
 
 logger = logging.getLogger(__name__)
 
@@ -78,10 +78,9 @@ class FileScanner:
             logger.info(f"Starting scan of directory: {root_dir}")
 
             try:
-                # Scan for target files (.nfo and rewritable images) in one pass
-                target_files = find_target_files(root_dir)
-
-                for file_path in target_files:
+                # Stream target files (.nfo and rewritable images) in one pass,
+                # processing each directory's files before listing the next
+                for file_path in iter_target_files(root_dir):
                     if self.stop_event is not None and self.stop_event.is_set():
                         break
 
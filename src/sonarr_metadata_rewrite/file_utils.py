@@ -4,8 +4,10 @@ Centralizes image filename rules (poster/clearlogo/season posters) and supported
 extensions so other modules can reuse the same logic consistently.
 """
 
+import os
 import re
 import xml.etree.ElementTree as ET
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import cast
 
@@ -15,6 +17,47 @@ from sonarr_metadata_rewrite.retry_utils import retry
 # Supported image extensions (lowercase with leading dot)
 IMAGE_EXTENSIONS: set[str] = {".jpg", ".jpeg", ".png"}
 
+# NFO suffix spellings that need no case folding
+_NFO_SUFFIXES = (".nfo", ".NFO")
+
+# Leading root element of a plain NFO: optional BOM and XML declaration, then
+# an unprefixed tag name terminated by whitespace, "/" or ">"
+_NFO_ROOT_TAG_PATTERN = re.compile(
+    rb"(?:\xef\xbb\xbf)?\s*(?:<\?xml[^>]*\?>\s*)?<([A-Za-z_][\w.-]*)(?=[\s/>])"
+)
+_NFO_ROOT_TAG_PROBE_BYTES = 512
+
+# Season poster basename like "season01-poster"
+_SEASON_POSTER_PATTERN = re.compile(r"season(\d+)-poster")
+
+# Fixed image basenames mapped to their (kind, season_number)
+_IMAGE_KINDS_BY_STEM: dict[str, tuple[str, int | None]] = {
+    "poster": ("poster", None),
+    "clearlogo": ("clearlogo", None),
+    "season-specials-poster": ("poster", 0),
+}
+
+# Whole rewritable image file name, matched in one pass; built from the same
+# tables as parse_image_info for the per-entry check during directory walks
+_REWRITABLE_IMAGE_NAME_PATTERN = re.compile(
+    "(?:{stems}|{season_poster})(?:{extensions})".format(
+        stems="|".join(map(re.escape, _IMAGE_KINDS_BY_STEM)),
+        season_poster=_SEASON_POSTER_PATTERN.pattern,
+        extensions="|".join(map(re.escape, sorted(IMAGE_EXTENSIONS))),
+    ),
+    re.IGNORECASE,
+)
+
+# Any target file name (NFO with a non-empty stem, or rewritable image), so the
+# directory walk classifies each entry with a single regex engine pass
+_TARGET_NAME_PATTERN = re.compile(
+    rf".+\.nfo|{_REWRITABLE_IMAGE_NAME_PATTERN.pattern}",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# XML declarations, stripped so adjacent documents can share one wrapper root
+_XML_DECLARATION_PATTERN = re.compile(r"<\?xml[^>]*\?>")
+
 
 def parse_image_info(basename: str) -> tuple[str, int | None]:
     """Parse image basename to determine kind and season number.
@@ -34,18 +77,12 @@ def parse_image_info(basename: str) -> tuple[str, int | None]:
 
     name = Path(basename).stem.lower()
 
-    # Series-level poster/clearlogo
-    if name == "poster":
-        return ("poster", None)
-    if name == "clearlogo":
-        return ("clearlogo", None)
-
-    # Specials poster
-    if name == "season-specials-poster":
-        return ("poster", 0)
+    # Series-level poster/clearlogo and the specials poster
+    if name in _IMAGE_KINDS_BY_STEM:
+        return _IMAGE_KINDS_BY_STEM[name]
 
     # Season poster like season01-poster
-    m = re.match(r"^season(\d+)-poster$", name)
+    m = _SEASON_POSTER_PATTERN.fullmatch(name)
     if m:
         return ("poster", int(m.group(1)))
 
@@ -61,7 +98,25 @@ def is_nfo_file(file_path: Path) -> bool:
     Returns:
         True if the file has .nfo or .NFO extension, False otherwise
     """
-    return file_path.suffix.lower() == ".nfo"
+    return is_nfo_name(file_path.name)
+
+
+def is_nfo_name(name: str) -> bool:
+    """Check if a file name has an NFO extension (case-insensitive).
+
+    Args:
+        name: File name without any directory part
+
+    Returns:
+        True if the name ends in .nfo in any case, False otherwise
+    """
+    # Slice the name instead of going through Path.suffix, and only lowercase
+    # mixed-case suffixes; a bare ".nfo" dotfile has no suffix, so a non-empty
+    # stem is required
+    suffix = name[-4:]
+    return len(name) > len(suffix) and (
+        suffix in _NFO_SUFFIXES or suffix.lower() == ".nfo"
+    )
 
 
 def is_rewritable_image(file_path: Path) -> bool:
@@ -74,8 +129,20 @@ def is_rewritable_image(file_path: Path) -> bool:
         True if filename matches poster.* or seasonNN-poster.*
         or clearlogo.*, False otherwise
     """
-    kind, _ = parse_image_info(file_path.name)
-    return bool(kind)
+    return is_rewritable_image_name(file_path.name)
+
+
+def is_rewritable_image_name(name: str) -> bool:
+    """Check if an image file name matches patterns for poster or clearlogo.
+
+    Args:
+        name: File name without any directory part
+
+    Returns:
+        True if the name matches poster.* or seasonNN-poster.*
+        or clearlogo.*, False otherwise
+    """
+    return _REWRITABLE_IMAGE_NAME_PATTERN.fullmatch(name) is not None
 
 
 def find_root_dir_for_file(file_path: Path, root_dirs: list[Path]) -> Path | None:
@@ -94,7 +161,11 @@ def find_root_dir_for_file(file_path: Path, root_dirs: list[Path]) -> Path | Non
     return None
 
 
-def find_target_files(directory: Path, recursive: bool = True) -> list[Path]:
+def find_target_files(
+    directory: Path,
+    recursive: bool = True,
+    name_predicate: Callable[[str], bool] | None = None,
+) -> list[Path]:
     """Find all target files (.nfo and rewritable images) in one pass.
 
     This consolidates file system traversal to avoid duplicated logic.
@@ -102,29 +173,87 @@ def find_target_files(directory: Path, recursive: bool = True) -> list[Path]:
     Args:
         directory: Directory to search in
         recursive: Whether to search recursively in subdirectories
+        name_predicate: File name filter applied before any Path is built,
+            e.g. is_nfo_name; defaults to NFO and rewritable image names
 
     Returns:
-        List of paths to all NFO files and rewritable image files found
+        List of paths to all matching files found
+    """
+    return list(iter_target_files(directory, recursive, name_predicate))
+
+
+def iter_target_files(
+    directory: Path,
+    recursive: bool = True,
+    name_predicate: Callable[[str], bool] | None = None,
+) -> Iterator[Path]:
+    """Yield target files as the directory walk reaches them.
+
+    Each directory is listed completely before its files are yielded, so the
+    caller may rewrite files while iterating without disturbing the listing.
+
+    Args:
+        directory: Directory to search in
+        recursive: Whether to search recursively in subdirectories
+        name_predicate: File name filter applied before any Path is built,
+            e.g. is_nfo_name; defaults to NFO and rewritable image names
+
+    Yields:
+        Paths of matching files
     """
     if not directory.exists():
-        return []
+        return
 
-    all_entries = directory.rglob("*") if recursive else directory.glob("*")
+    matches_name = name_predicate or _is_target_name
+    pending = [os.fspath(directory)]
+    while pending:
+        files, subdirectories = _scan_directory(pending.pop(), recursive, matches_name)
+        pending.extend(subdirectories)
+        yield from files
 
-    results: list[Path] = []
-    for file_path in all_entries:
-        if not file_path.is_file():
-            continue
 
-        if is_target_file(file_path):
-            results.append(file_path)
+def _scan_directory(
+    directory: str, recursive: bool, matches_name: Callable[[str], bool]
+) -> tuple[list[Path], list[str]]:
+    """List one directory for iter_target_files.
+
+    DirEntry type checks reuse readdir data, and Paths are only built for files
+    whose names match. Like rglob, symlinked directories are not descended into
+    and unreadable directories are skipped.
+
+    Args:
+        directory: Directory to list
+        recursive: Whether to return subdirectories for further scanning
+        matches_name: File name filter
 
-    return results
+    Returns:
+        Tuple of (matching files, subdirectories still to scan)
+    """
+    files: list[Path] = []
+    subdirectories: list[str] = []
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return files, subdirectories
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    subdirectories.append(entry.path)
+                continue
+            if matches_name(entry.name) and entry.is_file():
+                files.append(Path(entry.path))
+    return files, subdirectories
 
 
 def is_target_file(file_path: Path) -> bool:
     """Return True if path is a target file (.nfo or rewritable image)."""
-    return is_nfo_file(file_path) or is_rewritable_image(file_path)
+    return _is_target_name(file_path.name)
+
+
+def _is_target_name(name: str) -> bool:
+    """Return True if a file name is a target (.nfo or rewritable image)."""
+    return _TARGET_NAME_PATTERN.fullmatch(name) is not None
 
 
 def parse_nfo_with_retry(nfo_path: Path) -> MetadataInfo:
@@ -165,11 +294,41 @@ def extract_metadata_info(nfo_path: Path) -> MetadataInfo:
     return parse_nfo_with_retry(nfo_path)
 
 
+def read_nfo_root_tag(nfo_path: Path) -> str | None:
+    """Read the tag of the first element in an NFO file without a full parse.
+
+    The tag is matched directly from the first bytes when possible, falling
+    back to parsing up to the first start event, so callers can cheaply skip
+    NFOs of the wrong kind before running the full extraction.
+
+    Args:
+        nfo_path: Path to .nfo file
+
+    Returns:
+        Tag of the first element, or None if it could not be read yet
+    """
+    try:
+        with nfo_path.open("rb") as nfo_file:
+            # Common case: the root tag is readable straight from the first bytes
+            match = _NFO_ROOT_TAG_PATTERN.match(
+                nfo_file.read(_NFO_ROOT_TAG_PROBE_BYTES)
+            )
+            if match:
+                return match.group(1).decode("ascii")
+            # Comments, doctypes or unusual encodings need the real parser
+            nfo_file.seek(0)
+            for _event, element in ET.iterparse(nfo_file, events=("start",)):
+                return str(element.tag)
+    except ET.ParseError, OSError:
+        return None
+    return None
+
+
 def _parse_nfo_documents(nfo_path: Path) -> MetadataInfo:
     """Parse one or more adjacent XML documents from an NFO file."""
     raw_content = nfo_path.read_text(encoding="utf-8")
     normalized_content = raw_content.strip()
-    normalized_content = re.sub(r"<\?xml[^>]*\?>", "", normalized_content).strip()
+    normalized_content = _XML_DECLARATION_PATTERN.sub("", normalized_content).strip()
     wrapped_content = f"<nfo-root>{normalized_content}</nfo-root>"
     wrapped_root = ET.fromstring(wrapped_content)
 
@@ -189,11 +348,22 @@ def _parse_nfo_documents(nfo_path: Path) -> MetadataInfo:
     raise ET.ParseError("Unsupported NFO root structure")
 
 
+def _document_tree(root: ET.Element) -> ET.ElementTree:
+    """Wrap a parsed document element in its own tree without re-parsing it.
+
+    The wrapper root is simply discarded, so the element needs no copying.
+    Its tail holds the whitespace that followed the document in the file and
+    is cleared so it is not written back after the root's closing tag.
+    """
+    root.tail = None
+    return ET.ElementTree(root)
+
+
 def _extract_tvshow_metadata(root: ET.Element) -> MetadataInfo:
     """Extract metadata from a single tvshow document."""
     info = MetadataInfo(
         file_type="tvshow",
-        xml_tree=ET.ElementTree(ET.fromstring(ET.tostring(root, encoding="unicode"))),
+        xml_tree=_document_tree(root),
     )
     _populate_common_metadata(info, root)
     return info
@@ -203,7 +373,7 @@ def _extract_movie_metadata(root: ET.Element) -> MetadataInfo:
     """Extract metadata from a single movie document."""
     info = MetadataInfo(
         file_type="movie",
-        xml_tree=ET.ElementTree(ET.fromstring(ET.tostring(root, encoding="unicode"))),
+        xml_tree=_document_tree(root),
     )
     _populate_common_metadata(info, root)
     return info
@@ -240,7 +410,7 @@ def _extract_episode_metadata(root: ET.Element) -> MetadataInfo:
 
 def _build_episode_entry(root: ET.Element) -> EpisodeMetadataInfo:
     """Build a single episode metadata entry from an XML root."""
-    tree = ET.ElementTree(ET.fromstring(ET.tostring(root, encoding="unicode")))
+    tree = _document_tree(root)
     entry = EpisodeMetadataInfo(xml_tree=tree)
     _populate_common_metadata(entry, root)
 
@@ -259,8 +429,8 @@ def _populate_common_metadata(
     info: MetadataInfo | EpisodeMetadataInfo, root: ET.Element
 ) -> None:
     """Populate shared metadata fields from a root element."""
-    # Extract all uniqueid elements
-    for uniqueid in root.findall(".//uniqueid"):
+    # Extract all descendant uniqueid elements (C iterator, no ElementPath dispatch)
+    for uniqueid in root.iter("uniqueid"):
         id_type = uniqueid.get("type", "").lower()
         id_value = uniqueid.text
         if not id_value or not id_value.strip():
@@ -18,6 +18,7 @@ from sonarr_metadata_rewrite.file_utils import (
     extract_metadata_info,
     is_nfo_file,
     parse_image_info,
+    read_nfo_root_tag,
 )
 from sonarr_metadata_rewrite.image_utils import (
     embed_marker_and_atomic_write,
@@ -206,6 +207,11 @@ class ImageProcessor:
             for nfo_path in image_path.parent.iterdir():
                 if not nfo_path.is_file() or not is_nfo_file(nfo_path):
                     continue
+                # Skip episode NFOs without a full parse; unreadable ones still
+                # go through the retrying extractor below.
+                root_tag = read_nfo_root_tag(nfo_path)
+                if root_tag is not None and root_tag not in {"tvshow", "movie"}:
+                    continue
                 try:
                     metadata_info = extract_metadata_info(nfo_path)
                 except ET.ParseError, OSError, ValueError:
@@ -702,7 +702,7 @@ class MetadataProcessor:
         """Write translated content for one or more episode XML documents."""
         temp_path = nfo_path.with_suffix(".nfo.tmp")
         try:
-            serialized_documents: list[str] = []
+            serialized_documents: list[bytes] = []
             for index, entry in enumerate(episode_entries):
                 xml_tree = entry.xml_tree
                 if xml_tree is None:
@@ -722,14 +722,16 @@ class MetadataProcessor:
                     self._write_tagline(root, translation)
 
                 ET.indent(xml_tree, space="  ", level=0)
-                serialized_documents.append(ET.tostring(root, encoding="unicode"))
+                # UTF-8 bytes straight from the serializer; no declaration per
+                # document, a single one is written for the whole file below
+                serialized_documents.append(ET.tostring(root, encoding="utf-8"))
 
             content = (
-                '<?xml version="1.0" encoding="utf-8"?>\n'
-                + "\n".join(serialized_documents)
-                + "\n"
+                b'<?xml version="1.0" encoding="utf-8"?>\n'
+                + b"\n".join(serialized_documents)
+                + b"\n"
             )
-            temp_path.write_text(content, encoding="utf-8")
+            temp_path.write_bytes(content)
             temp_path.replace(nfo_path)
         except Exception:
             if temp_path.exists():
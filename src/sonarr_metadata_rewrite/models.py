@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Literal
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TmdbIds:
     """TMDB identifiers extracted from .nfo files."""
 
@@ -33,7 +33,7 @@ class TmdbIds:
         return f"tv/{self.tmdb_id}"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TranslatedString:
     """A translated string with its source language."""
 
@@ -41,7 +41,7 @@ class TranslatedString:
     language: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TranslatedContent:
     """Translated content for TV series or episodes."""
 
@@ -91,7 +91,7 @@ class EpisodeMetadataInfo:
     xml_tree: ET.ElementTree | None = None
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class ProcessResult:
     """Base result of processing a file."""
 
@@ -103,7 +103,7 @@ class ProcessResult:
     file_modified: bool = False
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class MetadataProcessResult(ProcessResult):
     """Result of processing a metadata file."""
 
@@ -111,7 +111,7 @@ class MetadataProcessResult(ProcessResult):
     translated_content: TranslatedContent | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ImageCandidate:
     """TMDB image candidate information."""
 
@@ -120,7 +120,7 @@ class ImageCandidate:
     iso_3166_1: str | None
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class ImageProcessResult(ProcessResult):
     """Result of processing an image file."""
 
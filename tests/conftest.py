@@ -1,8 +1,10 @@
 """Shared test configuration and fixtures."""
 
+import functools
 import gc
+import os
 import tempfile
-from collections.abc import Callable, Generator
+from collections.abc import Callable, Generator, Mapping
 from pathlib import Path
 from typing import Any
 from unittest.mock import Mock
@@ -183,17 +185,43 @@ SAMPLE_DATA = {
     "multi_episode.nfo": SAMPLE_MULTI_EPISODE_NFO,
 }
 
+# Samples pre-encoded once so per-test file creation is a single write
+_SAMPLE_DATA_BYTES = {name: data.encode("utf-8") for name, data in SAMPLE_DATA.items()}
+
+
+# Memory-backed scratch space keeps per-test file I/O off the disk when present
+_MEMORY_TEMP_DIR = Path("/dev/shm")
+
 
 @pytest.fixture
 def test_data_dir() -> Generator[Path]:
     """Create a temporary test data directory for all tests."""
-    with tempfile.TemporaryDirectory() as temp_dir:
+    temp_root = _MEMORY_TEMP_DIR if _MEMORY_TEMP_DIR.is_dir() else None
+    with tempfile.TemporaryDirectory(dir=temp_root) as temp_dir:
         yield Path(temp_dir)
 
 
+@functools.cache
+def _settings_template() -> Settings:
+    """Build the shared test Settings from field defaults; variants copy it.
+
+    ``model_construct`` reads neither the environment nor ``.env``, so caching
+    the template cannot hand a test values that were current at first use only.
+    """
+    return Settings.model_construct(
+        tmdb_api_key="test_key_12345",
+        rewrite_root_dirs=[Path(tempfile.gettempdir())],
+        preferred_languages=["zh-CN"],
+        periodic_scan_interval_seconds=1,
+    )
+
+
 def create_test_settings(test_data_dir: Path, **kwargs: Any) -> Settings:
     """Create test settings with safe defaults and custom overrides.
 
+    Settings are derived from a cached, environment-independent template with
+    ``model_copy``, so no per-call model validation or source loading happens.
+
     Args:
         test_data_dir: Temporary test directory path
         **kwargs: Settings overrides (e.g., preferred_languages="zh-CN,ja-JP")
@@ -201,11 +229,15 @@ def create_test_settings(test_data_dir: Path, **kwargs: Any) -> Settings:
     Returns:
         Settings object with safe test defaults and any custom overrides
     """
-    # Build explicit parameters for Settings constructor
-    params = {
+    # model_copy skips validation, so run the "before" parsers explicitly
+    update = {
         "tmdb_api_key": kwargs.get("tmdb_api_key", "test_key_12345"),
-        "rewrite_root_dirs": kwargs.get("rewrite_root_dirs", [test_data_dir]),
-        "preferred_languages": kwargs.get("preferred_languages", "zh-CN"),
+        "rewrite_root_dirs": Settings.parse_rewrite_root_dirs(
+            kwargs.get("rewrite_root_dirs", [test_data_dir])
+        ),
+        "preferred_languages": Settings.parse_preferred_languages(
+            kwargs.get("preferred_languages", "zh-CN")
+        ),
         "periodic_scan_interval_seconds": kwargs.get(
             "periodic_scan_interval_seconds", 1
         ),
@@ -215,7 +247,7 @@ def create_test_settings(test_data_dir: Path, **kwargs: Any) -> Settings:
         "cache_dir": kwargs.get("cache_dir", test_data_dir / "cache"),
     }
 
-    return Settings(**params)
+    return _settings_template().model_copy(update=update)
 
 
 @pytest.fixture
@@ -224,6 +256,44 @@ def test_settings(test_data_dir: Path) -> Settings:
     return create_test_settings(test_data_dir)
 
 
+def write_test_file(path: Path, data: bytes) -> None:
+    """Write a test file, creating parent directories.
+
+    Args:
+        path: Destination file path
+        data: Complete file content
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def make_tree(root: Path, files: Mapping[str, str | bytes]) -> list[Path]:
+    """Create files below root, making each distinct parent directory once.
+
+    Args:
+        root: Directory the relative paths are resolved against
+        files: Relative file path to content; str content is written as UTF-8
+
+    Returns:
+        Created file paths, in the order given
+    """
+    paths = [root / relative_path for relative_path in files]
+    for parent in {path.parent for path in paths}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for path, content in zip(paths, files.values(), strict=True):
+        path.write_bytes(content.encode() if isinstance(content, str) else content)
+    return paths
+
+
+def create_empty_file(path: Path) -> None:
+    """Create an empty file with a bare open/close, skipping touch's utime call.
+
+    Args:
+        path: File path in an existing directory
+    """
+    os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+
+
 @pytest.fixture
 def create_test_files() -> Generator[Callable[[str, Path], Path]]:
     """Factory fixture to create test files from inline data with cleanup."""
@@ -231,11 +301,10 @@ def create_test_files() -> Generator[Callable[[str, Path], Path]]:
 
     def _create_file(sample_name: str, dest_path: Path) -> Path:
         """Create a test file from inline sample data."""
-        if sample_name not in SAMPLE_DATA:
+        if sample_name not in _SAMPLE_DATA_BYTES:
             raise ValueError(f"Unknown sample: {sample_name}")
 
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        dest_path.write_text(SAMPLE_DATA[sample_name])
+        write_test_file(dest_path, _SAMPLE_DATA_BYTES[sample_name])
         created_files.append(dest_path)
         return dest_path
 
@@ -253,6 +322,34 @@ def callback_tracker() -> Mock:
     return Mock()
 
 
+def assert_file_content(path: Path, expected: str | bytes) -> None:
+    """Assert a file holds exactly the expected content.
+
+    Args:
+        path: File to check
+        expected: Expected content; str is compared as UTF-8
+    """
+    expected_bytes = expected.encode() if isinstance(expected, str) else expected
+    assert path.read_bytes() == expected_bytes
+
+
+def assert_logged(caplog: pytest.LogCaptureFixture, *fragments: str) -> None:
+    """Assert every fragment appears in some captured log message.
+
+    Args:
+        caplog: Log capture fixture holding the records
+        *fragments: Substrings that must each occur in at least one message
+    """
+    # Format each record once, instead of re-joining caplog.text per check
+    messages = [record.getMessage() for record in caplog.records]
+    missing = [
+        fragment
+        for fragment in fragments
+        if not any(fragment in message for message in messages)
+    ]
+    assert not missing, f"Not logged: {missing!r} in {messages!r}"
+
+
 def assert_process_result(
     result: MetadataProcessResult,
     expected_success: bool,
@@ -10,7 +10,7 @@ from fast_langdetect import FastLangdetectError, detect  # type: ignore[import-u
 from sonarr_metadata_rewrite.file_utils import (
     extract_metadata_info,
     find_target_files,
-    is_nfo_file,
+    is_nfo_name,
 )
 from sonarr_metadata_rewrite.image_utils import read_embedded_marker
 from sonarr_metadata_rewrite.models import ImageCandidate
@@ -131,9 +131,9 @@ def wait_for_nfo_files(
 
     @retry(timeout=timeout, interval=0.5, log_interval=1.0)
     def check_nfo_files() -> list[Path]:
-        nfo_files = [
-            p for p in find_target_files(series_path, recursive=True) if is_nfo_file(p)
-        ]
+        nfo_files = find_target_files(
+            series_path, recursive=True, name_predicate=is_nfo_name
+        )
         assert len(nfo_files) == expected_count, (
             f"Expected exactly {expected_count} .nfo files, but found "
             f"{len(nfo_files)} in {series_path}. Files found: {nfo_files}"
@@ -1,6 +1,6 @@
 """Tests for backup utility functions."""
 
-import tempfile
+import shutil
 from pathlib import Path
 
 import pytest
@@ -10,6 +10,7 @@ from sonarr_metadata_rewrite.backup_utils import (
     get_backup_path,
     restore_from_backup,
 )
+from tests.conftest import assert_file_content
 
 
 def create_legacy_backup(backup_dir: Path, filename: str, content: str) -> Path:
@@ -28,49 +29,61 @@ def create_root_file(root_dir: Path, filename: str, content: str) -> Path:
     return file_path
 
 
-def test_backup_with_none_backup_dir() -> None:
+def test_backup_with_none_backup_dir(tmp_path: Path) -> None:
     """Test backup functions with None backup_dir."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file_path = Path(temp_dir) / "test.nfo"
-        file_path.write_text("<tvshow></tvshow>")
+    file_path = tmp_path / "test.nfo"
+    file_path.write_text("<tvshow></tvshow>")
 
-        assert create_backup(file_path, None) is False
-        assert get_backup_path(file_path, None) is None
+    assert create_backup(file_path, None) is False
+    assert get_backup_path(file_path, None) is None
 
 
-def test_backup_nonexistent_file() -> None:
+def test_backup_nonexistent_file(tmp_path: Path) -> None:
     """Test that create_backup returns False for nonexistent file."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
-        file_path = temp_path / "nonexistent.nfo"
+    backup_dir = tmp_path / "backup"
+    file_path = tmp_path / "nonexistent.nfo"
 
-        assert create_backup(file_path, backup_dir) is False
+    assert create_backup(file_path, backup_dir) is False
 
 
-def test_backup_and_retrieval_workflow() -> None:
+def test_backup_and_retrieval_workflow(tmp_path: Path) -> None:
     """Test complete workflow: create backup and retrieve it."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
-        file_path = temp_path / "test.nfo"
-        content = "<tvshow></tvshow>"
-        file_path.write_text(content)
+    backup_dir = tmp_path / "backup"
+    file_path = tmp_path / "test.nfo"
+    content = "<tvshow></tvshow>"
+    file_path.write_text(content)
+
+    # Before backup, get_backup_path returns None
+    assert get_backup_path(file_path, backup_dir) is None
+
+    # Create backup
+    assert create_backup(file_path, backup_dir) is True
+
+    # After backup, get_backup_path returns the backup path
+    backup_path = get_backup_path(file_path, backup_dir)
+    assert backup_path is not None
+    assert_file_content(backup_path, content)
 
-        # Before backup, get_backup_path returns None
-        assert get_backup_path(file_path, backup_dir) is None
 
-        # Create backup
-        assert create_backup(file_path, backup_dir) is True
+def test_backup_recreates_removed_backup_directory(tmp_path: Path) -> None:
+    """Test backups still succeed after their directory is deleted externally."""
+    backup_dir = tmp_path / "backup"
+    first_file = tmp_path / "show" / "S01E01.nfo"
+    second_file = tmp_path / "show" / "S01E02.nfo"
+    first_file.parent.mkdir()
+    first_file.write_text("<episodedetails>1</episodedetails>")
+    second_file.write_text("<episodedetails>2</episodedetails>")
 
-        # After backup, get_backup_path returns the backup path
-        backup_path = get_backup_path(file_path, backup_dir)
-        assert backup_path is not None
-        assert backup_path.exists()
-        assert backup_path.read_text() == content
+    assert create_backup(first_file, backup_dir) is True
+    shutil.rmtree(backup_dir)
 
+    assert create_backup(second_file, backup_dir) is True
+    backup_path = get_backup_path(second_file, backup_dir)
+    assert backup_path is not None
+    assert_file_content(backup_path, "<episodedetails>2</episodedetails>")
 
-def test_backup_uses_full_absolute_path_structure() -> None:
+
+def test_backup_uses_full_absolute_path_structure(tmp_path: Path) -> None:
     """Test backup mirrors the full absolute file path under backup_dir.
 
     e.g. /media/sonarr/Show/tvshow.nfo is backed up as:
@@ -78,220 +91,196 @@ def test_backup_uses_full_absolute_path_structure() -> None:
     This prevents collisions when files from different root dirs share the
     same relative path.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
-        subdir = temp_path / "shows" / "series1"
-        subdir.mkdir(parents=True)
-        file_path = subdir / "tvshow.nfo"
-        content = "<tvshow></tvshow>"
-        file_path.write_text(content)
+    backup_dir = tmp_path / "backup"
+    subdir = tmp_path / "shows" / "series1"
+    subdir.mkdir(parents=True)
+    file_path = subdir / "tvshow.nfo"
+    content = "<tvshow></tvshow>"
+    file_path.write_text(content)
 
-        assert create_backup(file_path, backup_dir) is True
+    assert create_backup(file_path, backup_dir) is True
 
-        # Verify the backup mirrors the full absolute path structure
-        expected_backup = backup_dir / file_path.relative_to("/")
-        assert expected_backup.exists()
-        assert expected_backup.read_text() == content
+    # Verify the backup mirrors the full absolute path structure
+    expected_backup = backup_dir / file_path.relative_to("/")
+    assert_file_content(expected_backup, content)
 
-        assert get_backup_path(file_path, backup_dir) == expected_backup
+    assert get_backup_path(file_path, backup_dir) == expected_backup
 
 
-def test_backup_no_collision_across_root_dirs() -> None:
+def test_backup_no_collision_across_root_dirs(tmp_path: Path) -> None:
     """Files from different root dirs with identical relative paths don't collide."""
-    with tempfile.TemporaryDirectory() as base_dir:
-        base = Path(base_dir)
-        backup_dir = base / "backup"
-
-        # Two root dirs each containing "Show A/tvshow.nfo"
-        dir1 = base / "sonarr" / "Show A"
-        dir2 = base / "anime" / "Show A"
-        dir1.mkdir(parents=True)
-        dir2.mkdir(parents=True)
-
-        file1 = dir1 / "tvshow.nfo"
-        file2 = dir2 / "tvshow.nfo"
-        file1.write_text("content from sonarr")
-        file2.write_text("content from anime")
-
-        assert create_backup(file1, backup_dir) is True
-        assert create_backup(file2, backup_dir) is True
-
-        # Both backups exist at different locations
-        backup1 = get_backup_path(file1, backup_dir)
-        backup2 = get_backup_path(file2, backup_dir)
-        assert backup1 is not None
-        assert backup2 is not None
-        assert backup1 != backup2
-        assert backup1.read_text() == "content from sonarr"
-        assert backup2.read_text() == "content from anime"
-
-
-def test_backup_does_not_overwrite_existing() -> None:
+    backup_dir = tmp_path / "backup"
+
+    # Two root dirs each containing "Show A/tvshow.nfo"
+    dir1 = tmp_path / "sonarr" / "Show A"
+    dir2 = tmp_path / "anime" / "Show A"
+    dir1.mkdir(parents=True)
+    dir2.mkdir(parents=True)
+
+    file1 = dir1 / "tvshow.nfo"
+    file2 = dir2 / "tvshow.nfo"
+    file1.write_text("content from sonarr")
+    file2.write_text("content from anime")
+
+    assert create_backup(file1, backup_dir) is True
+    assert create_backup(file2, backup_dir) is True
+
+    # Both backups exist at different locations
+    backup1 = get_backup_path(file1, backup_dir)
+    backup2 = get_backup_path(file2, backup_dir)
+    assert backup1 is not None
+    assert backup2 is not None
+    assert backup1 != backup2
+    assert_file_content(backup1, "content from sonarr")
+    assert_file_content(backup2, "content from anime")
+
+
+def test_backup_does_not_overwrite_existing(tmp_path: Path) -> None:
     """Test that backup doesn't overwrite existing backup."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
-        file_path = temp_path / "test.nfo"
-        file_path.write_text("<tvshow>new</tvshow>")
+    backup_dir = tmp_path / "backup"
+    file_path = tmp_path / "test.nfo"
+    file_path.write_text("<tvshow>new</tvshow>")
 
-        # Create existing backup with different content
-        expected_backup = backup_dir / file_path.relative_to("/")
-        expected_backup.parent.mkdir(parents=True, exist_ok=True)
-        original_content = "<tvshow>original</tvshow>"
-        expected_backup.write_text(original_content)
+    # Create existing backup with different content
+    expected_backup = backup_dir / file_path.relative_to("/")
+    expected_backup.parent.mkdir(parents=True, exist_ok=True)
+    original_content = "<tvshow>original</tvshow>"
+    expected_backup.write_text(original_content)
 
-        # Try to backup new content - should not overwrite
-        assert create_backup(file_path, backup_dir) is True
-        assert expected_backup.read_text() == original_content
+    # Try to backup new content - should not overwrite
+    assert create_backup(file_path, backup_dir) is True
+    assert_file_content(expected_backup, original_content)
 
-        retrieved = get_backup_path(file_path, backup_dir)
-        assert retrieved == expected_backup
-        assert retrieved is not None
-        assert retrieved.read_text() == original_content
+    retrieved = get_backup_path(file_path, backup_dir)
+    assert retrieved == expected_backup
+    assert retrieved is not None
+    assert_file_content(retrieved, original_content)
 
 
-def test_backup_stem_matching_for_different_extensions() -> None:
+def test_backup_stem_matching_for_different_extensions(tmp_path: Path) -> None:
     """Test both functions handle same stem with different extensions."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
-
-        # Create original poster.png in backup using the full-path structure
-        file_path_jpg = temp_path / "poster.jpg"
-        file_path_jpg.write_bytes(b"JPG new")
-        expected_dir = (backup_dir / file_path_jpg.relative_to("/")).parent
-        expected_dir.mkdir(parents=True, exist_ok=True)
-        backup_path_png = expected_dir / "poster.png"
-        backup_path_png.write_bytes(b"PNG original")
-
-        # create_backup should recognize existing stem and not create new backup
-        assert create_backup(file_path_jpg, backup_dir) is True
-        assert backup_path_png.exists()
-        assert backup_path_png.read_bytes() == b"PNG original"
-        assert not (expected_dir / "poster.jpg").exists()
-
-        # get_backup_path should find the .png backup when looking for .jpg
-        retrieved = get_backup_path(file_path_jpg, backup_dir)
-        assert retrieved == backup_path_png
-        assert retrieved is not None
-        assert retrieved.read_bytes() == b"PNG original"
-
-
-def test_restore_same_extension() -> None:
+    backup_dir = tmp_path / "backup"
+
+    # Create original poster.png in backup using the full-path structure
+    file_path_jpg = tmp_path / "poster.jpg"
+    file_path_jpg.write_bytes(b"JPG new")
+    expected_dir = (backup_dir / file_path_jpg.relative_to("/")).parent
+    expected_dir.mkdir(parents=True, exist_ok=True)
+    backup_path_png = expected_dir / "poster.png"
+    backup_path_png.write_bytes(b"PNG original")
+
+    # create_backup should recognize existing stem and not create new backup
+    assert create_backup(file_path_jpg, backup_dir) is True
+    assert_file_content(backup_path_png, b"PNG original")
+    assert not (expected_dir / "poster.jpg").exists()
+
+    # get_backup_path should find the .png backup when looking for .jpg
+    retrieved = get_backup_path(file_path_jpg, backup_dir)
+    assert retrieved == backup_path_png
+    assert retrieved is not None
+    assert_file_content(retrieved, b"PNG original")
+
+
+def test_restore_same_extension(tmp_path: Path) -> None:
     """Test restoring file with same extension."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
+    backup_dir = tmp_path / "backup"
 
-        file_path = temp_path / "test.nfo"
-        file_path.write_text("modified content")
+    file_path = tmp_path / "test.nfo"
+    file_path.write_text("modified content")
 
-        # Create backup using the full absolute path structure
-        backup_path = backup_dir / file_path.relative_to("/")
-        backup_path.parent.mkdir(parents=True, exist_ok=True)
-        backup_path.write_text("backup content")
+    # Create backup using the full absolute path structure
+    backup_path = backup_dir / file_path.relative_to("/")
+    backup_path.parent.mkdir(parents=True, exist_ok=True)
+    backup_path.write_text("backup content")
 
-        result = restore_from_backup(file_path, backup_dir)
-        assert result is True
-        assert file_path.read_text() == "backup content"
+    result = restore_from_backup(file_path, backup_dir)
+    assert result is True
+    assert_file_content(file_path, "backup content")
 
 
-def test_restore_different_extension() -> None:
+def test_restore_different_extension(tmp_path: Path) -> None:
     """Test restoring when backup has different extension (stem matching)."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
+    backup_dir = tmp_path / "backup"
 
-        file_path_jpg = temp_path / "poster.jpg"
-        file_path_jpg.write_bytes(b"JPG modified")
+    file_path_jpg = tmp_path / "poster.jpg"
+    file_path_jpg.write_bytes(b"JPG modified")
 
-        # Backup stored as .png (same stem, different extension)
-        backup_dir_for_file = (backup_dir / file_path_jpg.relative_to("/")).parent
-        backup_dir_for_file.mkdir(parents=True, exist_ok=True)
-        (backup_dir_for_file / "poster.png").write_bytes(b"PNG backup")
+    # Backup stored as .png (same stem, different extension)
+    backup_dir_for_file = (backup_dir / file_path_jpg.relative_to("/")).parent
+    backup_dir_for_file.mkdir(parents=True, exist_ok=True)
+    (backup_dir_for_file / "poster.png").write_bytes(b"PNG backup")
 
-        result = restore_from_backup(file_path_jpg, backup_dir)
-        assert result is True
-        assert file_path_jpg.exists()
-        assert file_path_jpg.read_bytes() == b"PNG backup"
+    result = restore_from_backup(file_path_jpg, backup_dir)
+    assert result is True
+    assert_file_content(file_path_jpg, b"PNG backup")
 
-        # Only one poster file should remain
-        poster_files = list(temp_path.glob("poster.*"))
-        assert len(poster_files) == 1
-        assert poster_files[0] == file_path_jpg
+    # Only one poster file should remain
+    poster_files = list(tmp_path.glob("poster.*"))
+    assert len(poster_files) == 1
+    assert poster_files[0] == file_path_jpg
 
 
-def test_restore_deletes_files_with_same_stem() -> None:
+def test_restore_deletes_files_with_same_stem(tmp_path: Path) -> None:
     """Test restore deletes all files with same stem but diff extensions."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
-
-        # Backup stored as .png
-        file_path_png = temp_path / "poster.png"
-        backup_entry_dir = (backup_dir / file_path_png.relative_to("/")).parent
-        backup_entry_dir.mkdir(parents=True, exist_ok=True)
-        (backup_entry_dir / "poster.png").write_bytes(b"PNG backup")
-
-        # Multiple files with same stem exist
-        jpg_file = temp_path / "poster.jpg"
-        jpeg_file = temp_path / "poster.jpeg"
-        webp_file = temp_path / "poster.webp"
-        jpg_file.write_bytes(b"JPG")
-        jpeg_file.write_bytes(b"JPEG")
-        webp_file.write_bytes(b"WEBP")
-
-        result = restore_from_backup(file_path_png, backup_dir)
-        assert result is True
-        assert file_path_png.exists()
-        assert file_path_png.read_bytes() == b"PNG backup"
-        assert not jpg_file.exists()
-        assert not jpeg_file.exists()
-        assert not webp_file.exists()
-
-
-def test_restore_with_no_backup() -> None:
+    backup_dir = tmp_path / "backup"
+
+    # Backup stored as .png
+    file_path_png = tmp_path / "poster.png"
+    backup_entry_dir = (backup_dir / file_path_png.relative_to("/")).parent
+    backup_entry_dir.mkdir(parents=True, exist_ok=True)
+    (backup_entry_dir / "poster.png").write_bytes(b"PNG backup")
+
+    # Multiple files with same stem exist
+    jpg_file = tmp_path / "poster.jpg"
+    jpeg_file = tmp_path / "poster.jpeg"
+    webp_file = tmp_path / "poster.webp"
+    jpg_file.write_bytes(b"JPG")
+    jpeg_file.write_bytes(b"JPEG")
+    webp_file.write_bytes(b"WEBP")
+
+    result = restore_from_backup(file_path_png, backup_dir)
+    assert result is True
+    assert_file_content(file_path_png, b"PNG backup")
+    assert not jpg_file.exists()
+    assert not jpeg_file.exists()
+    assert not webp_file.exists()
+
+
+def test_restore_with_no_backup(tmp_path: Path) -> None:
     """Test restore when no backup exists."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
-        backup_dir.mkdir()
+    backup_dir = tmp_path / "backup"
+    backup_dir.mkdir()
 
-        file_path = temp_path / "test.nfo"
-        file_path.write_text("no backup")
+    file_path = tmp_path / "test.nfo"
+    file_path.write_text("no backup")
 
-        assert restore_from_backup(file_path, backup_dir) is False
-        assert file_path.read_text() == "no backup"
+    assert restore_from_backup(file_path, backup_dir) is False
+    assert_file_content(file_path, "no backup")
 
 
-def test_restore_with_none_backup_dir() -> None:
+def test_restore_with_none_backup_dir(tmp_path: Path) -> None:
     """Test restore with None backup_dir."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file_path = Path(temp_dir) / "test.nfo"
-        file_path.write_text("content")
+    file_path = tmp_path / "test.nfo"
+    file_path.write_text("content")
 
-        assert restore_from_backup(file_path, None) is False
-        assert file_path.read_text() == "content"
+    assert restore_from_backup(file_path, None) is False
+    assert_file_content(file_path, "content")
 
 
-def test_restore_creates_target_in_backup_extension() -> None:
+def test_restore_creates_target_in_backup_extension(tmp_path: Path) -> None:
     """Test that restore creates file with backup extension, not requested."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
+    backup_dir = tmp_path / "backup"
 
-        # Backup exists as .png
-        file_path_jpg = temp_path / "poster.jpg"
-        backup_entry_dir = (backup_dir / file_path_jpg.relative_to("/")).parent
-        backup_entry_dir.mkdir(parents=True, exist_ok=True)
-        (backup_entry_dir / "poster.png").write_bytes(b"PNG backup")
+    # Backup exists as .png
+    file_path_jpg = tmp_path / "poster.jpg"
+    backup_entry_dir = (backup_dir / file_path_jpg.relative_to("/")).parent
+    backup_entry_dir.mkdir(parents=True, exist_ok=True)
+    (backup_entry_dir / "poster.png").write_bytes(b"PNG backup")
 
-        # Restore requesting the .jpg path (which does not exist yet)
-        result = restore_from_backup(file_path_jpg, backup_dir)
-        assert result is True
-        assert file_path_jpg.exists()
-        assert file_path_jpg.read_bytes() == b"PNG backup"
+    # Restore requesting the .jpg path (which does not exist yet)
+    result = restore_from_backup(file_path_jpg, backup_dir)
+    assert result is True
+    assert_file_content(file_path_jpg, b"PNG backup")
 
 
 # ---------------------------------------------------------------------------
@@ -299,210 +288,180 @@ def test_restore_creates_target_in_backup_extension() -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_get_backup_path_finds_legacy_format() -> None:
+def test_get_backup_path_finds_legacy_format(tmp_path: Path) -> None:
     """get_backup_path falls back to legacy path when root_dirs supplied."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        root_dir = temp_path / "tv"
-        backup_dir = temp_path / "backup"
+    root_dir = tmp_path / "tv"
+    backup_dir = tmp_path / "backup"
 
-        # Original file
-        file_path = create_root_file(root_dir, "Show A/tvshow.nfo", "original")
+    # Original file
+    file_path = create_root_file(root_dir, "Show A/tvshow.nfo", "original")
 
-        # Legacy backup: relative to root_dir
-        legacy_backup = create_legacy_backup(
-            backup_dir, "Show A/tvshow.nfo", "original"
-        )
+    # Legacy backup: relative to root_dir
+    legacy_backup = create_legacy_backup(backup_dir, "Show A/tvshow.nfo", "original")
 
-        # New-format path does NOT exist, but legacy does
-        new_backup = backup_dir / file_path.relative_to("/")
-        assert not new_backup.exists()
+    # New-format path does NOT exist, but legacy does
+    new_backup = backup_dir / file_path.relative_to("/")
+    assert not new_backup.exists()
 
-        result = get_backup_path(file_path, backup_dir, [root_dir])
-        assert result == legacy_backup
+    result = get_backup_path(file_path, backup_dir, [root_dir])
+    assert result == legacy_backup
 
 
-def test_create_backup_skips_when_legacy_backup_exists() -> None:
+def test_create_backup_skips_when_legacy_backup_exists(tmp_path: Path) -> None:
     """create_backup does not overwrite a legacy-format backup."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        root_dir = temp_path / "tv"
-        backup_dir = temp_path / "backup"
+    root_dir = tmp_path / "tv"
+    backup_dir = tmp_path / "backup"
 
-        file_path = create_root_file(
-            root_dir, "Show A/tvshow.nfo", "translated content"
-        )
+    file_path = create_root_file(root_dir, "Show A/tvshow.nfo", "translated content")
 
-        # Create legacy backup
-        legacy_backup = create_legacy_backup(
-            backup_dir, "Show A/tvshow.nfo", "original content"
-        )
+    # Create legacy backup
+    legacy_backup = create_legacy_backup(
+        backup_dir, "Show A/tvshow.nfo", "original content"
+    )
 
-        result = create_backup(file_path, backup_dir, [root_dir])
-        assert result is True
+    result = create_backup(file_path, backup_dir, [root_dir])
+    assert result is True
 
-        # Legacy backup untouched
-        assert legacy_backup.read_text() == "original content"
-        # New-format backup NOT created (legacy already covers it)
-        new_backup = backup_dir / file_path.relative_to("/")
-        assert not new_backup.exists()
+    # Legacy backup untouched
+    assert_file_content(legacy_backup, "original content")
+    # New-format backup NOT created (legacy already covers it)
+    new_backup = backup_dir / file_path.relative_to("/")
+    assert not new_backup.exists()
 
 
-def test_restore_from_backup_uses_legacy_format() -> None:
+def test_restore_from_backup_uses_legacy_format(tmp_path: Path) -> None:
     """restore_from_backup restores content from a legacy-format backup."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        root_dir = temp_path / "tv"
-        backup_dir = temp_path / "backup"
+    root_dir = tmp_path / "tv"
+    backup_dir = tmp_path / "backup"
 
-        file_path = create_root_file(
-            root_dir, "Show A/tvshow.nfo", "translated content"
-        )
+    file_path = create_root_file(root_dir, "Show A/tvshow.nfo", "translated content")
 
-        # Legacy backup only
-        create_legacy_backup(backup_dir, "Show A/tvshow.nfo", "original content")
+    # Legacy backup only
+    create_legacy_backup(backup_dir, "Show A/tvshow.nfo", "original content")
 
-        result = restore_from_backup(file_path, backup_dir, [root_dir])
-        assert result is True
-        assert file_path.read_text() == "original content"
+    result = restore_from_backup(file_path, backup_dir, [root_dir])
+    assert result is True
+    assert_file_content(file_path, "original content")
 
 
-def test_legacy_fallback_stem_matching() -> None:
+def test_legacy_fallback_stem_matching(tmp_path: Path) -> None:
     """Legacy fallback also applies stem-matching for image extension changes."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        root_dir = temp_path / "tv"
-        backup_dir = temp_path / "backup"
+    root_dir = tmp_path / "tv"
+    backup_dir = tmp_path / "backup"
 
-        file_path_jpg = create_root_file(
-            root_dir, "Show A/poster.jpg", "JPEG translated"
-        )
+    file_path_jpg = create_root_file(root_dir, "Show A/poster.jpg", "JPEG translated")
 
-        # Legacy backup is .png (stem matches)
-        legacy_backup_png = backup_dir / "Show A" / "poster.png"
-        legacy_backup_png.parent.mkdir(parents=True)
-        legacy_backup_png.write_bytes(b"PNG original")
+    # Legacy backup is .png (stem matches)
+    legacy_backup_png = backup_dir / "Show A" / "poster.png"
+    legacy_backup_png.parent.mkdir(parents=True)
+    legacy_backup_png.write_bytes(b"PNG original")
 
-        result = get_backup_path(file_path_jpg, backup_dir, [root_dir])
-        assert result == legacy_backup_png
+    result = get_backup_path(file_path_jpg, backup_dir, [root_dir])
+    assert result == legacy_backup_png
 
 
-def test_legacy_fallback_not_used_without_root_dirs() -> None:
+def test_legacy_fallback_not_used_without_root_dirs(tmp_path: Path) -> None:
     """Legacy format is NOT consulted when root_dirs is not provided."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        root_dir = temp_path / "tv"
-        backup_dir = temp_path / "backup"
+    root_dir = tmp_path / "tv"
+    backup_dir = tmp_path / "backup"
 
-        file_path = create_root_file(root_dir, "Show A/tvshow.nfo", "content")
+    file_path = create_root_file(root_dir, "Show A/tvshow.nfo", "content")
 
-        # Only a legacy backup exists
-        create_legacy_backup(backup_dir, "Show A/tvshow.nfo", "legacy backup")
+    # Only a legacy backup exists
+    create_legacy_backup(backup_dir, "Show A/tvshow.nfo", "legacy backup")
 
-        # No root_dirs → only new-format path is checked → not found
-        assert get_backup_path(file_path, backup_dir) is None
-        assert get_backup_path(file_path, backup_dir, []) is None
+    # No root_dirs → only new-format path is checked → not found
+    assert get_backup_path(file_path, backup_dir) is None
+    assert get_backup_path(file_path, backup_dir, []) is None
 
 
-def test_get_backup_path_legacy_ignores_root_not_containing_file() -> None:
+def test_get_backup_path_legacy_ignores_root_not_containing_file(
+    tmp_path: Path,
+) -> None:
     """Legacy fallback skips root dirs that don't contain the file (lines 50-51, 96)."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        root_dir_a = temp_path / "tv"
-        root_dir_b = temp_path / "anime"
-        backup_dir = temp_path / "backup"
+    root_dir_a = tmp_path / "tv"
+    root_dir_b = tmp_path / "anime"
+    backup_dir = tmp_path / "backup"
 
-        # File lives under root_dir_b, NOT root_dir_a
-        file_path = create_root_file(root_dir_b, "Show B/tvshow.nfo", "original")
+    # File lives under root_dir_b, NOT root_dir_a
+    file_path = create_root_file(root_dir_b, "Show B/tvshow.nfo", "original")
 
-        # Legacy backup only under root_dir_b
-        legacy_backup = create_legacy_backup(
-            backup_dir, "Show B/tvshow.nfo", "original"
-        )
+    # Legacy backup only under root_dir_b
+    legacy_backup = create_legacy_backup(backup_dir, "Show B/tvshow.nfo", "original")
 
-        # root_dir_a does not contain the file → _legacy_backup_path returns None
-        # and the loop continues to root_dir_b which does match
-        result = get_backup_path(file_path, backup_dir, [root_dir_a, root_dir_b])
-        assert result == legacy_backup
+    # root_dir_a does not contain the file → _legacy_backup_path returns None
+    # and the loop continues to root_dir_b which does match
+    result = get_backup_path(file_path, backup_dir, [root_dir_a, root_dir_b])
+    assert result == legacy_backup
 
 
-def test_create_backup_legacy_skips_root_not_containing_file() -> None:
+def test_create_backup_legacy_skips_root_not_containing_file(tmp_path: Path) -> None:
     """create_backup legacy loop skips root dirs that don't contain the file.
 
     Exercises the `continue` at line 152 when _legacy_backup_path returns None.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        root_dir_a = temp_path / "tv"
-        root_dir_b = temp_path / "anime"
-        backup_dir = temp_path / "backup"
-
-        # File lives under root_dir_b, NOT root_dir_a
-        file_path = create_root_file(root_dir_b, "Show B/tvshow.nfo", "content")
-
-        # Legacy backup exists under root_dir_b
-        legacy_backup = create_legacy_backup(
-            backup_dir, "Show B/tvshow.nfo", "original"
-        )
-
-        # root_dir_a is passed first (no match) then root_dir_b (legacy found)
-        result = create_backup(file_path, backup_dir, [root_dir_a, root_dir_b])
-        assert result is True
-        # Legacy backup preserved; no new-format backup written
-        new_backup = backup_dir / file_path.relative_to("/")
-        assert not new_backup.exists()
-        assert legacy_backup.read_text() == "original"
-
-
-def test_create_backup_legacy_stem_match_skips_creation() -> None:
+    root_dir_a = tmp_path / "tv"
+    root_dir_b = tmp_path / "anime"
+    backup_dir = tmp_path / "backup"
+
+    # File lives under root_dir_b, NOT root_dir_a
+    file_path = create_root_file(root_dir_b, "Show B/tvshow.nfo", "content")
+
+    # Legacy backup exists under root_dir_b
+    legacy_backup = create_legacy_backup(backup_dir, "Show B/tvshow.nfo", "original")
+
+    # root_dir_a is passed first (no match) then root_dir_b (legacy found)
+    result = create_backup(file_path, backup_dir, [root_dir_a, root_dir_b])
+    assert result is True
+    # Legacy backup preserved; no new-format backup written
+    new_backup = backup_dir / file_path.relative_to("/")
+    assert not new_backup.exists()
+    assert_file_content(legacy_backup, "original")
+
+
+def test_create_backup_legacy_stem_match_skips_creation(tmp_path: Path) -> None:
     """create_backup detects a legacy stem-matched backup and skips creating a new one.
 
     Exercises the stem-matching loop in the legacy fallback (lines 156-159).
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        root_dir = temp_path / "tv"
-        backup_dir = temp_path / "backup"
-
-        show_dir = root_dir / "Show A"
-        show_dir.mkdir(parents=True)
-        # Current file is .jpg
-        file_path_jpg = show_dir / "poster.jpg"
-        file_path_jpg.write_bytes(b"JPEG translated")
-
-        # Legacy backup exists as .png (same stem, different extension)
-        legacy_png = create_legacy_backup(
-            backup_dir, "Show A/poster.png", "PNG original"
-        )
-
-        result = create_backup(file_path_jpg, backup_dir, [root_dir])
-        assert result is True
-        # Legacy .png backup preserved
-        assert legacy_png.read_bytes() == b"PNG original"
-        # No new-format backup created
-        new_backup = backup_dir / file_path_jpg.relative_to("/")
-        assert not new_backup.exists()
-
-
-def test_restore_from_backup_file_parent_does_not_exist() -> None:
+    root_dir = tmp_path / "tv"
+    backup_dir = tmp_path / "backup"
+
+    show_dir = root_dir / "Show A"
+    show_dir.mkdir(parents=True)
+    # Current file is .jpg
+    file_path_jpg = show_dir / "poster.jpg"
+    file_path_jpg.write_bytes(b"JPEG translated")
+
+    # Legacy backup exists as .png (same stem, different extension)
+    legacy_png = create_legacy_backup(backup_dir, "Show A/poster.png", "PNG original")
+
+    result = create_backup(file_path_jpg, backup_dir, [root_dir])
+    assert result is True
+    # Legacy .png backup preserved
+    assert_file_content(legacy_png, b"PNG original")
+    # No new-format backup created
+    new_backup = backup_dir / file_path_jpg.relative_to("/")
+    assert not new_backup.exists()
+
+
+def test_restore_from_backup_file_parent_does_not_exist(tmp_path: Path) -> None:
     """restore_from_backup skips stem-cleanup when parent dir is absent (line 196->203).
 
     When the original parent directory no longer exists, the stem-cleanup loop
     is skipped entirely and shutil.copy2 propagates a FileNotFoundError.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        backup_dir = temp_path / "backup"
-
-        # Backup exists at the new-format path
-        file_path = temp_path / "show" / "tvshow.nfo"
-        backup_path = backup_dir / file_path.relative_to("/")
-        backup_path.parent.mkdir(parents=True)
-        backup_path.write_text("original content")
-
-        # Parent of file_path does NOT exist (show dir was never created)
-        assert not file_path.parent.exists()
-
-        # shutil.copy2 will raise because the destination parent is missing
-        with pytest.raises(FileNotFoundError):
-            restore_from_backup(file_path, backup_dir)
+    backup_dir = tmp_path / "backup"
+
+    # Backup exists at the new-format path
+    file_path = tmp_path / "show" / "tvshow.nfo"
+    backup_path = backup_dir / file_path.relative_to("/")
+    backup_path.parent.mkdir(parents=True)
+    backup_path.write_text("original content")
+
+    # Parent of file_path does NOT exist (show dir was never created)
+    assert not file_path.parent.exists()
+
+    # shutil.copy2 will raise because the destination parent is missing
+    with pytest.raises(FileNotFoundError):
+        restore_from_backup(file_path, backup_dir)
@@ -14,6 +14,7 @@ from watchdog.events import (
 
 from sonarr_metadata_rewrite.config import Settings
 from sonarr_metadata_rewrite.file_monitor import FileMonitor, MediaFileHandler
+from tests.conftest import assert_logged
 
 
 @pytest.fixture
@@ -206,5 +207,4 @@ def test_media_file_handler_handles_callback_exceptions(
 
     handler.on_any_event(event)
 
-    assert "Error in file monitor callback" in caplog.text
-    assert "/test/path/tvshow.nfo" in caplog.text
+    assert_logged(caplog, "Error in file monitor callback", "/test/path/tvshow.nfo")
@@ -260,7 +260,7 @@ def test_scanner_handles_permission_error(
 
     try:
         with patch(
-            "sonarr_metadata_rewrite.file_scanner.find_target_files",
+            "sonarr_metadata_rewrite.file_scanner.iter_target_files",
             side_effect=PermissionError("Access denied"),
         ):
             file_scanner.start(callback_tracker)
@@ -1,7 +1,7 @@
 """Tests for NFO utility functions."""
 
-import tempfile
 import xml.etree.ElementTree as ET
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
@@ -11,33 +11,32 @@ from sonarr_metadata_rewrite.file_utils import (
     find_root_dir_for_file,
     find_target_files,
     is_nfo_file,
+    is_nfo_name,
     is_rewritable_image,
+    is_rewritable_image_name,
+    iter_target_files,
+    read_nfo_root_tag,
 )
+from tests.conftest import create_empty_file
 
 
 class TestIsNfoFile:
     """Test is_nfo_file function."""
 
-    def test_lowercase_nfo_file(self) -> None:
-        """Test that lowercase .nfo files are detected."""
-        path = Path("test.nfo")
-        assert is_nfo_file(path) is True
-
-    def test_uppercase_nfo_file(self) -> None:
-        """Test that uppercase .NFO files are detected."""
-        path = Path("test.NFO")
-        assert is_nfo_file(path) is True
-
-    def test_mixed_case_nfo_file(self) -> None:
-        """Test that mixed case .Nfo files are detected."""
-        path = Path("test.Nfo")
-        assert is_nfo_file(path) is True
+    @pytest.mark.parametrize("name", ["test.nfo", "test.NFO", "test.Nfo"])
+    def test_nfo_extension_any_case(self, name: str) -> None:
+        """Test that .nfo files are detected regardless of extension case."""
+        assert is_nfo_file(Path(name)) is True
 
     def test_non_nfo_file(self) -> None:
         """Test that non-NFO files are not detected."""
         path = Path("test.txt")
         assert is_nfo_file(path) is False
 
+    def test_bare_nfo_dotfile(self) -> None:
+        """Test that a dotfile named .nfo has no extension and is not detected."""
+        assert is_nfo_file(Path(".nfo")) is False
+
     def test_nfo_in_filename_but_different_extension(self) -> None:
         """Test files with 'nfo' in name but different extension."""
         path = Path("nfo_file.txt")
@@ -47,61 +46,90 @@ class TestIsNfoFile:
 class TestFindNfoFiles:
     """Test finding NFO files via find_target_files + filter."""
 
-    def test_find_both_case_variations(self) -> None:
+    def test_find_both_case_variations(self, test_data_dir: Path) -> None:
         """Test that both .nfo and .NFO files are found."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files
-            nfo_lowercase = temp_path / "test.nfo"
-            nfo_uppercase = temp_path / "test.NFO"
-            txt_file = temp_path / "test.txt"
-
-            nfo_lowercase.touch()
-            nfo_uppercase.touch()
-            txt_file.touch()
-
-            found_files = [
-                p
-                for p in find_target_files(temp_path, recursive=False)
-                if is_nfo_file(p)
-            ]
-
-            # Should find both NFO files but not the txt file
-            assert len(found_files) == 2
-            assert nfo_lowercase in found_files
-            assert nfo_uppercase in found_files
-            assert txt_file not in found_files
-
-    def test_recursive_search(self) -> None:
+        # Create test files
+        nfo_lowercase = test_data_dir / "test.nfo"
+        nfo_uppercase = test_data_dir / "test.NFO"
+        txt_file = test_data_dir / "test.txt"
+
+        create_empty_file(nfo_lowercase)
+        create_empty_file(nfo_uppercase)
+        create_empty_file(txt_file)
+
+        found_files = [
+            p
+            for p in find_target_files(test_data_dir, recursive=False)
+            if is_nfo_file(p)
+        ]
+
+        # Should find both NFO files but not the txt file
+        assert len(found_files) == 2
+        assert nfo_lowercase in found_files
+        assert nfo_uppercase in found_files
+        assert txt_file not in found_files
+
+    def test_recursive_search(self, test_data_dir: Path) -> None:
         """Test recursive search in subdirectories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create files in root and subdirectory
-            root_nfo = temp_path / "root.nfo"
-            subdir = temp_path / "subdir"
-            subdir.mkdir()
-            sub_nfo = subdir / "sub.NFO"
-
-            root_nfo.touch()
-            sub_nfo.touch()
-
-            # Test recursive (default)
-            found_files = [p for p in find_target_files(temp_path) if is_nfo_file(p)]
-            assert len(found_files) == 2
-            assert root_nfo in found_files
-            assert sub_nfo in found_files
-
-            # Test non-recursive
-            found_files_non_recursive = [
-                p
-                for p in find_target_files(temp_path, recursive=False)
-                if is_nfo_file(p)
-            ]
-            assert len(found_files_non_recursive) == 1
-            assert root_nfo in found_files_non_recursive
-            assert sub_nfo not in found_files_non_recursive
+        # Create files in root and subdirectory
+        root_nfo = test_data_dir / "root.nfo"
+        subdir = test_data_dir / "subdir"
+        subdir.mkdir()
+        sub_nfo = subdir / "sub.NFO"
+
+        create_empty_file(root_nfo)
+        create_empty_file(sub_nfo)
+
+        # Test recursive (default)
+        found_files = [p for p in find_target_files(test_data_dir) if is_nfo_file(p)]
+        assert len(found_files) == 2
+        assert root_nfo in found_files
+        assert sub_nfo in found_files
+
+        # Test non-recursive
+        found_files_non_recursive = [
+            p
+            for p in find_target_files(test_data_dir, recursive=False)
+            if is_nfo_file(p)
+        ]
+        assert len(found_files_non_recursive) == 1
+        assert root_nfo in found_files_non_recursive
+        assert sub_nfo not in found_files_non_recursive
+
+    def test_does_not_follow_directory_symlinks(self, test_data_dir: Path) -> None:
+        """Test that symlinked directories are not descended into."""
+        real_dir = test_data_dir / "real"
+        real_dir.mkdir()
+        real_nfo = real_dir / "tvshow.nfo"
+        create_empty_file(real_nfo)
+        (test_data_dir / "linked").symlink_to(real_dir, target_is_directory=True)
+
+        found_files = [p for p in find_target_files(test_data_dir) if is_nfo_file(p)]
+
+        assert found_files == [real_nfo]
+
+    def test_name_predicate_filters_during_walk(self, test_data_dir: Path) -> None:
+        """Test that only names accepted by the predicate are returned."""
+        nfo_file = test_data_dir / "Season 01" / "S01E01.NFO"
+        nfo_file.parent.mkdir()
+        create_empty_file(nfo_file)
+        create_empty_file(test_data_dir / "poster.jpg")
+
+        found_files = find_target_files(test_data_dir, name_predicate=is_nfo_name)
+
+        assert found_files == [nfo_file]
+
+    def test_iter_target_files_streams_walk(self, test_data_dir: Path) -> None:
+        """Test that the generator form yields the same files lazily."""
+        nfo_file = test_data_dir / "Season 01" / "S01E01.nfo"
+        nfo_file.parent.mkdir()
+        create_empty_file(nfo_file)
+        create_empty_file(test_data_dir / "tvshow.nfo")
+
+        files = iter_target_files(test_data_dir)
+
+        assert next(files) == test_data_dir / "tvshow.nfo"
+        assert list(files) == [nfo_file]
 
     def test_nonexistent_directory(self) -> None:
         """Test behavior with non-existent directory."""
@@ -109,200 +137,173 @@ class TestFindNfoFiles:
         found_files = [p for p in find_target_files(nonexistent_path) if is_nfo_file(p)]
         assert found_files == []
 
-    def test_empty_directory(self) -> None:
+    def test_empty_directory(self, test_data_dir: Path) -> None:
         """Test behavior with empty directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            found_files = [p for p in find_target_files(temp_path) if is_nfo_file(p)]
-            assert found_files == []
+        found_files = [p for p in find_target_files(test_data_dir) if is_nfo_file(p)]
+        assert found_files == []
 
-    def test_deduplicate_on_case_insensitive_filesystem(self) -> None:
+    def test_deduplicate_on_case_insensitive_filesystem(
+        self, test_data_dir: Path
+    ) -> None:
         """Test that files are deduplicated properly."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
+        # Create files with different cases
+        nfo_file = test_data_dir / "test.nfo"
+        create_empty_file(nfo_file)
 
-            # Create files with different cases
-            nfo_file = temp_path / "test.nfo"
-            nfo_file.touch()
+        found_files = [p for p in find_target_files(test_data_dir) if is_nfo_file(p)]
 
-            found_files = [p for p in find_target_files(temp_path) if is_nfo_file(p)]
-
-            # Should find the file only once, even if filesystem is case-insensitive
-            assert len(found_files) >= 1
-            # All found files should be actual files
-            for file_path in found_files:
-                assert file_path.is_file()
+        # Should find the file only once, even if filesystem is case-insensitive
+        assert len(found_files) >= 1
+        # All found files should be actual files
+        for file_path in found_files:
+            assert file_path.is_file()
 
 
 class TestIsRewritableImage:
     """Test is_rewritable_image function."""
 
-    def test_poster_jpg(self) -> None:
-        """Test that poster.jpg is detected as rewritable."""
-        assert is_rewritable_image(Path("poster.jpg")) is True
-
-    def test_poster_png(self) -> None:
-        """Test that poster.png is detected as rewritable."""
-        assert is_rewritable_image(Path("poster.png")) is True
-
-    def test_season_poster(self) -> None:
-        """Test that season posters are detected as rewritable."""
-        assert is_rewritable_image(Path("season01-poster.jpg")) is True
-        assert is_rewritable_image(Path("season02-poster.png")) is True
-        assert is_rewritable_image(Path("season10-poster.jpeg")) is True
-        # Specials season poster
-        assert is_rewritable_image(Path("season-specials-poster.jpg")) is True
-
-    def test_clearlogo_jpg(self) -> None:
-        """Test that clearlogo.jpg is detected as rewritable."""
-        assert is_rewritable_image(Path("clearlogo.jpg")) is True
-
-    def test_clearlogo_png(self) -> None:
-        """Test that clearlogo.png is detected as rewritable."""
-        assert is_rewritable_image(Path("clearlogo.png")) is True
-
-    def test_uppercase_names(self) -> None:
-        """Test that uppercase filenames are detected."""
-        assert is_rewritable_image(Path("POSTER.jpg")) is True
-        assert is_rewritable_image(Path("CLEARLOGO.png")) is True
-        assert is_rewritable_image(Path("SEASON01-POSTER.jpg")) is True
-        assert is_rewritable_image(Path("SEASON-SPECIALS-POSTER.PNG")) is True
-
-    def test_non_rewritable_images(self) -> None:
-        """Test that non-poster/clearlogo images are not detected."""
-        assert is_rewritable_image(Path("banner.jpg")) is False
-        assert is_rewritable_image(Path("fanart.jpg")) is False
-        assert is_rewritable_image(Path("backdrop.png")) is False
-        assert is_rewritable_image(Path("thumb.jpg")) is False
-
-    def test_non_image_files(self) -> None:
-        """Test that non-image files are not detected."""
-        assert is_rewritable_image(Path("poster.txt")) is False
-        assert is_rewritable_image(Path("clearlogo.nfo")) is False
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "poster.jpg",
+            "poster.png",
+            "season01-poster.jpg",
+            "season02-poster.png",
+            "season10-poster.jpeg",
+            "season-specials-poster.jpg",
+            "clearlogo.jpg",
+            "clearlogo.png",
+            "POSTER.jpg",
+            "CLEARLOGO.png",
+            "SEASON01-POSTER.jpg",
+            "SEASON-SPECIALS-POSTER.PNG",
+        ],
+    )
+    def test_rewritable_names(self, name: str) -> None:
+        """Test that poster, season poster and clearlogo images are detected."""
+        assert is_rewritable_image_name(name) is True
+        assert is_rewritable_image(Path(name)) is True
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "banner.jpg",
+            "fanart.jpg",
+            "backdrop.png",
+            "thumb.jpg",
+            "poster.txt",
+            "clearlogo.nfo",
+        ],
+    )
+    def test_non_rewritable_names(self, name: str) -> None:
+        """Test that other images and non-image files are not detected."""
+        assert is_rewritable_image_name(name) is False
+        assert is_rewritable_image(Path(name)) is False
 
 
 class TestFindRewritableImages:
     """Test finding rewritable images via find_target_files + filter."""
 
-    def test_find_poster_and_clearlogo(self) -> None:
+    def test_find_poster_and_clearlogo(self, test_data_dir: Path) -> None:
         """Test finding both poster and clearlogo files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files
-            poster = temp_path / "poster.jpg"
-            poster.touch()
-            clearlogo = temp_path / "clearlogo.png"
-            clearlogo.touch()
-            banner = temp_path / "banner.jpg"  # Should not be found
-            banner.touch()
-
-            found_files = [
-                p for p in find_target_files(temp_path) if is_rewritable_image(p)
-            ]
-            found_names = {f.name for f in found_files}
-
-            assert "poster.jpg" in found_names
-            assert "clearlogo.png" in found_names
-            assert "banner.jpg" not in found_names
-
-    def test_find_season_posters(self) -> None:
+        # Create test files
+        poster = test_data_dir / "poster.jpg"
+        create_empty_file(poster)
+        clearlogo = test_data_dir / "clearlogo.png"
+        create_empty_file(clearlogo)
+        banner = test_data_dir / "banner.jpg"  # Should not be found
+        create_empty_file(banner)
+
+        found_names = {
+            p.name
+            for p in iter_target_files(
+                test_data_dir, name_predicate=is_rewritable_image_name
+            )
+        }
+
+        assert found_names == {"poster.jpg", "clearlogo.png"}
+
+    def test_find_season_posters(self, test_data_dir: Path) -> None:
         """Test finding season-specific posters."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create season posters
-            s01 = temp_path / "season01-poster.jpg"
-            s01.touch()
-            s02 = temp_path / "season02-poster.png"
-            s02.touch()
-            s_sp = temp_path / "season-specials-poster.jpg"
-            s_sp.touch()
-
-            found_files = [
-                p for p in find_target_files(temp_path) if is_rewritable_image(p)
-            ]
-            found_names = {f.name for f in found_files}
-
-            assert "season01-poster.jpg" in found_names
-            assert "season02-poster.png" in found_names
-            assert "season-specials-poster.jpg" in found_names
-
-    def test_recursive_search(self) -> None:
+        # Create season posters
+        s01 = test_data_dir / "season01-poster.jpg"
+        create_empty_file(s01)
+        s02 = test_data_dir / "season02-poster.png"
+        create_empty_file(s02)
+        s_sp = test_data_dir / "season-specials-poster.jpg"
+        create_empty_file(s_sp)
+
+        found_names = {
+            p.name
+            for p in iter_target_files(
+                test_data_dir, name_predicate=is_rewritable_image_name
+            )
+        }
+
+        assert found_names == {
+            "season01-poster.jpg",
+            "season02-poster.png",
+            "season-specials-poster.jpg",
+        }
+
+    def test_recursive_search(self, test_data_dir: Path) -> None:
         """Test recursive search in subdirectories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create nested directories
-            season1_dir = temp_path / "Season 1"
-            season1_dir.mkdir()
-            season2_dir = temp_path / "Season 2"
-            season2_dir.mkdir()
-
-            # Create image files in subdirectories
-            poster1 = season1_dir / "season01-poster.jpg"
-            poster1.touch()
-            poster2 = season2_dir / "season02-poster.jpg"
-            poster2.touch()
-
-            found_files = [
-                p
-                for p in find_target_files(temp_path, recursive=True)
-                if is_rewritable_image(p)
-            ]
-            assert len(found_files) == 2
-
-    def test_non_recursive_search(self) -> None:
+        # Create nested directories
+        season1_dir = test_data_dir / "Season 1"
+        season1_dir.mkdir()
+        season2_dir = test_data_dir / "Season 2"
+        season2_dir.mkdir()
+
+        # Create image files in subdirectories
+        poster1 = season1_dir / "season01-poster.jpg"
+        create_empty_file(poster1)
+        poster2 = season2_dir / "season02-poster.jpg"
+        create_empty_file(poster2)
+
+        found_files = [
+            p
+            for p in find_target_files(test_data_dir, recursive=True)
+            if is_rewritable_image(p)
+        ]
+        assert len(found_files) == 2
+
+    def test_non_recursive_search(self, test_data_dir: Path) -> None:
         """Test non-recursive search only in root directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create root level poster
-            root_poster = temp_path / "poster.jpg"
-            root_poster.touch()
-
-            # Create nested directory with poster
-            season_dir = temp_path / "Season 1"
-            season_dir.mkdir()
-            nested_poster = season_dir / "season01-poster.jpg"
-            nested_poster.touch()
-
-            found_files = [
-                p
-                for p in find_target_files(temp_path, recursive=False)
-                if is_rewritable_image(p)
-            ]
-            assert len(found_files) == 1
-            assert found_files[0].name == "poster.jpg"
-
-    def test_empty_directory(self) -> None:
+        # Create root level poster
+        root_poster = test_data_dir / "poster.jpg"
+        create_empty_file(root_poster)
+
+        # Create nested directory with poster
+        season_dir = test_data_dir / "Season 1"
+        season_dir.mkdir()
+        nested_poster = season_dir / "season01-poster.jpg"
+        create_empty_file(nested_poster)
+
+        found_files = [
+            p
+            for p in find_target_files(test_data_dir, recursive=False)
+            if is_rewritable_image(p)
+        ]
+        assert len(found_files) == 1
+        assert found_files[0].name == "poster.jpg"
+
+    def test_empty_directory(self, test_data_dir: Path) -> None:
         """Test behavior with empty directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            found_files = [
-                p for p in find_target_files(temp_path) if is_rewritable_image(p)
-            ]
-            assert found_files == []
+        found_files = [
+            p for p in find_target_files(test_data_dir) if is_rewritable_image(p)
+        ]
+        assert found_files == []
 
 
 class TestExtractMetadataInfo:
     """Test metadata extraction for single and multi-episode NFO files."""
 
-    def test_extract_single_episode_metadata(self, test_data_dir: Path) -> None:
+    def test_extract_single_episode_metadata(
+        self, test_data_dir: Path, create_test_files: Callable[[str, Path], Path]
+    ) -> None:
         """Extract fields from one episode document."""
         nfo_path = test_data_dir / "episode.nfo"
-        nfo_path.write_text(
-            """<?xml version=\"1.0\" encoding=\"utf-8\"?>
-<episodedetails>
-  <title>Pilot</title>
-  <plot>Episode description.</plot>
-  <season>1</season>
-  <episode>1</episode>
-  <uniqueid type=\"tmdb\">1396</uniqueid>
-</episodedetails>
-""",
-            encoding="utf-8",
-        )
+        create_test_files("episode.nfo", nfo_path)
 
         metadata = extract_metadata_info(nfo_path)
 
@@ -313,28 +314,12 @@ class TestExtractMetadataInfo:
         assert metadata.episode_entries is not None
         assert len(metadata.episode_entries) == 1
 
-    def test_extract_multi_episode_metadata(self, test_data_dir: Path) -> None:
+    def test_extract_multi_episode_metadata(
+        self, test_data_dir: Path, create_test_files: Callable[[str, Path], Path]
+    ) -> None:
         """Extract per-episode fields from multiple documents."""
         nfo_path = test_data_dir / "multi_episode.nfo"
-        nfo_path.write_text(
-            """<?xml version=\"1.0\" encoding=\"utf-8\"?>
-<episodedetails>
-  <title>Pilot</title>
-  <plot>Walter White begins a new life in crime.</plot>
-  <season>1</season>
-  <episode>1</episode>
-  <uniqueid type=\"tvdb\">349232</uniqueid>
-</episodedetails>
-<episodedetails>
-  <title>Cat's in the Bag...</title>
-  <plot>Walt and Jesse deal with the aftermath.</plot>
-  <season>1</season>
-  <episode>2</episode>
-  <uniqueid type=\"tvdb\">349233</uniqueid>
-</episodedetails>
-""",
-            encoding="utf-8",
-        )
+        create_test_files("multi_episode.nfo", nfo_path)
 
         metadata = extract_metadata_info(nfo_path)
 
@@ -399,6 +384,37 @@ class TestExtractMetadataInfo:
             extract_metadata_info(nfo_path)
 
 
+class TestReadNfoRootTag:
+    """Test read_nfo_root_tag function."""
+
+    def test_reads_first_root_of_multi_episode_file(
+        self, test_data_dir: Path, create_test_files: Callable[[str, Path], Path]
+    ) -> None:
+        """Return the first element tag even when documents are adjacent."""
+        nfo_path = test_data_dir / "multi_episode.nfo"
+        create_test_files("multi_episode.nfo", nfo_path)
+
+        assert read_nfo_root_tag(nfo_path) == "episodedetails"
+
+    def test_reads_root_after_leading_comment(self, test_data_dir: Path) -> None:
+        """Fall back to the parser when the root is not at the start of the file."""
+        nfo_path = test_data_dir / "tvshow.nfo"
+        nfo_path.write_bytes(
+            b'<?xml version="1.0" encoding="utf-8"?>\n'
+            b"<!-- created by an older scraper -->\n"
+            b"<tvshow><title>Breaking Bad</title></tvshow>\n"
+        )
+
+        assert read_nfo_root_tag(nfo_path) == "tvshow"
+
+    def test_returns_none_for_empty_file(self, test_data_dir: Path) -> None:
+        """Return None when no element has been written yet."""
+        nfo_path = test_data_dir / "tvshow.nfo"
+        nfo_path.write_bytes(b"")
+
+        assert read_nfo_root_tag(nfo_path) is None
+
+
 class TestFindRootDirForFile:
     """Tests for find_root_dir_for_file."""
 
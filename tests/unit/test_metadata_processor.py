@@ -1,7 +1,9 @@
 """Unit tests for metadata processor."""
 
+import functools
+import re
 import xml.etree.ElementTree as ET
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -21,13 +23,25 @@ from tests.conftest import (
     SAMPLE_MULTI_EPISODE_NFO,
     assert_process_result,
     create_test_settings,
+    write_test_file,
 )
 
 
+def translator_returning(translations: dict[str, TranslatedContent]) -> Mock:
+    """Create a translator whose get_translations returns the given mapping."""
+    translator = Mock(spec=Translator)
+    translator.get_translations.return_value = translations
+    return translator
+
+
+@functools.cache
 def translated_content(
     title: str, description: str, language: str, tagline: str = ""
 ) -> TranslatedContent:
-    """Create translated content with one language for both fields."""
+    """Create translated content with one language for both fields.
+
+    Results are memoized; TranslatedContent is frozen, so sharing them is safe.
+    """
     return TranslatedContent(
         title=TranslatedString(content=title, language=language),
         description=TranslatedString(content=description, language=language),
@@ -35,6 +49,15 @@ def translated_content(
     )
 
 
+# Shared translations reused across tests
+_ZH_CN = translated_content("中文标题", "中文描述", "zh-CN")
+_ZH_CN_PLOT = translated_content("中文标题", "中文剧情描述", "zh-CN")
+_ZH_CN_SAMPLE = translated_content("示例剧集", "这是一个示例描述", "zh-CN")
+_ZH_CN_PILOT = translated_content("试播集", "沃尔特开始了犯罪生涯。", "zh-CN")
+_JA_JP = translated_content("日本語タイトル", "日本語の説明", "ja-JP")
+_EN = translated_content("English Title", "English Description", "en")
+
+
 def multi_episode_processor(
     test_data_dir: Path, create_test_files: Callable[[str, Path], Path]
 ) -> tuple[MetadataProcessor, Mock, Path]:
@@ -47,13 +70,33 @@ def multi_episode_processor(
     return processor, mock_translator, series_dir
 
 
+def _expected_available(translations: Iterable[str]) -> str:
+    """Format the sorted "Available: [...]" part of a no-preferred message."""
+    return f"Available: [{', '.join(sorted(translations))}]"
+
+
+def no_preferred_message_re(
+    preferred_languages: str, translations: Iterable[str]
+) -> re.Pattern[str]:
+    """Build the expected "no preferred translation" message pattern."""
+    preferred = ", ".join(preferred_languages.split(","))
+    return re.compile(
+        "File unchanged.*"
+        + re.escape(f"preferred languages [{preferred}]")
+        + ".*"
+        + re.escape(_expected_available(translations))
+    )
+
+
+_DEFAULT_TRANSLATIONS = {"zh-CN": _ZH_CN_SAMPLE}
+
+
 @pytest.fixture
 def mock_translator() -> Mock:
     """Create mock translator."""
     translator = Mock(spec=Translator)
-    translator.get_translations.return_value = {
-        "zh-CN": translated_content("示例剧集", "这是一个示例描述", "zh-CN")
-    }
+    # Shared by reference; tests needing other translations reassign return_value
+    translator.get_translations.return_value = _DEFAULT_TRANSLATIONS
     # Mock external ID lookup to return None (no external mapping)
     translator.find_tmdb_id_by_external_id.return_value = None
     return translator
@@ -65,9 +108,9 @@ def processor(test_settings: Settings, mock_translator: Mock) -> MetadataProcess
     return MetadataProcessor(test_settings, mock_translator)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def test_metadata_info() -> MetadataInfo:
-    """Create test MetadataInfo for fallback tests."""
+    """Create test MetadataInfo shared read-only by the fallback tests."""
     return MetadataInfo(
         tmdb_id=1396,
         file_type="tvshow",
@@ -150,6 +193,7 @@ def test_process_file_movie_parses_and_preserves_other_xml_fields(
 
 def test_process_file_movie_without_tmdb_id_skips_external_resolution(
     processor: MetadataProcessor,
+    mock_translator: Mock,
     test_data_dir: Path,
     create_test_files: Callable[[str, Path], Path],
 ) -> None:
@@ -164,23 +208,22 @@ def test_process_file_movie_without_tmdb_id_skips_external_resolution(
         expected_file_modified=False,
         expected_message_contains="No TMDB ID found",
     )
-    assert isinstance(processor.translator, Mock)
-    processor.translator.find_tmdb_id_by_external_id.assert_not_called()
-    processor.translator.get_translations.assert_not_called()
+    mock_translator.find_tmdb_id_by_external_id.assert_not_called()
+    mock_translator.get_translations.assert_not_called()
 
 
 def test_process_file_language_preference(
     processor: MetadataProcessor,
+    mock_translator: Mock,
     test_data_dir: Path,
     create_test_files: Callable[[str, Path], Path],
 ) -> None:
     """Test language preference selection through process_file."""
     # Create mock translator with multiple languages
-    assert isinstance(processor.translator, Mock)
-    processor.translator.get_translations.return_value = {
-        "en": translated_content("English Title", "English Description", "en"),
-        "zh-CN": translated_content("中文标题", "中文描述", "zh-CN"),
-        "ja-JP": translated_content("日本語タイトル", "日本語の説明", "ja-JP"),
+    mock_translator.get_translations.return_value = {
+        "en": _EN,
+        "zh-CN": _ZH_CN,
+        "ja-JP": _JA_JP,
     }
 
     test_path = create_test_files("tvshow.nfo", test_data_dir / "test_lang_pref.nfo")
@@ -375,50 +418,33 @@ def test_process_file_no_preferred_translation(
 ) -> None:
     """Test processing when translations exist but none match preferred languages."""
     # Mock translator to return translations that don't match preferred languages
-    mock_translator.get_translations.return_value = {
-        "en": TranslatedContent(
-            title=TranslatedString(content="English Title", language="en"),
-            description=TranslatedString(content="English Description", language="en"),
-        ),
-        "ja-JP": TranslatedContent(
-            title=TranslatedString(content="Japanese Title", language="ja-JP"),
-            description=TranslatedString(
-                content="Japanese Description", language="ja-JP"
-            ),
-        ),
+    translations = {
+        "en": _EN,
+        "ja-JP": translated_content("Japanese Title", "Japanese Description", "ja-JP"),
     }
+    mock_translator.get_translations.return_value = translations
 
     test_path = create_test_files("tvshow.nfo", test_data_dir / "test_no_preferred.nfo")
 
     result = processor.process_file(test_path)
 
-    assert result.success is False  # No work was accomplished
-    assert result.file_path == test_path
-    assert "File unchanged" in result.message
-    assert "preferred languages [zh-CN]" in result.message
-    assert "Available: [en, ja-JP]" in result.message
+    # No work was accomplished and the file was not changed
     assert result.tmdb_ids is not None
-    assert result.tmdb_ids.tmdb_id == 1396
-    assert result.file_modified is False  # File was not changed
-    assert result.translated_content is None
-
-
-@pytest.fixture
-def test_nfo_file(create_test_files: Callable[[str, Path], Path]) -> Path:
-    """Create a shared test .nfo file for fallback tests."""
-    return create_test_files(
-        "tvshow.nfo", Path(__file__).parent / "data" / "tvshow.nfo"
-    )
+    assert (
+        result.success,
+        result.file_path,
+        result.file_modified,
+        result.translated_content,
+        result.tmdb_ids.tmdb_id,
+    ) == (False, test_path, False, None, 1396)
+    assert no_preferred_message_re("zh-CN", translations).search(result.message)
 
 
 def test_apply_fallback_to_translation_no_fallback_needed(
     processor: MetadataProcessor, test_metadata_info: MetadataInfo
 ) -> None:
     """Test fallback logic when translation has both title and description."""
-    translation = TranslatedContent(
-        title=TranslatedString(content="完整标题", language="zh-CN"),
-        description=TranslatedString(content="完整描述", language="zh-CN"),
-    )
+    translation = translated_content("完整标题", "完整描述", "zh-CN")
 
     result = processor._apply_fallback_to_translation(test_metadata_info, translation)
 
@@ -433,10 +459,7 @@ def test_apply_fallback_to_translation_empty_title(
     processor: MetadataProcessor, test_metadata_info: MetadataInfo
 ) -> None:
     """Test fallback logic when translation has empty title."""
-    translation = TranslatedContent(
-        title=TranslatedString(content="", language="zh-CN"),
-        description=TranslatedString(content="翻译描述", language="zh-CN"),
-    )
+    translation = translated_content("", "翻译描述", "zh-CN")
 
     result = processor._apply_fallback_to_translation(test_metadata_info, translation)
 
@@ -451,10 +474,7 @@ def test_apply_fallback_to_translation_empty_description(
     processor: MetadataProcessor, test_metadata_info: MetadataInfo
 ) -> None:
     """Test fallback logic when translation has empty description."""
-    translation = TranslatedContent(
-        title=TranslatedString(content="绝命毒师", language="zh-CN"),
-        description=TranslatedString(content="", language="zh-CN"),
-    )
+    translation = translated_content("绝命毒师", "", "zh-CN")
 
     result = processor._apply_fallback_to_translation(test_metadata_info, translation)
 
@@ -471,10 +491,7 @@ def test_apply_fallback_to_translation_both_empty(
     processor: MetadataProcessor, test_metadata_info: MetadataInfo
 ) -> None:
     """Test fallback logic when translation has both empty title and description."""
-    translation = TranslatedContent(
-        title=TranslatedString(content="", language="zh-CN"),
-        description=TranslatedString(content="", language="zh-CN"),
-    )
+    translation = translated_content("", "", "zh-CN")
 
     result = processor._apply_fallback_to_translation(test_metadata_info, translation)
 
@@ -496,8 +513,8 @@ def test_select_preferred_translation_single_language_complete(
     processor = MetadataProcessor(settings, mock_translator)
 
     all_translations = {
-        "zh-CN": translated_content("中文标题", "中文描述", "zh-CN"),
-        "ja-JP": translated_content("日本語タイトル", "日本語の説明", "ja-JP"),
+        "zh-CN": _ZH_CN,
+        "ja-JP": _JA_JP,
     }
 
     result = processor._select_preferred_translation(all_translations)
@@ -531,10 +548,7 @@ def test_select_preferred_translation_partial_with_fallback(
                 content="Description française", language="fr-FR"
             ),
         ),
-        "es": TranslatedContent(
-            title=TranslatedString(content="Título español", language="es"),
-            description=TranslatedString(content="Descripción española", language="es"),
-        ),
+        "es": translated_content("Título español", "Descripción española", "es"),
     }
 
     result = processor._select_preferred_translation(all_translations)
@@ -551,10 +565,7 @@ def test_build_success_message_single_language(
     processor: MetadataProcessor,
 ) -> None:
     """Test _build_success_message for single language translation."""
-    translation = TranslatedContent(
-        title=TranslatedString(content="中文标题", language="zh-CN"),
-        description=TranslatedString(content="中文描述", language="zh-CN"),
-    )
+    translation = _ZH_CN
 
     message = processor._build_success_message(translation)
 
@@ -589,189 +600,142 @@ def test_build_success_message_partial_translation(
     assert message == "Successfully translated (title: en)"
 
 
-def test_process_file_multiple_preferred_languages_first_match(
+@pytest.fixture
+def processor_factory(
     test_data_dir: Path,
-    create_test_files: Callable[[str, Path], Path],
-) -> None:
-    """Test that first available preferred language is selected."""
-    # Setup settings with multiple preferred languages
-    settings = create_test_settings(
-        test_data_dir,
-        preferred_languages="ko-KR,ja-JP,zh-CN",  # Korean -> Japanese -> Chinese
-    )
-
-    # Mock translator with available translations (missing Korean)
-    mock_translator = Mock()
-    mock_translator.get_translations.return_value = {
-        "ja-JP": translated_content("日本語タイトル", "日本語の説明", "ja-JP"),
-        "zh-CN": translated_content("中文标题", "中文描述", "zh-CN"),
-        "en": translated_content("English Title", "English Description", "en"),
-    }
-
-    processor = MetadataProcessor(settings, mock_translator)
-    test_path = create_test_files("tvshow.nfo", test_data_dir / "test_multi_lang.nfo")
+) -> Callable[[str, dict[str, TranslatedContent]], MetadataProcessor]:
+    """Build processors for a preferred-language setting and canned translations."""
+
+    def _build(
+        preferred_languages: str, translations: dict[str, TranslatedContent]
+    ) -> MetadataProcessor:
+        settings = create_test_settings(
+            test_data_dir, preferred_languages=preferred_languages
+        )
+        return MetadataProcessor(settings, translator_returning(translations))
 
-    result = processor.process_file(test_path)
+    return _build
 
-    # Should select Japanese (ja-JP) as it's first available in preferred languages
-    assert_process_result(
-        result,
-        expected_success=True,
-        expected_language="ja-JP",  # Should pick Japanese, not Chinese
-        expected_file_modified=True,
-        expected_message_contains="Successfully translated",
-    )
 
+_SAMPLE_TRANSLATIONS = {
+    "ja-JP": _JA_JP,
+    "zh-CN": _ZH_CN,
+    "en": _EN,
+    "fr": translated_content("Titre français", "Description française", "fr"),
+    "de": translated_content("Deutscher Titel", "Deutsche Beschreibung", "de"),
+}
 
-def test_process_file_multiple_preferred_languages_no_matches(
-    test_data_dir: Path,
-    create_test_files: Callable[[str, Path], Path],
-) -> None:
-    """Test when none of the preferred languages are available."""
-    # Setup settings with preferred languages that don't match available translations
-    settings = create_test_settings(
-        test_data_dir,
-        preferred_languages="ko-KR,th-TH,vi-VN",  # Korean, Thai, Vietnamese
-    )
 
-    # Mock translator with only different languages available
-    mock_translator = Mock()
-    mock_translator.get_translations.return_value = {
-        "ja-JP": TranslatedContent(
-            title=TranslatedString(content="日本語タイトル", language="ja-JP"),
-            description=TranslatedString(content="日本語の説明", language="ja-JP"),
-        ),
-        "zh-CN": TranslatedContent(
-            title=TranslatedString(content="中文标题", language="zh-CN"),
-            description=TranslatedString(content="中文描述", language="zh-CN"),
+@pytest.mark.parametrize(
+    ("preferred_languages", "available_languages", "expected_language"),
+    [
+        # Korean -> Japanese -> Chinese, Korean missing: pick Japanese
+        pytest.param(
+            "ko-KR,ja-JP,zh-CN", ("ja-JP", "zh-CN", "en"), "ja-JP", id="first-match"
         ),
-        "en": TranslatedContent(
-            title=TranslatedString(content="English Title", language="en"),
-            description=TranslatedString(content="English Description", language="en"),
+        # Arabic and Thai missing: pick Chinese, not Japanese
+        pytest.param(
+            "ar,zh-CN,th-TH,ja-JP",
+            ("zh-CN", "ja-JP", "en", "de"),
+            "zh-CN",
+            id="partial-matches",
         ),
-        "fr": TranslatedContent(
-            title=TranslatedString(content="Titre français", language="fr"),
-            description=TranslatedString(
-                content="Description française", language="fr"
-            ),
-        ),
-    }
-
-    processor = MetadataProcessor(settings, mock_translator)
-    test_path = create_test_files("tvshow.nfo", test_data_dir / "test_no_preferred.nfo")
-
-    result = processor.process_file(test_path)
-
-    # Should fail with detailed message about preferred vs available languages
-    assert result.success is False
-    assert result.file_modified is False
-    assert result.translated_content is None
-    assert "preferred languages [ko-KR, th-TH, vi-VN]" in result.message
-    assert "Available: [en, fr, ja-JP, zh-CN]" in result.message  # Should be sorted
-    assert "File unchanged" in result.message
-
-
-def test_process_file_multiple_preferred_languages_partial_matches(
+        pytest.param("fr", ("fr", "en", "de"), "fr", id="single-available"),
+    ],
+)
+def test_process_file_selects_first_available_preferred_language(
+    processor_factory: Callable[[str, dict[str, TranslatedContent]], MetadataProcessor],
     test_data_dir: Path,
     create_test_files: Callable[[str, Path], Path],
+    preferred_languages: str,
+    available_languages: tuple[str, ...],
+    expected_language: str,
 ) -> None:
-    """Test when some but not all preferred languages are available."""
-    # Setup settings with mixed preferred languages (some available, some not)
-    settings = create_test_settings(
-        test_data_dir,
-        preferred_languages="ar,zh-CN,th-TH,ja-JP",  # Arabic, Chinese, Thai, Japanese
-    )
-
-    # Mock translator with some matching languages (missing Arabic and Thai)
-    mock_translator = Mock()
-    mock_translator.get_translations.return_value = {
-        "zh-CN": translated_content("中文标题", "中文描述", "zh-CN"),
-        "ja-JP": translated_content("日本語タイトル", "日本語の説明", "ja-JP"),
-        "en": translated_content("English Title", "English Description", "en"),
-        "de": translated_content("Deutscher Titel", "Deutsche Beschreibung", "de"),
-    }
-
-    processor = MetadataProcessor(settings, mock_translator)
-    test_path = create_test_files(
-        "tvshow.nfo", test_data_dir / "test_partial_match.nfo"
+    """Test that the first available preferred language is selected."""
+    processor = processor_factory(
+        preferred_languages,
+        {language: _SAMPLE_TRANSLATIONS[language] for language in available_languages},
     )
+    test_path = create_test_files("tvshow.nfo", test_data_dir / "tvshow.nfo")
 
     result = processor.process_file(test_path)
 
-    # Should select Chinese (zh-CN) as it's the first available in preferred order
     assert_process_result(
         result,
         expected_success=True,
-        expected_language="zh-CN",  # Should pick Chinese, not Japanese
+        expected_language=expected_language,
         expected_file_modified=True,
         expected_message_contains="Successfully translated",
     )
 
 
-def test_process_file_single_preferred_language_available(
+@pytest.mark.parametrize(
+    ("preferred_languages", "available_languages"),
+    [
+        pytest.param(
+            "ko-KR,th-TH,vi-VN",
+            ("ja-JP", "zh-CN", "en", "fr"),
+            id="multiple-preferred",
+        ),
+        pytest.param("ar", ("fr", "en", "zh-CN"), id="single-preferred"),
+    ],
+)
+def test_process_file_no_preferred_language_available(
+    processor_factory: Callable[[str, dict[str, TranslatedContent]], MetadataProcessor],
     test_data_dir: Path,
     create_test_files: Callable[[str, Path], Path],
+    preferred_languages: str,
+    available_languages: tuple[str, ...],
 ) -> None:
-    """Test when only one preferred language is specified and it's available."""
-    settings = create_test_settings(
-        test_data_dir,
-        preferred_languages="fr",  # Only French
+    """Test the detailed message when no preferred language is available."""
+    processor = processor_factory(
+        preferred_languages,
+        {language: _SAMPLE_TRANSLATIONS[language] for language in available_languages},
     )
-
-    mock_translator = Mock()
-    mock_translator.get_translations.return_value = {
-        "fr": translated_content("Titre français", "Description française", "fr"),
-        "en": translated_content("English Title", "English Description", "en"),
-        "de": translated_content("Deutscher Titel", "Deutsche Beschreibung", "de"),
-    }
-
-    processor = MetadataProcessor(settings, mock_translator)
-    test_path = create_test_files("tvshow.nfo", test_data_dir / "test_single_lang.nfo")
+    test_path = create_test_files("tvshow.nfo", test_data_dir / "tvshow.nfo")
 
     result = processor.process_file(test_path)
 
-    assert_process_result(
-        result,
-        expected_success=True,
-        expected_language="fr",
-        expected_file_modified=True,
-        expected_message_contains="Successfully translated",
-    )
-
-
-def test_process_file_single_preferred_language_not_available(
-    test_data_dir: Path,
-    create_test_files: Callable[[str, Path], Path],
-) -> None:
-    """Test when only one preferred language is specified and it's not available."""
-    settings = create_test_settings(
-        test_data_dir,
-        preferred_languages="ar",  # Only Arabic
+    assert (result.success, result.file_modified, result.translated_content) == (
+        False,
+        False,
+        None,
     )
+    # Available languages should be sorted
+    expected_message = no_preferred_message_re(preferred_languages, available_languages)
+    assert expected_message.search(result.message)
 
-    mock_translator = Mock()
-    mock_translator.get_translations.return_value = {
-        "fr": translated_content("Titre français", "Description française", "fr"),
-        "en": translated_content("English Title", "English Description", "en"),
-        "zh-CN": translated_content("中文标题", "中文描述", "zh-CN"),
-    }
 
-    processor = MetadataProcessor(settings, mock_translator)
-    test_path = create_test_files(
-        "tvshow.nfo", test_data_dir / "test_single_missing.nfo"
-    )
+# Reprocessing Prevention Tests
 
-    result = processor.process_file(test_path)
 
-    assert result.success is False
-    assert result.file_modified is False
-    assert result.translated_content is None
-    assert "preferred languages [ar]" in result.message
-    assert "Available: [en, fr, zh-CN]" in result.message
-    assert "File unchanged" in result.message
+_CUSTOM_NFO_TEMPLATE = b"""<?xml version="1.0" encoding="utf-8"?>
+<tvshow>
+  <title>%b</title>
+  <plot>%b</plot>
+%b  <uniqueid type="tmdb" default="true">%d</uniqueid>
+</tvshow>
+"""
 
 
-# Reprocessing Prevention Tests
+def custom_nfo_content(
+    title: str,
+    plot: str,
+    tmdb_id: int = 1396,
+    tagline: str | None = None,
+) -> bytes:
+    """Build UTF-8 encoded custom .nfo content for reprocessing tests."""
+    tagline_element = (
+        b"  <tagline>%b</tagline>\n" % tagline.encode("utf-8")
+        if tagline is not None
+        else b""
+    )
+    return _CUSTOM_NFO_TEMPLATE % (
+        title.encode("utf-8"),
+        plot.encode("utf-8"),
+        tagline_element,
+        tmdb_id,
+    )
 
 
 def create_custom_nfo(
@@ -782,22 +746,31 @@ def create_custom_nfo(
     tagline: str | None = None,
 ) -> None:
     """Helper to create custom .nfo files for reprocessing tests."""
-    tagline_element = f"  <tagline>{tagline}</tagline>\n" if tagline is not None else ""
-    content = f"""<?xml version="1.0" encoding="utf-8"?>
-<tvshow>
-  <title>{title}</title>
-  <plot>{plot}</plot>
-{tagline_element}  <uniqueid type="tmdb" default="true">{tmdb_id}</uniqueid>
-</tvshow>
-"""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
+    path.write_bytes(custom_nfo_content(title, plot, tmdb_id, tagline))
+
+
+def write_nfo_pair(
+    primary: Path,
+    backup: Path,
+    *,
+    primary_title: str,
+    primary_plot: str,
+    backup_title: str,
+    backup_plot: str,
+    primary_tagline: str | None = None,
+) -> None:
+    """Write a current .nfo and its backup, creating parent directories."""
+    write_test_file(
+        primary,
+        custom_nfo_content(primary_title, primary_plot, tagline=primary_tagline),
+    )
+    write_test_file(backup, custom_nfo_content(backup_title, backup_plot))
 
 
 def parse_nfo_content(nfo_path: Path) -> tuple[str, str]:
     """Helper to parse title and plot from .nfo file."""
-    tree = ET.parse(nfo_path)
-    root = tree.getroot()
+    root = ET.parse(nfo_path).getroot()
     title_elem = root.find("title")
     plot_elem = root.find("plot")
     title = (title_elem.text or "") if title_elem is not None else ""
@@ -807,12 +780,12 @@ def parse_nfo_content(nfo_path: Path) -> tuple[str, str]:
 
 def test_process_file_adds_tagline_after_plot(
     processor: MetadataProcessor,
+    mock_translator: Mock,
     test_data_dir: Path,
     create_test_files: Callable[[str, Path], Path],
 ) -> None:
     """Test a translated tagline is added after plot when missing from the NFO."""
-    assert isinstance(processor.translator, Mock)
-    processor.translator.get_translations.return_value = {
+    mock_translator.get_translations.return_value = {
         "zh-CN": translated_content(
             "示例剧集", "这是一个示例描述", "zh-CN", "命运由你掌握。"
         )
@@ -830,11 +803,10 @@ def test_process_file_adds_tagline_after_plot(
 
 
 def test_process_file_tagline_only_preserves_title_and_plot(
-    processor: MetadataProcessor, test_data_dir: Path
+    processor: MetadataProcessor, mock_translator: Mock, test_data_dir: Path
 ) -> None:
     """Test a tagline-only translation leaves title and plot unchanged."""
-    assert isinstance(processor.translator, Mock)
-    processor.translator.get_translations.return_value = {
+    mock_translator.get_translations.return_value = {
         "zh-CN": translated_content("", "", "zh-CN", "命运由你掌握。")
     }
     nfo_path = test_data_dir / "tvshow.nfo"
@@ -854,11 +826,10 @@ def test_process_file_tagline_only_preserves_title_and_plot(
 
 
 def test_process_file_preserves_tagline_when_tmdb_value_is_empty(
-    processor: MetadataProcessor, test_data_dir: Path
+    processor: MetadataProcessor, mock_translator: Mock, test_data_dir: Path
 ) -> None:
     """Test an empty TMDB tagline cannot overwrite the existing NFO value."""
-    assert isinstance(processor.translator, Mock)
-    processor.translator.get_translations.return_value = {
+    mock_translator.get_translations.return_value = {
         "zh-CN": translated_content("中文标题", "中文剧情", "zh-CN")
     }
     nfo_path = test_data_dir / "tvshow.nfo"
@@ -873,21 +844,21 @@ def test_process_file_preserves_tagline_when_tmdb_value_is_empty(
 
 
 def test_process_file_restores_and_removes_added_tagline_from_backup(
-    processor: MetadataProcessor, test_data_dir: Path
+    processor: MetadataProcessor, mock_translator: Mock, test_data_dir: Path
 ) -> None:
     """Test restoring a backup without a tagline removes an added tagline."""
     nfo_path = test_data_dir / "tvshow.nfo"
     backup_path = test_data_dir / "backups" / nfo_path.relative_to("/")
-    backup_path.parent.mkdir(parents=True, exist_ok=True)
-    create_custom_nfo(backup_path, "Original Title", "Original plot")
-    create_custom_nfo(
+    write_nfo_pair(
         nfo_path,
-        "中文标题",
-        "中文剧情",
-        tagline="命运由你掌握。",
+        backup_path,
+        primary_title="中文标题",
+        primary_plot="中文剧情",
+        primary_tagline="命运由你掌握。",
+        backup_title="Original Title",
+        backup_plot="Original plot",
     )
-    assert isinstance(processor.translator, Mock)
-    processor.translator.get_translations.return_value = {}
+    mock_translator.get_translations.return_value = {}
 
     result = processor.process_file(nfo_path)
 
@@ -900,12 +871,12 @@ def test_process_file_restores_and_removes_added_tagline_from_backup(
 
 def test_process_file_episode_adds_tagline(
     processor: MetadataProcessor,
+    mock_translator: Mock,
     test_data_dir: Path,
     create_test_files: Callable[[str, Path], Path],
 ) -> None:
     """Test episode NFOs receive non-empty TMDB taglines."""
-    assert isinstance(processor.translator, Mock)
-    processor.translator.get_translations.return_value = {
+    mock_translator.get_translations.return_value = {
         "zh-CN": translated_content(
             "示例剧集", "这是一个示例描述", "zh-CN", "命运由你掌握。"
         )
@@ -919,11 +890,10 @@ def test_process_file_episode_adds_tagline(
 
 
 def test_process_file_replaces_duplicate_taglines(
-    processor: MetadataProcessor, test_data_dir: Path
+    processor: MetadataProcessor, mock_translator: Mock, test_data_dir: Path
 ) -> None:
     """Test rewriting collapses duplicate tagline elements into one value."""
-    assert isinstance(processor.translator, Mock)
-    processor.translator.get_translations.return_value = {
+    mock_translator.get_translations.return_value = {
         "zh-CN": translated_content("中文标题", "中文剧情", "zh-CN", "新宣传语")
     }
     nfo_path = test_data_dir / "tvshow.nfo"
@@ -946,11 +916,10 @@ def test_process_file_replaces_duplicate_taglines(
 
 
 def test_process_file_appends_tagline_when_plot_is_missing(
-    processor: MetadataProcessor, test_data_dir: Path
+    processor: MetadataProcessor, mock_translator: Mock, test_data_dir: Path
 ) -> None:
     """Test a tagline is appended when an NFO has no plot element."""
-    assert isinstance(processor.translator, Mock)
-    processor.translator.get_translations.return_value = {
+    mock_translator.get_translations.return_value = {
         "zh-CN": translated_content("", "", "zh-CN", "命运由你掌握。")
     }
     nfo_path = test_data_dir / "tvshow.nfo"
@@ -987,12 +956,7 @@ def test_content_matches_preferred_translation_skips_processing(
     create_custom_nfo(nfo_path, "中文标题", "中文剧情描述")
 
     # Mock translator to return the same Chinese translation
-    mock_translator.get_translations.return_value = {
-        "zh-CN": TranslatedContent(
-            title=TranslatedString(content="中文标题", language="zh-CN"),
-            description=TranslatedString(content="中文剧情描述", language="zh-CN"),
-        )
-    }
+    mock_translator.get_translations.return_value = {"zh-CN": _ZH_CN_PLOT}
 
     result = processor.process_file(nfo_path)
 
@@ -1023,14 +987,8 @@ def test_preference_changed_better_translation_available_reprocesses(
 
     # Mock translator: Chinese is now available and preferred over Japanese
     mock_translator.get_translations.return_value = {
-        "zh-CN": TranslatedContent(
-            title=TranslatedString(content="中文标题", language="zh-CN"),
-            description=TranslatedString(content="中文剧情描述", language="zh-CN"),
-        ),
-        "ja-JP": TranslatedContent(
-            title=TranslatedString(content="日本語タイトル", language="ja-JP"),
-            description=TranslatedString(content="日本語の説明", language="ja-JP"),
-        ),
+        "zh-CN": _ZH_CN_PLOT,
+        "ja-JP": _JA_JP,
     }
 
     result = processor.process_file(nfo_path)
@@ -1062,23 +1020,21 @@ def test_preference_change_no_translation_reverts_to_original_with_backup(
     mock_translator = Mock(spec=Translator)
     processor = MetadataProcessor(settings, mock_translator)
 
-    # Create .nfo file with Japanese content
+    # Create .nfo file with Japanese content and a backup with original English
+    # content at the correct absolute-path structure
     nfo_path = test_data_dir / "tvshow.nfo"
-    create_custom_nfo(nfo_path, "日本語タイトル", "日本語の説明")
-
-    # Create backup with original English content at the correct absolute-path structure
-    backup_root = test_data_dir / "backups"
-    backup_path = backup_root / nfo_path.relative_to("/")
-    backup_path.parent.mkdir(parents=True, exist_ok=True)
-    create_custom_nfo(backup_path, "Original Title", "Original plot")
+    backup_path = test_data_dir / "backups" / nfo_path.relative_to("/")
+    write_nfo_pair(
+        nfo_path,
+        backup_path,
+        primary_title="日本語タイトル",
+        primary_plot="日本語の説明",
+        backup_title="Original Title",
+        backup_plot="Original plot",
+    )
 
     # Mock translator: No preferred languages available
-    mock_translator.get_translations.return_value = {
-        "ja-JP": TranslatedContent(
-            title=TranslatedString(content="日本語タイトル", language="ja-JP"),
-            description=TranslatedString(content="日本語の説明", language="ja-JP"),
-        )
-    }
+    mock_translator.get_translations.return_value = {"ja-JP": _JA_JP}
 
     result = processor.process_file(nfo_path)
 
@@ -1110,12 +1066,7 @@ def test_multiple_rapid_processing_only_first_modifies(
     create_custom_nfo(nfo_path, "English Title", "English description")
 
     # Mock translator returns Chinese translation
-    mock_translator.get_translations.return_value = {
-        "zh-CN": TranslatedContent(
-            title=TranslatedString(content="中文标题", language="zh-CN"),
-            description=TranslatedString(content="中文剧情描述", language="zh-CN"),
-        )
-    }
+    mock_translator.get_translations.return_value = {"zh-CN": _ZH_CN_PLOT}
 
     # First processing - should modify file
     result1 = processor.process_file(nfo_path)
@@ -1158,12 +1109,7 @@ def test_backup_not_overwritten_on_subsequent_processing(
     create_custom_nfo(nfo_path, "Original English Title", "Original English plot")
 
     # Mock translator returns Chinese translation
-    mock_translator.get_translations.return_value = {
-        "zh-CN": TranslatedContent(
-            title=TranslatedString(content="中文标题", language="zh-CN"),
-            description=TranslatedString(content="中文剧情描述", language="zh-CN"),
-        )
-    }
+    mock_translator.get_translations.return_value = {"zh-CN": _ZH_CN_PLOT}
 
     # First processing - should create backup and translate
     result1 = processor.process_file(nfo_path)
@@ -1242,11 +1188,8 @@ def test_original_language_fallback_selects_original_title(
                 content="本剧讲述的是嘉靖与海瑞的故事。", language="zh-CN"
             ),
         ),
-        "en-US": TranslatedContent(
-            title=TranslatedString(content="Ming Dynasty in 1566", language="en-US"),
-            description=TranslatedString(
-                content="A series based on the events.", language="en-US"
-            ),
+        "en-US": translated_content(
+            "Ming Dynasty in 1566", "A series based on the events.", "en-US"
         ),
     }
 
@@ -1330,13 +1273,13 @@ def test_original_language_fallback_does_not_apply_for_different_family(
 
 def test_process_file_tvdb_id_only_success(
     processor: MetadataProcessor,
+    mock_translator: Mock,
     test_data_dir: Path,
     create_test_files: Callable[[str, Path], Path],
 ) -> None:
     """Test successful processing with only TVDB ID (no TMDB ID)."""
     # Mock external ID lookup to return TMDB ID for TVDB lookup
-    assert isinstance(processor.translator, Mock)
-    processor.translator.find_tmdb_id_by_external_id.return_value = 1396
+    mock_translator.find_tmdb_id_by_external_id.return_value = 1396
 
     # Use the dedicated TVDB-only fixture
     test_path = create_test_files("tvdb_only.nfo", test_data_dir / "test_tvdb.nfo")
@@ -1353,7 +1296,7 @@ def test_process_file_tvdb_id_only_success(
     )
 
     # Verify external ID lookup was called with correct parameters
-    processor.translator.find_tmdb_id_by_external_id.assert_called_with(
+    mock_translator.find_tmdb_id_by_external_id.assert_called_with(
         "123456", "tvdb_id", resource_type="series"
     )
 
@@ -1400,9 +1343,7 @@ def test_process_file_episode_inherits_parent_tvdb_id(
     settings = create_test_settings(test_data_dir)
 
     mock_translator = Mock(spec=Translator)
-    mock_translator.get_translations.return_value = {
-        "zh-CN": translated_content("示例剧集", "这是一个示例描述", "zh-CN")
-    }
+    mock_translator.get_translations.return_value = {"zh-CN": _ZH_CN_SAMPLE}
     # Mock external ID lookup to return TMDB ID for TVDB lookup
     mock_translator.find_tmdb_id_by_external_id.return_value = 1396
     processor = MetadataProcessor(settings, mock_translator)
@@ -1448,13 +1389,13 @@ def test_process_file_episode_inherits_parent_tvdb_id(
 
 def test_process_file_external_id_lookup_fails(
     processor: MetadataProcessor,
+    mock_translator: Mock,
     test_data_dir: Path,
     create_test_files: Callable[[str, Path], Path],
 ) -> None:
     """Test graceful failure when external ID lookup fails."""
     # Mock external ID lookup to return None (lookup fails)
-    assert isinstance(processor.translator, Mock)
-    processor.translator.find_tmdb_id_by_external_id.return_value = None
+    mock_translator.find_tmdb_id_by_external_id.return_value = None
 
     # Use the existing no_tmdb_id fixture which has external IDs but no TMDB ID
     test_path = create_test_files("no_tmdb_id.nfo", test_data_dir / "test_fail.nfo")
@@ -1469,7 +1410,7 @@ def test_process_file_external_id_lookup_fails(
     )
 
     # Verify both external ID lookups were attempted
-    calls = processor.translator.find_tmdb_id_by_external_id.call_args_list
+    calls = mock_translator.find_tmdb_id_by_external_id.call_args_list
     assert len(calls) == 2  # Should try both TVDB and IMDB
     assert ("123456", "tvdb_id") in [call.args for call in calls]
     assert ("tt1234567", "imdb_id") in [call.args for call in calls]
@@ -1483,9 +1424,7 @@ def test_process_file_mixed_id_scenarios(
     settings = create_test_settings(test_data_dir)
 
     mock_translator = Mock(spec=Translator)
-    mock_translator.get_translations.return_value = {
-        "zh-CN": translated_content("示例剧集", "这是一个示例描述", "zh-CN")
-    }
+    mock_translator.get_translations.return_value = {"zh-CN": _ZH_CN_SAMPLE}
     # Mock external ID lookup to return different TMDB ID
     mock_translator.find_tmdb_id_by_external_id.return_value = 2468
     processor = MetadataProcessor(settings, mock_translator)
@@ -1527,9 +1466,7 @@ def test_process_file_episode_external_id_priority_over_parent_external_id(
     settings = create_test_settings(test_data_dir)
 
     mock_translator = Mock(spec=Translator)
-    mock_translator.get_translations.return_value = {
-        "zh-CN": translated_content("示例剧集", "这是一个示例描述", "zh-CN")
-    }
+    mock_translator.get_translations.return_value = {"zh-CN": _ZH_CN_SAMPLE}
     # Mock external ID lookup to return TMDB ID for episode's external ID
     mock_translator.find_tmdb_id_by_external_id.return_value = 2468
     processor = MetadataProcessor(settings, mock_translator)
@@ -1625,9 +1562,7 @@ def test_process_file_multi_episode_partial_update(
 
     def get_translations(tmdb_ids: TmdbIds) -> dict[str, TranslatedContent]:
         if tmdb_ids.episode == 1:
-            return {
-                "zh-CN": translated_content("试播集", "沃尔特开始了犯罪生涯。", "zh-CN")
-            }
+            return {"zh-CN": _ZH_CN_PILOT}
         return {}
 
     mock_translator.get_translations.side_effect = get_translations
@@ -1778,9 +1713,7 @@ def test_process_file_multi_episode_skips_entry_without_episode_numbers(
         encoding="utf-8",
     )
 
-    mock_translator.get_translations.return_value = {
-        "zh-CN": translated_content("试播集", "沃尔特开始了犯罪生涯。", "zh-CN")
-    }
+    mock_translator.get_translations.return_value = {"zh-CN": _ZH_CN_PILOT}
     mock_translator.find_tmdb_id_by_external_id.return_value = None
 
     result = processor.process_file(nfo_path)
@@ -1814,9 +1747,7 @@ def test_process_file_multi_episode_reports_already_matched_entries(
 
     def get_translations(tmdb_ids: TmdbIds) -> dict[str, TranslatedContent]:
         if tmdb_ids.episode == 1:
-            return {
-                "zh-CN": translated_content("试播集", "沃尔特开始了犯罪生涯。", "zh-CN")
-            }
+            return {"zh-CN": _ZH_CN_PILOT}
         return {"zh-CN": translated_content("袋中猫", "两人处理善后。", "zh-CN")}
 
     mock_translator.get_translations.side_effect = get_translations
@@ -1844,10 +1775,7 @@ def test_write_translated_metadata_with_tree_requires_xml_tree(
         processor._write_translated_metadata_with_tree(
             None,
             test_data_dir / "out.nfo",
-            TranslatedContent(
-                title=TranslatedString(content="Title", language="en"),
-                description=TranslatedString(content="Plot", language="en"),
-            ),
+            translated_content("Title", "Plot", "en"),
         )
 
 
@@ -1872,26 +1800,24 @@ def test_process_file_no_translation_backup_matches_current(
         test_data_dir,
         preferred_languages="zh-CN",
     )
-    mock_translator = Mock(spec=Translator)
-    processor = MetadataProcessor(settings, mock_translator)
+    # Translator returns no preferred language translations
+    translator = translator_returning(
+        {"en": translated_content("English Title", "English plot", "en")}
+    )
+    processor = MetadataProcessor(settings, translator)
 
-    # Create backup with original content
+    # Create backup and a current NFO with the same content (never rewritten)
     nfo_path = test_data_dir / "tvshow.nfo"
     backup_root = test_data_dir / "backups"
     backup_path = backup_root / nfo_path.relative_to("/")
-    backup_path.parent.mkdir(parents=True, exist_ok=True)
-    create_custom_nfo(backup_path, "Original Title", "Original plot")
-
-    # Create current NFO with same content as backup (never rewritten)
-    create_custom_nfo(nfo_path, "Original Title", "Original plot")
-
-    # Mock translator returns no preferred language translations
-    mock_translator.get_translations.return_value = {
-        "en": TranslatedContent(
-            title=TranslatedString(content="English Title", language="en"),
-            description=TranslatedString(content="English plot", language="en"),
-        )
-    }
+    write_nfo_pair(
+        nfo_path,
+        backup_path,
+        primary_title="Original Title",
+        primary_plot="Original plot",
+        backup_title="Original Title",
+        backup_plot="Original plot",
+    )
 
     result = processor.process_file(nfo_path)
 
@@ -1915,8 +1841,5 @@ def test_write_translated_metadata_with_tree_xml_root_none(
         processor._write_translated_metadata_with_tree(
             mock_tree,
             test_data_dir / "out.nfo",
-            TranslatedContent(
-                title=TranslatedString(content="Title", language="en"),
-                description=TranslatedString(content="Plot", language="en"),
-            ),
+            translated_content("Title", "Plot", "en"),
         )
@@ -1,6 +1,8 @@
 """Unit tests for data models."""
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
+from typing import Literal
 
 import pytest
 
@@ -15,30 +17,32 @@ from sonarr_metadata_rewrite.models import (
 )
 
 
-def test_tmdb_ids_tv() -> None:
-    """Test TmdbIds for TV show files."""
-    tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv")
-    assert tmdb_ids.tmdb_id == 12345
-    assert tmdb_ids.media_type == "tv"
-    assert tmdb_ids.season is None
-    assert tmdb_ids.episode is None
-
+@pytest.mark.parametrize(
+    ("media_type", "season", "episode", "expected_path"),
+    [
+        ("tv", None, None, "tv/12345"),
+        ("tv", 1, 1, "tv/12345/season/1/episode/1"),
+        ("tv", 1, None, "tv/12345"),
+        ("movie", None, None, "movie/12345"),
+    ],
+    ids=["tv", "episode", "season-artwork", "movie"],
+)
+def test_tmdb_ids(
+    media_type: Literal["tv", "movie"],
+    season: int | None,
+    episode: int | None,
+    expected_path: str,
+) -> None:
+    """Test TmdbIds for series, episode, season artwork and movie files."""
+    tmdb_ids = TmdbIds(
+        tmdb_id=12345, media_type=media_type, season=season, episode=episode
+    )
 
-def test_tmdb_ids_episode() -> None:
-    """Test TmdbIds for episode files."""
-    tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv", season=1, episode=1)
     assert tmdb_ids.tmdb_id == 12345
-    assert tmdb_ids.season == 1
-    assert tmdb_ids.episode == 1
-
-
-def test_tmdb_ids_season_artwork() -> None:
-    """Test TmdbIds allows TV season artwork without an episode."""
-    tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv", season=1)
-
-    assert str(tmdb_ids) == "tv/12345"
-    assert tmdb_ids.season == 1
-    assert tmdb_ids.episode is None
+    assert tmdb_ids.media_type == media_type
+    assert str(tmdb_ids) == expected_path
+    assert tmdb_ids.season == season
+    assert tmdb_ids.episode == episode
 
 
 def test_translated_content() -> None:
@@ -184,15 +188,6 @@ def test_metadata_process_result_backward_compatibility() -> None:
     assert result.backup_created is True
 
 
-def test_tmdb_ids_movie_path() -> None:
-    """Test TmdbIds builds movie resource paths."""
-    tmdb_ids = TmdbIds(tmdb_id=550, media_type="movie")
-
-    assert str(tmdb_ids) == "movie/550"
-    assert tmdb_ids.season is None
-    assert tmdb_ids.episode is None
-
-
 def test_tmdb_ids_movie_rejects_season_or_episode() -> None:
     """Test movie IDs cannot include TV episode fields."""
     with pytest.raises(ValueError, match="cannot include season or episode"):
@@ -203,3 +198,14 @@ def test_tmdb_ids_episode_requires_season() -> None:
     """Test episodes cannot omit their season number."""
     with pytest.raises(ValueError, match="require a season"):
         TmdbIds(tmdb_id=12345, media_type="tv", episode=1)
+
+
+def test_translated_content_is_immutable() -> None:
+    """Test translated values can be shared safely because they are frozen."""
+    content = TranslatedContent(
+        title=TranslatedString(content="示例剧集", language="zh-CN"),
+        description=TranslatedString(content="这是一个示例描述", language="zh-CN"),
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        content.title.content = "Other"  # type: ignore[misc]
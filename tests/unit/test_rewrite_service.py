@@ -15,6 +15,7 @@ from sonarr_metadata_rewrite.models import (
     TranslatedString,
 )
 from sonarr_metadata_rewrite.rewrite_service import RewriteService
+from tests.conftest import create_test_settings
 
 
 def assert_cache_initialization_error(settings: Settings, cache_dir: Path) -> None:
@@ -28,6 +29,24 @@ def assert_cache_initialization_error(settings: Settings, cache_dir: Path) -> No
     assert "not be accessible or writable" in error_message
 
 
+@pytest.fixture(scope="module")
+def shared_mock_logger() -> Mock:
+    """Create the stand-in rewrite service logger once per module."""
+    return Mock()
+
+
+@pytest.fixture
+def mock_logger(
+    shared_mock_logger: Mock, monkeypatch: pytest.MonkeyPatch
+) -> Generator[Mock]:
+    """Install the shared logger mock, clearing its recorded calls afterwards."""
+    monkeypatch.setattr(
+        "sonarr_metadata_rewrite.rewrite_service.logger", shared_mock_logger
+    )
+    yield shared_mock_logger
+    shared_mock_logger.reset_mock()
+
+
 @pytest.fixture
 def rewrite_service(test_settings: Settings) -> Generator[RewriteService]:
     """Create rewrite service instance."""
@@ -46,7 +65,6 @@ def test_rewrite_service_initialization(rewrite_service: RewriteService) -> None
     assert rewrite_service.file_scanner is not None
 
 
-@patch("sonarr_metadata_rewrite.rewrite_service.logger")
 def test_service_start_stop(mock_logger: Mock, rewrite_service: RewriteService) -> None:
     """Test service start/stop functionality."""
     with (
@@ -70,28 +88,33 @@ def test_service_start_stop(mock_logger: Mock, rewrite_service: RewriteService)
         mock_cache_close.assert_called_once()
 
 
-def test_is_running(rewrite_service: RewriteService) -> None:
+@pytest.mark.parametrize(
+    ("monitor_running", "scanner_running", "expected"),
+    [
+        (True, False, True),
+        (False, True, True),
+        (False, False, False),
+        (True, True, True),
+    ],
+)
+def test_is_running(
+    rewrite_service: RewriteService,
+    monkeypatch: pytest.MonkeyPatch,
+    monitor_running: bool,
+    scanner_running: bool,
+    expected: bool,
+) -> None:
     """Test is_running status check."""
-    with (
-        patch.object(rewrite_service.file_monitor, "is_running", return_value=True),
-        patch.object(rewrite_service.file_scanner, "is_running", return_value=False),
-    ):
-        assert rewrite_service.is_running() is True
-
-    with (
-        patch.object(rewrite_service.file_monitor, "is_running", return_value=False),
-        patch.object(rewrite_service.file_scanner, "is_running", return_value=True),
-    ):
-        assert rewrite_service.is_running() is True
+    monkeypatch.setattr(
+        rewrite_service.file_monitor, "is_running", lambda: monitor_running
+    )
+    monkeypatch.setattr(
+        rewrite_service.file_scanner, "is_running", lambda: scanner_running
+    )
 
-    with (
-        patch.object(rewrite_service.file_monitor, "is_running", return_value=False),
-        patch.object(rewrite_service.file_scanner, "is_running", return_value=False),
-    ):
-        assert rewrite_service.is_running() is False
+    assert rewrite_service.is_running() is expected
 
 
-@patch("sonarr_metadata_rewrite.rewrite_service.logger")
 def test_service_integration_successful_processing(
     mock_logger: Mock,
     rewrite_service: RewriteService,
@@ -117,11 +140,9 @@ def test_service_integration_successful_processing(
 
         # Verify successful processing was logged
         mock_logger.info.assert_called()
-        log_calls = [call[0][0] for call in mock_logger.info.call_args_list]
-        assert any("✅" in call for call in log_calls)
+        assert any("✅" in call.args[0] for call in mock_logger.info.call_args_list)
 
 
-@patch("sonarr_metadata_rewrite.rewrite_service.logger")
 def test_service_integration_processing_failure(
     mock_logger: Mock,
     rewrite_service: RewriteService,
@@ -138,11 +159,9 @@ def test_service_integration_processing_failure(
 
     # Verify failure was logged with warning
     mock_logger.warning.assert_called()
-    log_calls = [call[0][0] for call in mock_logger.warning.call_args_list]
-    assert any("⚠️" in call for call in log_calls)
+    assert any("⚠️" in call.args[0] for call in mock_logger.warning.call_args_list)
 
 
-@patch("sonarr_metadata_rewrite.rewrite_service.logger")
 def test_service_integration_processing_exception(
     mock_logger: Mock, rewrite_service: RewriteService, test_data_dir: Path
 ) -> None:
@@ -160,7 +179,6 @@ def test_service_integration_processing_exception(
         mock_logger.exception.assert_called()
 
 
-@patch("sonarr_metadata_rewrite.rewrite_service.logger")
 def test_service_integration_processing_error_with_exception(
     mock_logger: Mock,
     rewrite_service: RewriteService,
@@ -187,11 +205,8 @@ def test_service_integration_processing_error_with_exception(
 def test_cache_initialization_error(test_data_dir: Path) -> None:
     """Test cache initialization errors are handled with clear messages."""
     cache_dir = test_data_dir / "readonly_cache"
-    settings = Settings(
-        tmdb_api_key="test_key",
-        rewrite_root_dirs=[test_data_dir],
-        preferred_languages=["en-US"],
-        cache_dir=cache_dir,
+    settings = create_test_settings(
+        test_data_dir, preferred_languages=["en-US"], cache_dir=cache_dir
     )
 
     with patch(
@@ -212,11 +227,8 @@ def test_cache_initialization_permission_error(test_data_dir: Path) -> None:
         cache_dir = readonly_parent / "cache"
 
         # Create settings pointing to a cache dir in read-only parent
-        settings = Settings(
-            tmdb_api_key="test_key",
-            rewrite_root_dirs=[test_data_dir],
-            preferred_languages=["en-US"],
-            cache_dir=cache_dir,
+        settings = create_test_settings(
+            test_data_dir, preferred_languages=["en-US"], cache_dir=cache_dir
         )
 
         assert_cache_initialization_error(settings, cache_dir)
@@ -227,13 +239,16 @@ def test_cache_initialization_permission_error(test_data_dir: Path) -> None:
 
 # Image-specific RewriteService tests
 
+# Routing is decided from the file name alone and both processors are mocked,
+# so routing tests use paths that are never created on disk
+_MEDIA_DIR = Path("/media/tv/Example Show")
+
 
 def test_process_file_routes_image_to_image_processor(
-    rewrite_service: RewriteService, tmp_path: Path
+    rewrite_service: RewriteService,
 ) -> None:
     """Test that image files are routed to ImageProcessor."""
-    poster_path = tmp_path / "poster.jpg"
-    poster_path.write_bytes(b"fake image")
+    poster_path = _MEDIA_DIR / "poster.jpg"
 
     with (
         patch.object(rewrite_service.image_processor, "process") as mock_image_process,
@@ -250,11 +265,10 @@ def test_process_file_routes_image_to_image_processor(
 
 
 def test_process_file_routes_nfo_to_metadata_processor(
-    rewrite_service: RewriteService, tmp_path: Path
+    rewrite_service: RewriteService,
 ) -> None:
     """Test that NFO files are routed to MetadataProcessor."""
-    nfo_path = tmp_path / "tvshow.nfo"
-    nfo_path.write_text("<tvshow><title>Test</title></tvshow>")
+    nfo_path = _MEDIA_DIR / "tvshow.nfo"
 
     with (
         patch.object(rewrite_service.image_processor, "process") as mock_image_process,
@@ -270,69 +284,65 @@ def test_process_file_routes_nfo_to_metadata_processor(
         mock_image_process.assert_not_called()
 
 
-@patch("sonarr_metadata_rewrite.rewrite_service.logger")
-def test_process_file_callback_logs_image_success(
-    mock_logger: Mock, rewrite_service: RewriteService, tmp_path: Path
-) -> None:
-    """Test callback logs success for image processing."""
-    poster_path = tmp_path / "poster.jpg"
-    poster_path.write_bytes(b"fake image")
-
-    with patch.object(rewrite_service.image_processor, "process") as mock_image_process:
-        # Mock successful image processing
-        mock_image_process.return_value = ImageProcessResult(
-            success=True,
-            file_path=poster_path,
-            message="Poster rewritten successfully",
-            kind="poster",
-            file_modified=True,
-        )
-
-        rewrite_service._process_file_callback(poster_path)
-
-        # Verify success was logged
-        mock_logger.info.assert_called()
-        log_calls = [call[0][0] for call in mock_logger.info.call_args_list]
-        assert any("✅" in call for call in log_calls)
-
-
-@patch("sonarr_metadata_rewrite.rewrite_service.logger")
-def test_process_file_callback_logs_image_failure(
-    mock_logger: Mock, rewrite_service: RewriteService, tmp_path: Path
+@pytest.mark.parametrize(
+    ("success", "kind", "filename", "message", "log_level", "emoji"),
+    [
+        (
+            True,
+            "poster",
+            "poster.jpg",
+            "Poster rewritten successfully",
+            "info",
+            "✅",
+        ),
+        (
+            False,
+            "clearlogo",
+            "clearlogo.png",
+            "No logo available in preferred languages",
+            "warning",
+            "⚠️",
+        ),
+    ],
+    ids=["success", "failure"],
+)
+def test_process_file_callback_logs_image_result(
+    mock_logger: Mock,
+    rewrite_service: RewriteService,
+    success: bool,
+    kind: str,
+    filename: str,
+    message: str,
+    log_level: str,
+    emoji: str,
 ) -> None:
-    """Test callback logs failure for image processing."""
-    logo_path = tmp_path / "clearlogo.png"
-    logo_path.write_bytes(b"fake image")
+    """Test callback logs image processing success and failure."""
+    image_path = _MEDIA_DIR / filename
 
     with patch.object(rewrite_service.image_processor, "process") as mock_image_process:
-        # Mock failed image processing
         mock_image_process.return_value = ImageProcessResult(
-            success=False,
-            file_path=logo_path,
-            message="No logo available in preferred languages",
-            kind="clearlogo",
+            success=success,
+            file_path=image_path,
+            message=message,
+            kind=kind,
+            file_modified=success,
         )
 
-        rewrite_service._process_file_callback(logo_path)
+        rewrite_service._process_file_callback(image_path)
 
-        # Verify warning was logged
-        mock_logger.warning.assert_called()
-        log_calls = [call[0][0] for call in mock_logger.warning.call_args_list]
-        assert any("⚠️" in call for call in log_calls)
+        # Verify the result was logged at the matching level
+        log_method = getattr(mock_logger, log_level)
+        log_method.assert_called()
+        assert any(emoji in call.args[0] for call in log_method.call_args_list)
 
 
-def test_integration_both_processors_working(
-    rewrite_service: RewriteService,
-    tmp_path: Path,
-    create_test_files: Callable[[str, Path], Path],
-) -> None:
+def test_integration_both_processors_working(rewrite_service: RewriteService) -> None:
     """Test both MetadataProcessor and ImageProcessor work together."""
-    # Create NFO file
-    nfo_path = create_test_files("tvshow.nfo", tmp_path / "tvshow.nfo")
+    # NFO file
+    nfo_path = _MEDIA_DIR / "tvshow.nfo"
 
-    # Create poster file
-    poster_path = tmp_path / "poster.jpg"
-    poster_path.write_bytes(b"fake image")
+    # Poster file
+    poster_path = _MEDIA_DIR / "poster.jpg"
 
     with (
         patch.object(
@@ -368,15 +378,14 @@ def test_integration_both_processors_working(
 
 
 def test_image_processing_skipped_when_disabled(
-    rewrite_service: RewriteService, tmp_path: Path
+    rewrite_service: RewriteService,
 ) -> None:
     """When enable_image_rewrite is False, image files should be skipped."""
     # Disable image rewriting
     rewrite_service.settings.enable_image_rewrite = False
 
-    # Create a rewritable image file (poster)
-    poster_path = tmp_path / "poster.jpg"
-    poster_path.write_bytes(b"fake image")
+    # A rewritable image file (poster)
+    poster_path = _MEDIA_DIR / "poster.jpg"
 
     with (
         patch.object(rewrite_service.image_processor, "process") as mock_image_process,
@@ -396,16 +405,13 @@ def test_image_processing_skipped_when_disabled(
         assert "disabled" in result.message
 
 
-def test_nfo_processing_skipped_when_disabled(
-    rewrite_service: RewriteService, tmp_path: Path
-) -> None:
+def test_nfo_processing_skipped_when_disabled(rewrite_service: RewriteService) -> None:
     """When enable_nfo_rewrite is False, NFO files should be skipped."""
     # Disable NFO rewriting
     rewrite_service.settings.enable_nfo_rewrite = False
 
-    # Create an NFO file
-    nfo_path = tmp_path / "tvshow.nfo"
-    nfo_path.write_text("<tvshow></tvshow>")
+    # An NFO file
+    nfo_path = _MEDIA_DIR / "tvshow.nfo"
 
     with (
         patch.object(rewrite_service.metadata_processor, "process_file") as mock_meta,
@@ -1,14 +1,54 @@
 """Unit tests for rollback service."""
 
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
 from sonarr_metadata_rewrite.backup_utils import create_backup
 from sonarr_metadata_rewrite.rollback_service import RollbackService
-from tests.conftest import SAMPLE_MULTI_EPISODE_NFO, create_test_settings
+from tests.conftest import (
+    SAMPLE_MULTI_EPISODE_NFO,
+    assert_file_content,
+    assert_logged,
+    create_empty_file,
+    create_test_settings,
+    make_tree,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RollbackEnv:
+    """Rollback service wired to backup and media directories."""
+
+    service: RollbackService
+    backup_dir: Path
+    original_dir: Path
+
+
+@pytest.fixture
+def rollback_env(request: pytest.FixtureRequest, test_data_dir: Path) -> RollbackEnv:
+    """Rollback service over ``media`` with backups in ``backups``.
+
+    Neither directory is created. Parametrize indirectly with a dict to
+    override ``backup_dir`` or ``original_dir`` (paths relative to the test data
+    directory), or set ``configure_backup_dir`` to False to leave the backup
+    directory out of the settings.
+    """
+    params = getattr(request, "param", {})
+    backup_dir = test_data_dir / params.get("backup_dir", "backups")
+    original_dir = test_data_dir / params.get("original_dir", "media")
+    settings = create_test_settings(
+        test_data_dir,
+        service_mode="rollback",
+        rewrite_root_dirs=[original_dir],
+        original_files_backup_dir=(
+            backup_dir if params.get("configure_backup_dir", True) else None
+        ),
+    )
+    return RollbackEnv(RollbackService(settings), backup_dir, original_dir)
 
 
 def _make_backup(original_file: Path, backup_dir: Path) -> None:
@@ -20,495 +60,314 @@ def _make_backup(original_file: Path, backup_dir: Path) -> None:
     create_backup(original_file, backup_dir)
 
 
-def _rollback_service(test_data_dir: Path, backup_dir: Path) -> RollbackService:
-    """Create rollback service for media below test data directory."""
-    return RollbackService(
-        create_test_settings(
-            test_data_dir,
-            service_mode="rollback",
-            rewrite_root_dirs=[test_data_dir / "media"],
-            original_files_backup_dir=backup_dir,
-        )
-    )
-
-
-def test_rollback_service_init(test_data_dir: Path) -> None:
+def test_rollback_service_init(rollback_env: RollbackEnv) -> None:
     """Test RollbackService initialization."""
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-    )
-    service = RollbackService(settings)
-    assert service.settings == settings
+    settings = rollback_env.service.settings
+    assert settings.original_files_backup_dir == rollback_env.backup_dir
+    assert settings.rewrite_root_dirs == [rollback_env.original_dir]
 
 
-def test_execute_rollback_no_backup_dir_configured(test_data_dir: Path) -> None:
+@pytest.mark.parametrize(
+    "rollback_env", [{"configure_backup_dir": False}], indirect=True
+)
+def test_execute_rollback_no_backup_dir_configured(rollback_env: RollbackEnv) -> None:
     """Test rollback fails when backup directory is not configured."""
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        original_files_backup_dir=None,
-    )
-    service = RollbackService(settings)
-
     with pytest.raises(ValueError, match="Backup directory is not configured"):
-        service.execute_rollback()
+        rollback_env.service.execute_rollback()
 
 
+@pytest.mark.parametrize(
+    "rollback_env", [{"backup_dir": "nonexistent_backups"}], indirect=True
+)
 def test_execute_rollback_backup_dir_not_exists(
-    test_data_dir: Path, caplog: pytest.LogCaptureFixture
+    rollback_env: RollbackEnv, caplog: pytest.LogCaptureFixture
 ) -> None:
     """Test rollback handles non-existent backup directory gracefully."""
-    backup_dir = test_data_dir / "nonexistent_backups"
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
-
     with caplog.at_level(logging.INFO):
-        service.execute_rollback()  # Should not raise exception
+        rollback_env.service.execute_rollback()  # Should not raise exception
 
-    assert "Backup directory does not exist" in caplog.text
-    assert "rollback completed with no files to restore" in caplog.text
+    assert_logged(
+        caplog,
+        "Backup directory does not exist",
+        "rollback completed with no files to restore",
+    )
 
 
+@pytest.mark.parametrize(
+    "rollback_env", [{"backup_dir": "empty_backups"}], indirect=True
+)
 def test_execute_rollback_no_backup_files(
-    test_data_dir: Path, caplog: pytest.LogCaptureFixture
+    rollback_env: RollbackEnv, caplog: pytest.LogCaptureFixture
 ) -> None:
     """Test rollback handles empty backup directory gracefully."""
-    backup_dir = test_data_dir / "empty_backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
+    rollback_env.backup_dir.mkdir()
 
     with caplog.at_level(logging.INFO):
-        service.execute_rollback()
+        rollback_env.service.execute_rollback()
 
-    assert "No backup files found" in caplog.text
-    assert "rollback completed with no files to restore" in caplog.text
+    assert_logged(
+        caplog, "No backup files found", "rollback completed with no files to restore"
+    )
 
 
 def test_execute_rollback_successful(
-    test_data_dir: Path, caplog: pytest.LogCaptureFixture
+    rollback_env: RollbackEnv, caplog: pytest.LogCaptureFixture
 ) -> None:
     """Test successful rollback of backup files."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media"
-    original_show_dir = original_dir / "Show1"
-    original_show_dir.mkdir(parents=True, exist_ok=True)
-    original_file = original_show_dir / "tvshow.nfo"
-    original_file.write_text("Original content")
+    (original_file,) = make_tree(
+        rollback_env.original_dir, {"Show1/tvshow.nfo": "Original content"}
+    )
 
     # Create backup at the correct absolute-path structure
-    _make_backup(original_file, backup_dir)
+    _make_backup(original_file, rollback_env.backup_dir)
 
-    # Simulate translation (overwrite original)
-    original_file.write_text("Translated content")
-
-    service = _rollback_service(test_data_dir, backup_dir)
+    # Simulate translation; rollback only has to restore the original bytes
+    create_empty_file(original_file)
 
     with caplog.at_level(logging.INFO):
-        service.execute_rollback()
+        rollback_env.service.execute_rollback()
 
     # Verify file was restored
-    assert original_file.read_text() == "Original content"
-    assert "Found 1 backup files to restore" in caplog.text
-    assert "Rollback completed: 1 files restored, 0 failed" in caplog.text
-    assert "✅ Restored:" in caplog.text
-    assert "tvshow.nfo" in caplog.text
+    assert_file_content(original_file, "Original content")
+    assert_logged(
+        caplog,
+        "Found 1 backup files to restore",
+        "Rollback completed: 1 files restored, 0 failed",
+        "✅ Restored:",
+        "tvshow.nfo",
+    )
 
 
 def test_execute_rollback_missing_original_directory(
-    test_data_dir: Path, caplog: pytest.LogCaptureFixture
+    rollback_env: RollbackEnv, caplog: pytest.LogCaptureFixture
 ) -> None:
     """Test rollback handles missing original directories gracefully."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media"
-    deleted_show_dir = original_dir / "DeletedShow"
-    deleted_show_dir.mkdir(parents=True, exist_ok=True)
-    original_file = deleted_show_dir / "tvshow.nfo"
-    original_file.write_text("Original content")
+    (original_file,) = make_tree(
+        rollback_env.original_dir, {"DeletedShow/tvshow.nfo": "Original content"}
+    )
 
     # Create backup before the directory is deleted
-    _make_backup(original_file, backup_dir)
+    _make_backup(original_file, rollback_env.backup_dir)
 
     # Simulate the show being deleted
     original_file.unlink()
-    deleted_show_dir.rmdir()
-
-    service = _rollback_service(test_data_dir, backup_dir)
+    original_file.parent.rmdir()
 
     with caplog.at_level(logging.INFO):
-        service.execute_rollback()
+        rollback_env.service.execute_rollback()
 
-    assert "Original directory no longer exists, skipping" in caplog.text
-    assert "Rollback completed: 0 files restored, 1 failed" in caplog.text
+    assert_logged(
+        caplog,
+        "Original directory no longer exists, skipping",
+        "Rollback completed: 0 files restored, 1 failed",
+    )
 
 
-def test_restore_single_file_success(test_data_dir: Path) -> None:
+def test_restore_single_file_success(rollback_env: RollbackEnv) -> None:
     """Test successful restoration of a single file."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media"
-    original_show_dir = original_dir / "Show1"
-    original_show_dir.mkdir(parents=True, exist_ok=True)
-    original_file = original_show_dir / "tvshow.nfo"
-    original_file.write_text("Original content")
+    backup_dir = rollback_env.backup_dir
+    (original_file,) = make_tree(
+        rollback_env.original_dir, {"Show1/tvshow.nfo": "Original content"}
+    )
 
     _make_backup(original_file, backup_dir)
 
     # Simulate translation
-    original_file.write_text("Translated content")
+    create_empty_file(original_file)
 
     # Derive the backup file path the same way create_backup would
     backup_file = backup_dir / original_file.relative_to("/")
 
-    service = _rollback_service(test_data_dir, backup_dir)
-
-    result = service._restore_single_file(backup_file)
+    result = rollback_env.service._restore_single_file(backup_file)
 
     assert result is True
-    assert original_file.read_text() == "Original content"
+    assert_file_content(original_file, "Original content")
 
 
-def test_restore_single_file_missing_directory(test_data_dir: Path) -> None:
+def test_restore_single_file_missing_directory(rollback_env: RollbackEnv) -> None:
     """Test restoration fails gracefully when original directory is missing."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media"
-    deleted_show_dir = original_dir / "DeletedShow"
-    deleted_show_dir.mkdir(parents=True, exist_ok=True)
-    original_file = deleted_show_dir / "tvshow.nfo"
-    original_file.write_text("Original content")
+    backup_dir = rollback_env.backup_dir
+    (original_file,) = make_tree(
+        rollback_env.original_dir, {"DeletedShow/tvshow.nfo": "Original content"}
+    )
 
     _make_backup(original_file, backup_dir)
     backup_file = backup_dir / original_file.relative_to("/")
 
     # Delete the show directory (simulate deletion)
     original_file.unlink()
-    deleted_show_dir.rmdir()
+    original_file.parent.rmdir()
 
-    service = _rollback_service(test_data_dir, backup_dir)
-
-    result = service._restore_single_file(backup_file)
+    result = rollback_env.service._restore_single_file(backup_file)
 
     assert result is False
 
 
-@patch("time.sleep")
-def test_hang_after_completion_keyboard_interrupt(mock_sleep: Mock) -> None:
-    """Test hang_after_completion handles KeyboardInterrupt gracefully."""
-    test_data_dir = Path("/tmp")
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-    )
-    service = RollbackService(settings)
-
-    # Simulate KeyboardInterrupt after first sleep
-    mock_sleep.side_effect = KeyboardInterrupt()
-
-    # Should not raise exception
-    service.hang_after_completion()
-
-    mock_sleep.assert_called_once_with(60)
-
-
-@patch("time.sleep")
-def test_hang_after_completion_runs_indefinitely(mock_sleep: Mock) -> None:
-    """Test hang_after_completion runs indefinitely without interruption."""
-    test_data_dir = Path("/tmp")
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-    )
-    service = RollbackService(settings)
-
-    # Simulate multiple sleep calls before raising interrupt to stop
-    mock_sleep.side_effect = [None, None, KeyboardInterrupt()]
-
-    service.hang_after_completion()
-
-    assert mock_sleep.call_count == 3
-
-
-# Image-specific rollback tests
-
-
-def test_restore_image_with_extension_change(test_data_dir: Path) -> None:
-    """Test rollback handles extension changes (backup.png, current.jpg)."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media"
-    original_show_dir = original_dir / "Show1"
-    original_show_dir.mkdir(parents=True, exist_ok=True)
-
-    # Original poster was .png; create and back it up
-    original_poster = original_show_dir / "poster.png"
-    original_poster.write_bytes(b"PNG image data")
-    _make_backup(original_poster, backup_dir)
-
-    # Simulate rewrite: original is replaced with .jpg variant
-    original_poster.unlink()
-    current_file = original_show_dir / "poster.jpg"
-    current_file.write_bytes(b"JPEG image data")
-
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        rewrite_root_dirs=[original_dir],
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
-
-    service.execute_rollback()
-
-    # .jpg should be removed, .png should be restored
-    assert not current_file.exists()
-    restored_file = original_show_dir / "poster.png"
-    assert restored_file.exists()
-    assert restored_file.read_bytes() == b"PNG image data"
-
+def _interrupting_sleep(
+    monkeypatch: pytest.MonkeyPatch, interrupt_on_call: int
+) -> list[float]:
+    """Replace time.sleep with a recorder that interrupts on the given call.
 
-def test_restore_removes_all_extension_variants(test_data_dir: Path) -> None:
-    """Test rollback removes all image extension variants."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media"
-    original_show_dir = original_dir / "Show1"
-    original_show_dir.mkdir(parents=True, exist_ok=True)
-
-    # Original clearlogo was .png; create and back it up
-    original_logo = original_show_dir / "clearlogo.png"
-    original_logo.write_bytes(b"Original PNG logo")
-    _make_backup(original_logo, backup_dir)
-    original_logo.unlink()
+    Returns:
+        The list of requested sleep durations, filled as the fake is called
+    """
+    durations: list[float] = []
 
-    # Current directory contains multiple extension variants
-    (original_show_dir / "clearlogo.jpg").write_bytes(b"JPEG logo 1")
-    (original_show_dir / "clearlogo.jpeg").write_bytes(b"JPEG logo 2")
+    def fake_sleep(seconds: float) -> None:
+        durations.append(seconds)
+        if len(durations) == interrupt_on_call:
+            raise KeyboardInterrupt
 
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        rewrite_root_dirs=[original_dir],
-        original_files_backup_dir=backup_dir,
+    monkeypatch.setattr(
+        "sonarr_metadata_rewrite.rollback_service.time.sleep", fake_sleep
     )
-    service = RollbackService(settings)
-
-    service.execute_rollback()
+    return durations
 
-    assert not (original_show_dir / "clearlogo.jpg").exists()
-    assert not (original_show_dir / "clearlogo.jpeg").exists()
-    restored_file = original_show_dir / "clearlogo.png"
-    assert restored_file.exists()
-    assert restored_file.read_bytes() == b"Original PNG logo"
 
+def test_hang_after_completion_keyboard_interrupt(
+    rollback_env: RollbackEnv, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test hang_after_completion handles KeyboardInterrupt gracefully."""
+    # Simulate KeyboardInterrupt during the first sleep
+    durations = _interrupting_sleep(monkeypatch, interrupt_on_call=1)
 
-def test_restore_both_nfo_and_images(test_data_dir: Path) -> None:
-    """Test rollback restores both NFO files and image files."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
+    # Should not raise exception
+    rollback_env.service.hang_after_completion()
 
-    original_dir = test_data_dir / "media"
-    original_show_dir = original_dir / "Show1"
-    original_show_dir.mkdir(parents=True, exist_ok=True)
+    assert durations == [60]
 
-    # Create originals and back them up
-    original_nfo = original_show_dir / "tvshow.nfo"
-    original_nfo.write_text("Original NFO")
-    _make_backup(original_nfo, backup_dir)
 
-    original_poster = original_show_dir / "poster.jpg"
-    original_poster.write_bytes(b"Original poster")
-    _make_backup(original_poster, backup_dir)
+def test_hang_after_completion_runs_indefinitely(
+    rollback_env: RollbackEnv, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test hang_after_completion runs indefinitely without interruption."""
+    # Let two sleeps complete before raising interrupt to stop
+    durations = _interrupting_sleep(monkeypatch, interrupt_on_call=3)
 
-    # Simulate translation (overwrite with translated versions and extension change)
-    original_nfo.write_text("Translated NFO")
-    original_poster.unlink()
-    (original_show_dir / "poster.png").write_bytes(b"Translated poster")
+    rollback_env.service.hang_after_completion()
 
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        rewrite_root_dirs=[original_dir],
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
+    assert len(durations) == 3
 
-    service.execute_rollback()
 
-    assert original_nfo.read_text() == "Original NFO"
-    assert not (original_show_dir / "poster.png").exists()
-    restored_poster = original_show_dir / "poster.jpg"
-    assert restored_poster.exists()
-    assert restored_poster.read_bytes() == b"Original poster"
+# Image-specific rollback tests
 
 
-def test_restore_mixed_backup_directory(
-    test_data_dir: Path, caplog: pytest.LogCaptureFixture
+@pytest.mark.parametrize(
+    ("originals", "current"),
+    [
+        pytest.param(
+            {"Show1/poster.png": b"PNG image data"},
+            {"Show1/poster.jpg": b"JPEG image data"},
+            id="extension-change",
+        ),
+        pytest.param(
+            {"Show1/clearlogo.png": b"Original PNG logo"},
+            {
+                "Show1/clearlogo.jpg": b"JPEG logo 1",
+                "Show1/clearlogo.jpeg": b"JPEG logo 2",
+            },
+            id="all-extension-variants",
+        ),
+        pytest.param(
+            {
+                "Show1/tvshow.nfo": "Original NFO",
+                "Show1/poster.jpg": b"Original poster",
+            },
+            {"Show1/tvshow.nfo": "Translated NFO", "Show1/poster.png": b"Translated"},
+            id="nfo-and-image",
+        ),
+        pytest.param(
+            {
+                "Show1/tvshow.nfo": "NFO 1",
+                "Show2/tvshow.nfo": "NFO 2",
+                "Show1/poster.jpg": b"Poster 1",
+                "Show1/clearlogo.png": b"Logo 1",
+            },
+            {
+                "Show1/tvshow.nfo": b"translated",
+                "Show2/tvshow.nfo": b"translated",
+                "Show1/poster.jpg": b"translated",
+                "Show1/clearlogo.png": b"translated",
+            },
+            id="mixed-shows",
+        ),
+        pytest.param(
+            {"Show1/poster.png": b"Original PNG"},
+            {"Show1/poster.JPG": b"Modified JPEG"},
+            id="case-insensitive-extension",
+        ),
+    ],
+)
+def test_image_rollback(
+    rollback_env: RollbackEnv,
+    caplog: pytest.LogCaptureFixture,
+    originals: dict[str, str | bytes],
+    current: dict[str, str | bytes],
 ) -> None:
-    """Test rollback handles mixed NFO and image files."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media"
-
-    show1_orig = original_dir / "Show1"
-    show1_orig.mkdir(parents=True, exist_ok=True)
-    show2_orig = original_dir / "Show2"
-    show2_orig.mkdir(parents=True, exist_ok=True)
-
-    # Create originals and back them up
-    files_to_backup = [
-        (show1_orig / "tvshow.nfo", "NFO 1"),
-        (show2_orig / "tvshow.nfo", "NFO 2"),
-    ]
-    binary_files = [
-        (show1_orig / "poster.jpg", b"Poster 1"),
-        (show1_orig / "clearlogo.png", b"Logo 1"),
-    ]
-    for file_path, content in files_to_backup:
-        file_path.write_text(content)
-        _make_backup(file_path, backup_dir)
-        file_path.write_text("translated")
-
-    for file_path, bin_content in binary_files:
-        file_path.write_bytes(bin_content)
-        _make_backup(file_path, backup_dir)
-        file_path.write_bytes(b"translated")
+    """Test rollback restores backed-up originals and removes rewritten variants.
 
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        rewrite_root_dirs=[original_dir],
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
+    Originals are backed up and deleted, then the rewritten ``current`` files
+    are written in their place, possibly under another image extension.
+    """
+    # Keep the joined paths from setup and reuse them in the assertions
+    original_files = make_tree(rollback_env.original_dir, originals)
+    for original_file in original_files:
+        _make_backup(original_file, rollback_env.backup_dir)
+        original_file.unlink()
+    current_files = make_tree(rollback_env.original_dir, current)
 
     with caplog.at_level(logging.INFO):
-        service.execute_rollback()
-
-    assert (show1_orig / "tvshow.nfo").read_text() == "NFO 1"
-    assert (show1_orig / "poster.jpg").read_bytes() == b"Poster 1"
-    assert (show1_orig / "clearlogo.png").read_bytes() == b"Logo 1"
-    assert (show2_orig / "tvshow.nfo").read_text() == "NFO 2"
-
-    assert "4 files restored" in caplog.text
-
-
-def test_restore_case_insensitive_extensions(test_data_dir: Path) -> None:
-    """Test rollback handles case-insensitive extension matching."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media"
-    original_show_dir = original_dir / "Show1"
-    original_show_dir.mkdir(parents=True, exist_ok=True)
+        rollback_env.service.execute_rollback()
 
-    # Original was .png; back it up
-    original_poster = original_show_dir / "poster.png"
-    original_poster.write_bytes(b"Original PNG")
-    _make_backup(original_poster, backup_dir)
-    original_poster.unlink()
-
-    # Simulate extension change to uppercase .JPG
-    current_file = original_show_dir / "poster.JPG"
-    current_file.write_bytes(b"Modified JPEG")
-
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        rewrite_root_dirs=[original_dir],
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
-
-    service.execute_rollback()
-
-    assert not current_file.exists()
-    restored_file = original_show_dir / "poster.png"
-    assert restored_file.exists()
-    assert restored_file.read_bytes() == b"Original PNG"
+    for original_file, content in zip(original_files, originals.values(), strict=True):
+        assert_file_content(original_file, content)
+    for replaced_file in set(current_files).difference(original_files):
+        assert not replaced_file.exists()
+    assert_logged(caplog, f"{len(originals)} files restored, 0 failed")
 
 
 def test_restore_single_file_when_backup_parent_not_exists(
-    test_data_dir: Path,
+    rollback_env: RollbackEnv,
 ) -> None:
     """Test restore when original parent directory doesn't exist."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir()
-
-    original_dir = test_data_dir / "media"
-    deleted_show_dir = original_dir / "show"
-    deleted_show_dir.mkdir(parents=True, exist_ok=True)
-    original_file = deleted_show_dir / "poster.jpg"
-    original_file.write_bytes(b"Original")
+    backup_dir = rollback_env.backup_dir
+    (original_file,) = make_tree(
+        rollback_env.original_dir, {"show/poster.jpg": b"Original"}
+    )
     _make_backup(original_file, backup_dir)
 
     backup_file = backup_dir / original_file.relative_to("/")
 
     # Remove the original directory
     original_file.unlink()
-    deleted_show_dir.rmdir()
-
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
+    original_file.parent.rmdir()
 
     # Don't create the parent directory in rewrite_root_dir
-    result = service._restore_single_file(backup_file)
+    result = rollback_env.service._restore_single_file(backup_file)
 
     assert result is False
 
 
-def test_execute_rollback_with_no_backup_files(test_data_dir: Path) -> None:
+@pytest.mark.parametrize(
+    "rollback_env", [{"backup_dir": "empty_backups"}], indirect=True
+)
+def test_execute_rollback_with_no_backup_files(rollback_env: RollbackEnv) -> None:
     """Test rollback when backup directory exists but is empty."""
-    backup_dir = test_data_dir / "empty_backups"
-    backup_dir.mkdir()
-
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
+    rollback_env.backup_dir.mkdir()
 
     # Should not raise
-    service.execute_rollback()
+    rollback_env.service.execute_rollback()
 
 
-def test_execute_rollback_restores_multi_episode_nfo(test_data_dir: Path) -> None:
+def test_execute_rollback_restores_multi_episode_nfo(
+    rollback_env: RollbackEnv,
+) -> None:
     """Test rollback restores Sonarr-style multi-episode NFO content."""
-    backup_dir = test_data_dir / "backups"
-    original_dir = test_data_dir / "media"
-    backup_dir.mkdir(parents=True, exist_ok=True)
-    original_dir.mkdir(parents=True, exist_ok=True)
-
-    episode_dir = original_dir / "Breaking Bad" / "Season 01"
-    episode_dir.mkdir(parents=True, exist_ok=True)
-    original_file = episode_dir / "episodes.nfo"
-    original_content = SAMPLE_MULTI_EPISODE_NFO
-    original_file.write_text(original_content, encoding="utf-8")
-    _make_backup(original_file, backup_dir)
+    (original_file,) = make_tree(
+        rollback_env.original_dir,
+        {"Breaking Bad/Season 01/episodes.nfo": SAMPLE_MULTI_EPISODE_NFO},
+    )
+    _make_backup(original_file, rollback_env.backup_dir)
 
     # Simulate translation
     original_file.write_text(
@@ -529,15 +388,7 @@ def test_execute_rollback_restores_multi_episode_nfo(test_data_dir: Path) -> Non
         encoding="utf-8",
     )
 
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        rewrite_root_dirs=[original_dir],
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
-
-    service.execute_rollback()
+    rollback_env.service.execute_rollback()
 
     restored_content = original_file.read_text(encoding="utf-8")
     assert "Pilot" in restored_content
@@ -550,7 +401,8 @@ def test_execute_rollback_restores_multi_episode_nfo(test_data_dir: Path) -> Non
 # ---------------------------------------------------------------------------
 
 
-def test_rollback_restores_legacy_format_backup(test_data_dir: Path) -> None:
+@pytest.mark.parametrize("rollback_env", [{"original_dir": "media/tv"}], indirect=True)
+def test_rollback_restores_legacy_format_backup(rollback_env: RollbackEnv) -> None:
     """Rollback correctly restores a file whose backup is in the legacy format.
 
     The legacy format stores the backup relative to the root dir, e.g.:
@@ -558,58 +410,31 @@ def test_rollback_restores_legacy_format_backup(test_data_dir: Path) -> None:
     rather than the new absolute-path format:
         <BACKUP_DIR>/tv/Show A/tvshow.nfo
     """
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media" / "tv"
-    show_dir = original_dir / "Show A"
-    show_dir.mkdir(parents=True, exist_ok=True)
-    original_file = show_dir / "tvshow.nfo"
-    original_file.write_text("Translated content")
-
     # Place backup in the OLD (legacy) format: relative to root_dir
-    legacy_backup = backup_dir / "Show A" / "tvshow.nfo"
-    legacy_backup.parent.mkdir(parents=True, exist_ok=True)
-    legacy_backup.write_text("Original content")
-
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        rewrite_root_dirs=[original_dir],
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
+    (original_file,) = make_tree(rollback_env.original_dir, {"Show A/tvshow.nfo": b""})
+    make_tree(rollback_env.backup_dir, {"Show A/tvshow.nfo": "Original content"})
 
-    service.execute_rollback()
+    rollback_env.service.execute_rollback()
 
-    assert original_file.read_text() == "Original content"
+    assert_file_content(original_file, "Original content")
 
 
 def test_restore_single_file_no_backup_found(
-    test_data_dir: Path, caplog: pytest.LogCaptureFixture
+    rollback_env: RollbackEnv, caplog: pytest.LogCaptureFixture
 ) -> None:
     """_restore_single_file returns False and logs a warning when no backup exists.
 
     Exercises the warning at line 132.
     """
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media" / "show"
-    original_dir.mkdir(parents=True, exist_ok=True)
-
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
+    original_dir = rollback_env.original_dir / "show"
+    original_dir.mkdir(parents=True)
 
     # Create a fake backup file path (exists in backup dir) but restore returns
     # False to exercise the warning path.
-    fake_backup = backup_dir / original_dir.relative_to("/") / "tvshow.nfo"
-    fake_backup.parent.mkdir(parents=True, exist_ok=True)
-    fake_backup.write_text("backup content")
+    (fake_backup,) = make_tree(
+        rollback_env.backup_dir,
+        {f"{original_dir.relative_to('/')}/tvshow.nfo": "backup content"},
+    )
 
     # The original file's parent directory does exist so new-format path is tried;
     # restore_from_backup will find the backup and succeed.  To reach the "no backup"
@@ -622,62 +447,39 @@ def test_restore_single_file_no_backup_found(
         ),
         caplog.at_level(logging.WARNING),
     ):
-        result = service._restore_single_file(fake_backup)
+        result = rollback_env.service._restore_single_file(fake_backup)
 
     assert result is False
-    assert "No backup found" in caplog.text
+    assert_logged(caplog, "No backup found")
 
 
 def test_restore_single_file_exception_is_caught(
-    test_data_dir: Path, caplog: pytest.LogCaptureFixture
+    rollback_env: RollbackEnv, test_data_dir: Path, caplog: pytest.LogCaptureFixture
 ) -> None:
     """_restore_single_file catches unexpected exceptions and returns False.
 
     Exercises the outer exception handler at lines 136-138.
     """
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
+    rollback_env.backup_dir.mkdir()
 
     # A backup file that is NOT under backup_dir causes ValueError in relative_to(),
     # which is caught by the outer exception handler in _restore_single_file.
-    backup_file_outside = test_data_dir / "other" / "tvshow.nfo"
-    backup_file_outside.parent.mkdir(parents=True, exist_ok=True)
-    backup_file_outside.write_text("content")
+    (backup_file_outside,) = make_tree(test_data_dir, {"other/tvshow.nfo": "content"})
 
     with caplog.at_level(logging.ERROR):
-        result = service._restore_single_file(backup_file_outside)
+        result = rollback_env.service._restore_single_file(backup_file_outside)
 
     assert result is False
-    assert "Failed to restore" in caplog.text
+    assert_logged(caplog, "Failed to restore")
 
 
 def test_execute_rollback_counts_exception_as_failure(
-    test_data_dir: Path, caplog: pytest.LogCaptureFixture
+    rollback_env: RollbackEnv, caplog: pytest.LogCaptureFixture
 ) -> None:
     """execute_rollback counts files that raise exceptions as failures (lines 65-67)."""
-    backup_dir = test_data_dir / "backups"
-    backup_dir.mkdir(exist_ok=True)
-
-    original_dir = test_data_dir / "media" / "show"
-    original_dir.mkdir(parents=True, exist_ok=True)
-
-    original_file = original_dir / "tvshow.nfo"
-    original_file.write_text("Translated content")
-    _make_backup(original_file, backup_dir)
-
-    settings = create_test_settings(
-        test_data_dir,
-        service_mode="rollback",
-        original_files_backup_dir=backup_dir,
-    )
-    service = RollbackService(settings)
+    service = rollback_env.service
+    (original_file,) = make_tree(rollback_env.original_dir, {"show/tvshow.nfo": b""})
+    _make_backup(original_file, rollback_env.backup_dir)
 
     with (
         patch.object(
@@ -689,4 +491,4 @@ def test_execute_rollback_counts_exception_as_failure(
     ):
         service.execute_rollback()
 
-    assert "1 failed" in caplog.text
+    assert_logged(caplog, "1 failed")
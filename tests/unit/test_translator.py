@@ -4,7 +4,7 @@ import json
 from collections.abc import Generator
 from types import SimpleNamespace
 from typing import Any
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, call
 
 import httpx
 import pytest
@@ -13,6 +13,9 @@ from diskcache import Cache  # type: ignore[import-untyped]
 from sonarr_metadata_rewrite.config import Settings
 from sonarr_metadata_rewrite.models import TmdbIds, TranslatedString
 from sonarr_metadata_rewrite.translator import Translator
+from tests.conftest import create_test_settings
+
+_TMDB_REQUEST = httpx.Request("GET", "https://api.themoviedb.org/3")
 
 
 def mock_not_found_error() -> httpx.HTTPStatusError:
@@ -21,24 +24,56 @@ def mock_not_found_error() -> httpx.HTTPStatusError:
     return httpx.HTTPStatusError("Not Found", request=Mock(), response=response)
 
 
+def json_response(payload: Any) -> httpx.Response:
+    """Create a successful TMDB JSON response.
+
+    A real response is cheaper to build than a Mock and behaves like the client's.
+    """
+    return httpx.Response(httpx.codes.OK, json=payload, request=_TMDB_REQUEST)
+
+
 def configure_image_response(mock_get: Mock, response: dict[str, Any]) -> None:
     """Configure a successful image API response."""
-    mock_get.return_value.json.return_value = response
-    mock_get.return_value.raise_for_status = Mock()
+    mock_get.return_value = json_response(response)
 
 
-@pytest.fixture
-def translator(test_settings: Settings) -> Generator[Translator]:
-    """Create translator instance."""
-    cache = Cache(str(test_settings.cache_dir))
-    translator = Translator(test_settings, cache)
-    # Clear the cache to ensure clean tests
-    translator.cache.clear()
+@pytest.fixture(scope="module")
+def shared_translator(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Generator[Translator]:
+    """Create one translator (disk cache, HTTP client) per module."""
+    settings = create_test_settings(tmp_path_factory.mktemp("translator"))
+    cache = Cache(str(settings.cache_dir))
+    translator = Translator(settings, cache)
     yield translator
     translator.close()
     cache.close()
 
 
+@pytest.fixture
+def translator(shared_translator: Translator) -> Translator:
+    """Shared translator with an empty cache for each test."""
+    # Clear the cache to ensure clean tests
+    shared_translator.cache.clear()
+    return shared_translator
+
+
+@pytest.fixture
+def mock_get(translator: Translator, monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Stand-in for the shared translator's HTTP client GET."""
+    get = Mock()
+    monkeypatch.setattr(translator.client, "get", get)
+    return get
+
+
+@pytest.fixture
+def mock_sleep(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Stand-in for the retry backoff sleep."""
+    sleep = Mock()
+    monkeypatch.setattr("sonarr_metadata_rewrite.translator.time.sleep", sleep)
+    return sleep
+
+
 @pytest.fixture
 def mock_series_response() -> dict[str, Any]:
     """Mock TMDB series translations API response."""
@@ -144,15 +179,12 @@ def test_tmdb_ids_string_representation() -> None:
     assert str(episode_ids) == "tv/12345/season/1/episode/2"
 
 
-@patch("httpx.Client.get")
 def test_get_translations_series_success(
     mock_get: Mock, translator: Translator, mock_series_response: dict[str, Any]
 ) -> None:
     """Test successful series translations retrieval."""
     # Mock successful HTTP response
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = mock_series_response
+    mock_response = json_response(mock_series_response)
     mock_get.return_value = mock_response
 
     tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv")
@@ -191,15 +223,12 @@ def test_get_translations_series_success(
     assert ja.description.language == "ja"
 
 
-@patch("httpx.Client.get")
 def test_get_translations_episode_success(
     mock_get: Mock, translator: Translator, mock_episode_response: dict[str, Any]
 ) -> None:
     """Test successful episode translations retrieval."""
     # Mock successful HTTP response
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = mock_episode_response
+    mock_response = json_response(mock_episode_response)
     mock_get.return_value = mock_response
 
     tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv", season=1, episode=2)
@@ -222,26 +251,25 @@ def test_get_translations_episode_success(
     assert zh_cn.description.language == "zh-CN"
 
 
-@patch("httpx.Client.get")
 def test_get_translations_movie_uses_movie_path_and_title(
     mock_get: Mock, translator: Translator
 ) -> None:
     """Test movie translations use movie endpoint and data.title."""
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {
-        "translations": [
-            {
-                "iso_639_1": "zh",
-                "iso_3166_1": "CN",
-                "data": {
-                    "title": "电影标题",
-                    "overview": "电影剧情",
-                    "tagline": "电影宣传语",
-                },
-            }
-        ]
-    }
+    mock_response = json_response(
+        {
+            "translations": [
+                {
+                    "iso_639_1": "zh",
+                    "iso_3166_1": "CN",
+                    "data": {
+                        "title": "电影标题",
+                        "overview": "电影剧情",
+                        "tagline": "电影宣传语",
+                    },
+                }
+            ]
+        }
+    )
     mock_get.return_value = mock_response
 
     translations = translator.get_translations(TmdbIds(tmdb_id=550, media_type="movie"))
@@ -272,7 +300,6 @@ def test_get_translations_keeps_tagline_only_record(translator: Translator) -> N
     assert translations["zh-CN"].tagline.content == "命运由你掌握。"
 
 
-@patch("httpx.Client.get")
 def test_get_translations_http_error(mock_get: Mock, translator: Translator) -> None:
     """Test HTTP error handling."""
     # Mock HTTP error
@@ -285,7 +312,6 @@ def test_get_translations_http_error(mock_get: Mock, translator: Translator) ->
         translator.get_translations(tmdb_ids)
 
 
-@patch("httpx.Client.get")
 def test_get_translations_json_decode_error(
     mock_get: Mock, translator: Translator
 ) -> None:
@@ -303,15 +329,12 @@ def test_get_translations_json_decode_error(
         translator.get_translations(tmdb_ids)
 
 
-@patch("httpx.Client.get")
 def test_get_translations_empty_response(
     mock_get: Mock, translator: Translator
 ) -> None:
     """Test handling of empty translations response."""
     # Mock response with no translations
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {"id": 12345, "translations": []}
+    mock_response = json_response({"id": 12345, "translations": []})
     mock_get.return_value = mock_response
 
     tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv")
@@ -322,29 +345,28 @@ def test_get_translations_empty_response(
     assert len(translations) == 0
 
 
-@patch("httpx.Client.get")
 def test_get_translations_filters_empty_data(
     mock_get: Mock, translator: Translator
 ) -> None:
     """Test filtering of translations with empty title and description."""
     # Mock response with empty data
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {
-        "id": 12345,
-        "translations": [
-            {
-                "iso_639_1": "zh",
-                "iso_3166_1": "CN",
-                "data": {"name": "", "overview": ""},
-            },
-            {
-                "iso_639_1": "en",
-                "iso_3166_1": "US",
-                "data": {"name": "Valid Title", "overview": ""},
-            },
-        ],
-    }
+    mock_response = json_response(
+        {
+            "id": 12345,
+            "translations": [
+                {
+                    "iso_639_1": "zh",
+                    "iso_3166_1": "CN",
+                    "data": {"name": "", "overview": ""},
+                },
+                {
+                    "iso_639_1": "en",
+                    "iso_3166_1": "US",
+                    "data": {"name": "Valid Title", "overview": ""},
+                },
+            ],
+        }
+    )
     mock_get.return_value = mock_response
 
     tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv")
@@ -356,28 +378,27 @@ def test_get_translations_filters_empty_data(
     assert "zh-CN" not in translations
 
 
-@patch("httpx.Client.get")
 def test_get_translations_skips_entry_without_language_code(
     mock_get: Mock, translator: Translator
 ) -> None:
     """Test that translation entries with empty language code are skipped (line 150)."""
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {
-        "id": 12345,
-        "translations": [
-            {
-                "iso_639_1": "",
-                "iso_3166_1": "CN",
-                "data": {"name": "Some Title", "overview": "Some overview"},
-            },
-            {
-                "iso_639_1": "en",
-                "iso_3166_1": "US",
-                "data": {"name": "Valid Title", "overview": "Valid overview"},
-            },
-        ],
-    }
+    mock_response = json_response(
+        {
+            "id": 12345,
+            "translations": [
+                {
+                    "iso_639_1": "",
+                    "iso_3166_1": "CN",
+                    "data": {"name": "Some Title", "overview": "Some overview"},
+                },
+                {
+                    "iso_639_1": "en",
+                    "iso_3166_1": "US",
+                    "data": {"name": "Valid Title", "overview": "Valid overview"},
+                },
+            ],
+        }
+    )
     mock_get.return_value = mock_response
 
     tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv")
@@ -406,15 +427,12 @@ def test_response_cache_key_uses_httpx_serialized_url(translator: Translator) ->
     )
 
 
-@patch("httpx.Client.get")
 def test_caching_integration(
     mock_get: Mock, translator: Translator, mock_series_response: dict[str, Any]
 ) -> None:
     """Test that caching works with API calls."""
     # Mock successful HTTP response
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = mock_series_response
+    mock_response = json_response(mock_series_response)
     mock_get.return_value = mock_response
 
     tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv")
@@ -454,15 +472,12 @@ def test_close_method(test_settings: Settings) -> None:
     # Client should be closed after calling close()
 
 
-@patch("httpx.Client.get")
 def test_get_original_details_series_success(
     mock_get: Mock, translator: Translator, mock_series_details_response: dict[str, Any]
 ) -> None:
     """Test successful series original details retrieval."""
     # Mock successful HTTP response
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = mock_series_details_response
+    mock_response = json_response(mock_series_details_response)
     mock_get.return_value = mock_response
 
     tmdb_ids = TmdbIds(tmdb_id=68034, media_type="tv")
@@ -478,17 +493,16 @@ def test_get_original_details_series_success(
     assert original_title == "大明王朝1566"
 
 
-@patch("httpx.Client.get")
 def test_get_original_details_movie_uses_movie_title_fields(
     mock_get: Mock, translator: Translator
 ) -> None:
     """Test movie details use movie endpoint and original_title."""
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {
-        "original_language": "en",
-        "original_title": "Fight Club",
-    }
+    mock_response = json_response(
+        {
+            "original_language": "en",
+            "original_title": "Fight Club",
+        }
+    )
     mock_get.return_value = mock_response
 
     result = translator.get_original_details(TmdbIds(tmdb_id=550, media_type="movie"))
@@ -497,7 +511,6 @@ def test_get_original_details_movie_uses_movie_title_fields(
     assert result == ("en", "Fight Club")
 
 
-@patch("httpx.Client.get")
 def test_get_original_details_episode_success(
     mock_get: Mock,
     translator: Translator,
@@ -508,14 +521,12 @@ def test_get_original_details_episode_success(
 
     # Mock both episode and series responses (episode needs series for
     # original_language)
-    def mock_side_effect(endpoint: str, params: dict[str, Any] | None = None) -> Mock:
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
+    def mock_side_effect(
+        endpoint: str, params: dict[str, Any] | None = None
+    ) -> httpx.Response:
         if "season" in endpoint and "episode" in endpoint:
-            mock_response.json.return_value = mock_episode_details_response
-        else:
-            mock_response.json.return_value = mock_series_details_response
-        return mock_response
+            return json_response(mock_episode_details_response)
+        return json_response(mock_series_details_response)
 
     mock_get.side_effect = mock_side_effect
 
@@ -538,7 +549,6 @@ def test_get_original_details_episode_success(
     assert original_title == "Episode 1"  # From episode
 
 
-@patch("httpx.Client.get")
 def test_get_original_details_http_error(
     mock_get: Mock, translator: Translator
 ) -> None:
@@ -553,19 +563,18 @@ def test_get_original_details_http_error(
         translator.get_original_details(tmdb_ids)
 
 
-@patch("httpx.Client.get")
 def test_get_original_details_missing_data(
     mock_get: Mock, translator: Translator
 ) -> None:
     """Test handling of response with missing original language or title."""
     # Mock response with missing data
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = {
-        "id": 12345,
-        "name": "Some Title",
-        # Missing original_language and original_name
-    }
+    mock_response = json_response(
+        {
+            "id": 12345,
+            "name": "Some Title",
+            # Missing original_language and original_name
+        }
+    )
     mock_get.return_value = mock_response
 
     tmdb_ids = TmdbIds(tmdb_id=12345, media_type="tv")
@@ -575,15 +584,12 @@ def test_get_original_details_missing_data(
     assert result is None
 
 
-@patch("httpx.Client.get")
 def test_get_original_details_caching(
     mock_get: Mock, translator: Translator, mock_series_details_response: dict[str, Any]
 ) -> None:
     """Test that original details are cached properly."""
     # Mock successful HTTP response
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = mock_series_details_response
+    mock_response = json_response(mock_series_details_response)
     mock_get.return_value = mock_response
 
     tmdb_ids = TmdbIds(tmdb_id=68034, media_type="tv")
@@ -600,8 +606,6 @@ def test_get_original_details_caching(
     assert result1 == result2
 
 
-@patch("httpx.Client.get")
-@patch("time.sleep")
 def test_rate_limit_retry_success(
     mock_sleep: Mock,
     mock_get: Mock,
@@ -616,9 +620,7 @@ def test_rate_limit_retry_success(
         "Too Many Requests", request=Mock(), response=rate_limit_response
     )
 
-    success_response = Mock()
-    success_response.raise_for_status.return_value = None
-    success_response.json.return_value = mock_series_response
+    success_response = json_response(mock_series_response)
 
     mock_get.side_effect = [rate_limit_error, success_response]
 
@@ -636,8 +638,6 @@ def test_rate_limit_retry_success(
     assert "zh-CN" in translations
 
 
-@patch("httpx.Client.get")
-@patch("time.sleep")
 def test_rate_limit_max_retries_exceeded(
     mock_sleep: Mock, mock_get: Mock, translator: Translator
 ) -> None:
@@ -669,7 +669,6 @@ def test_rate_limit_max_retries_exceeded(
 
 
 @pytest.mark.parametrize("status_code", [400, 401, 403, 500])
-@patch("httpx.Client.get")
 def test_non_cacheable_http_error_is_not_retried_or_cached(
     mock_get: Mock, translator: Translator, status_code: int
 ) -> None:
@@ -688,10 +687,8 @@ def test_non_cacheable_http_error_is_not_retried_or_cached(
     assert cache_key not in translator.cache
 
 
-@patch("httpx.Client.get")
-@patch("time.sleep")
 def test_rate_limit_exponential_backoff_max_delay(
-    mock_sleep: Mock, mock_get: Mock, test_settings: Settings
+    mock_sleep: Mock, test_settings: Settings, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     """Test that exponential backoff respects maximum delay."""
     # Configure low max delay for testing
@@ -700,6 +697,8 @@ def test_rate_limit_exponential_backoff_max_delay(
 
     with Cache() as cache:
         translator = Translator(test_settings, cache)
+        mock_get = Mock()
+        monkeypatch.setattr(translator.client, "get", mock_get)
 
         # All calls return 429
         rate_limit_response = Mock()
@@ -723,8 +722,6 @@ def test_rate_limit_exponential_backoff_max_delay(
         translator.close()
 
 
-@patch("httpx.Client.get")
-@patch("time.sleep")
 def test_rate_limit_preserves_cache_on_failure(
     mock_sleep: Mock, mock_get: Mock, translator: Translator
 ) -> None:
@@ -792,30 +789,28 @@ def mock_find_imdb_response() -> dict[str, Any]:
 
 
 def test_find_tmdb_id_by_external_id_tvdb_success(
-    translator: Translator, mock_find_tvdb_response: dict[str, Any]
+    translator: Translator, mock_get: Mock, mock_find_tvdb_response: dict[str, Any]
 ) -> None:
     """Test successful TVDB to TMDB ID lookup."""
-    with patch.object(translator.client, "get") as mock_get:
-        # Mock successful API response
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = mock_find_tvdb_response
-        mock_get.return_value = mock_response
-
-        # Call the method
-        result = translator.find_tmdb_id_by_external_id("81189", "tvdb_id")
-
-        # Verify result
-        assert result == 1396
-
-        # Verify API call
-        mock_get.assert_called_once_with(
-            "/find/81189", params={"external_source": "tvdb_id"}
-        )
+    # Mock successful API response
+    mock_response = json_response(mock_find_tvdb_response)
+    mock_get.return_value = mock_response
+
+    # Call the method
+    result = translator.find_tmdb_id_by_external_id("81189", "tvdb_id")
+
+    # Verify result
+    assert result == 1396
+
+    # Verify API call
+    mock_get.assert_called_once_with(
+        "/find/81189", params={"external_source": "tvdb_id"}
+    )
 
 
 def test_find_tmdb_id_by_external_id_tvdb_episode_success(
     translator: Translator,
+    mock_get: Mock,
 ) -> None:
     """Resolve an episode TVDB ID through its parent TMDB show ID."""
     episode_response: dict[str, Any] = {
@@ -833,20 +828,17 @@ def test_find_tmdb_id_by_external_id_tvdb_episode_success(
         "tv_season_results": [],
     }
 
-    with patch.object(translator.client, "get") as mock_get:
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = episode_response
-        mock_get.return_value = mock_response
+    mock_response = json_response(episode_response)
+    mock_get.return_value = mock_response
 
-        result = translator.find_tmdb_id_by_external_id(
-            "11593814", "tvdb_id", resource_type="episode"
-        )
+    result = translator.find_tmdb_id_by_external_id(
+        "11593814", "tvdb_id", resource_type="episode"
+    )
 
-        assert result == 277439
-        mock_get.assert_called_once_with(
-            "/find/11593814", params={"external_source": "tvdb_id"}
-        )
+    assert result == 277439
+    mock_get.assert_called_once_with(
+        "/find/11593814", params={"external_source": "tvdb_id"}
+    )
 
 
 @pytest.fixture
@@ -862,64 +854,61 @@ def mock_find_tvdb_collision_response() -> dict[str, Any]:
 
 
 def test_find_tmdb_id_by_external_id_prefers_episode_result_on_collision(
-    translator: Translator, mock_find_tvdb_collision_response: dict[str, Any]
+    translator: Translator,
+    mock_get: Mock,
+    mock_find_tvdb_collision_response: dict[str, Any],
 ) -> None:
     """Prefer the episode's parent when TVDB IDs collide across resource types."""
-    with patch.object(translator.client, "get") as mock_get:
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = mock_find_tvdb_collision_response
-        mock_get.return_value = mock_response
-
-        result = translator.find_tmdb_id_by_external_id(
-            "127401", "tvdb_id", resource_type="episode"
-        )
+    mock_response = json_response(mock_find_tvdb_collision_response)
+    mock_get.return_value = mock_response
 
-        assert result == 35935
-        mock_get.assert_called_once_with(
-            "/find/127401", params={"external_source": "tvdb_id"}
-        )
+    result = translator.find_tmdb_id_by_external_id(
+        "127401", "tvdb_id", resource_type="episode"
+    )
+
+    assert result == 35935
+    mock_get.assert_called_once_with(
+        "/find/127401", params={"external_source": "tvdb_id"}
+    )
 
 
 def test_find_tmdb_id_by_external_id_uses_tv_result_for_series_collision(
-    translator: Translator, mock_find_tvdb_collision_response: dict[str, Any]
+    translator: Translator,
+    mock_get: Mock,
+    mock_find_tvdb_collision_response: dict[str, Any],
 ) -> None:
     """Use the TV result when resolving a series NFO with a colliding ID."""
-    with patch.object(translator.client, "get") as mock_get:
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = mock_find_tvdb_collision_response
-        mock_get.return_value = mock_response
+    mock_response = json_response(mock_find_tvdb_collision_response)
+    mock_get.return_value = mock_response
 
-        result = translator.find_tmdb_id_by_external_id("127401", "tvdb_id")
+    result = translator.find_tmdb_id_by_external_id("127401", "tvdb_id")
 
-        assert result == 23747
+    assert result == 23747
 
 
 def test_find_tmdb_id_by_external_id_imdb_success(
-    translator: Translator, mock_find_imdb_response: dict[str, Any]
+    translator: Translator, mock_get: Mock, mock_find_imdb_response: dict[str, Any]
 ) -> None:
     """Test successful IMDB to TMDB ID lookup."""
-    with patch.object(translator.client, "get") as mock_get:
-        # Mock successful API response
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = mock_find_imdb_response
-        mock_get.return_value = mock_response
-
-        # Call the method
-        result = translator.find_tmdb_id_by_external_id("tt0386676", "imdb_id")
-
-        # Verify result
-        assert result == 2316
-
-        # Verify API call
-        mock_get.assert_called_once_with(
-            "/find/tt0386676", params={"external_source": "imdb_id"}
-        )
+    # Mock successful API response
+    mock_response = json_response(mock_find_imdb_response)
+    mock_get.return_value = mock_response
 
+    # Call the method
+    result = translator.find_tmdb_id_by_external_id("tt0386676", "imdb_id")
 
-def test_find_tmdb_id_by_external_id_no_results(translator: Translator) -> None:
+    # Verify result
+    assert result == 2316
+
+    # Verify API call
+    mock_get.assert_called_once_with(
+        "/find/tt0386676", params={"external_source": "imdb_id"}
+    )
+
+
+def test_find_tmdb_id_by_external_id_no_results(
+    translator: Translator, mock_get: Mock
+) -> None:
     """Test external ID lookup with no TV results."""
     empty_response: dict[str, Any] = {
         "movie_results": [],
@@ -929,56 +918,52 @@ def test_find_tmdb_id_by_external_id_no_results(translator: Translator) -> None:
         "tv_season_results": [],
     }
 
-    with patch.object(translator.client, "get") as mock_get:
-        # Mock API response with no TV results
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = empty_response
-        mock_get.return_value = mock_response
+    # Mock API response with no TV results
+    mock_response = json_response(empty_response)
+    mock_get.return_value = mock_response
 
-        # Call the method
-        result = translator.find_tmdb_id_by_external_id("999999", "tvdb_id")
+    # Call the method
+    result = translator.find_tmdb_id_by_external_id("999999", "tvdb_id")
 
-        # Verify result is None
-        assert result is None
+    # Verify result is None
+    assert result is None
 
 
-def test_find_tmdb_id_by_external_id_api_error(translator: Translator) -> None:
+def test_find_tmdb_id_by_external_id_api_error(
+    translator: Translator, mock_get: Mock
+) -> None:
     """Test external ID lookup with API error."""
-    with patch.object(translator.client, "get") as mock_get:
-        # Mock API error
-        mock_get.side_effect = httpx.HTTPError("API Error")
+    # Mock API error
+    mock_get.side_effect = httpx.HTTPError("API Error")
 
-        # Call the method - should raise the HTTP error (fail-fast behavior)
-        with pytest.raises(httpx.HTTPError, match="API Error"):
-            translator.find_tmdb_id_by_external_id("12345", "tvdb_id")
+    # Call the method - should raise the HTTP error (fail-fast behavior)
+    with pytest.raises(httpx.HTTPError, match="API Error"):
+        translator.find_tmdb_id_by_external_id("12345", "tvdb_id")
 
 
 def test_find_tmdb_id_by_external_id_caching(
-    translator: Translator, mock_find_tvdb_response: dict[str, Any]
+    translator: Translator, mock_get: Mock, mock_find_tvdb_response: dict[str, Any]
 ) -> None:
     """Test external ID lookup caching behavior."""
-    with patch.object(translator.client, "get") as mock_get:
-        # Mock successful API response
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = mock_find_tvdb_response
-        mock_get.return_value = mock_response
+    # Mock successful API response
+    mock_response = json_response(mock_find_tvdb_response)
+    mock_get.return_value = mock_response
 
-        # First call
-        result1 = translator.find_tmdb_id_by_external_id("81189", "tvdb_id")
-        assert result1 == 1396
+    # First call
+    result1 = translator.find_tmdb_id_by_external_id("81189", "tvdb_id")
+    assert result1 == 1396
 
-        # Second call - should use cache
-        result2 = translator.find_tmdb_id_by_external_id("81189", "tvdb_id")
-        assert result2 == 1396
+    # Second call - should use cache
+    result2 = translator.find_tmdb_id_by_external_id("81189", "tvdb_id")
+    assert result2 == 1396
 
-        # Verify only one API call was made
-        mock_get.assert_called_once()
+    # Verify only one API call was made
+    mock_get.assert_called_once()
 
 
 def test_find_tmdb_id_by_external_id_cache_negative_result(
     translator: Translator,
+    mock_get: Mock,
 ) -> None:
     """Test that negative results are also cached."""
     empty_response: dict[str, Any] = {
@@ -989,26 +974,22 @@ def test_find_tmdb_id_by_external_id_cache_negative_result(
         "tv_season_results": [],
     }
 
-    with patch.object(translator.client, "get") as mock_get:
-        # Mock API response with no results
-        mock_response = Mock()
-        mock_response.raise_for_status.return_value = None
-        mock_response.json.return_value = empty_response
-        mock_get.return_value = mock_response
+    # Mock API response with no results
+    mock_response = json_response(empty_response)
+    mock_get.return_value = mock_response
 
-        # First call
-        result1 = translator.find_tmdb_id_by_external_id("999999", "tvdb_id")
-        assert result1 is None
+    # First call
+    result1 = translator.find_tmdb_id_by_external_id("999999", "tvdb_id")
+    assert result1 is None
 
-        # Second call - should use cache
-        result2 = translator.find_tmdb_id_by_external_id("999999", "tvdb_id")
-        assert result2 is None
+    # Second call - should use cache
+    result2 = translator.find_tmdb_id_by_external_id("999999", "tvdb_id")
+    assert result2 is None
 
-        # Verify only one API call was made
-        mock_get.assert_called_once()
+    # Verify only one API call was made
+    mock_get.assert_called_once()
 
 
-@patch("httpx.Client.get")
 def test_get_translations_ignores_legacy_derived_cache(
     mock_get: Mock, translator: Translator, mock_series_response: dict[str, Any]
 ) -> None:
@@ -1024,9 +1005,7 @@ def test_get_translations_ignores_legacy_derived_cache(
             )
         },
     )
-    mock_response = Mock()
-    mock_response.raise_for_status.return_value = None
-    mock_response.json.return_value = mock_series_response
+    mock_response = json_response(mock_series_response)
     mock_get.return_value = mock_response
 
     translations = translator.get_translations(tmdb_ids)
@@ -1038,7 +1017,6 @@ def test_get_translations_ignores_legacy_derived_cache(
     assert translator.cache[response_cache_key]["body"] == mock_series_response
 
 
-@patch("httpx.Client.get")
 def test_get_cached_json_caches_404_outcome(
     mock_get: Mock, translator: Translator
 ) -> None:
@@ -1056,7 +1034,6 @@ def test_get_cached_json_caches_404_outcome(
     assert mock_get.call_count == 1
 
 
-@patch("httpx.Client.get")
 def test_get_translations_404_cached(mock_get: Mock, translator: Translator) -> None:
     """Test that get_translations properly caches 404 responses as empty dict."""
     # Mock 404 HTTP error
@@ -1086,7 +1063,6 @@ def test_get_translations_404_cached(mock_get: Mock, translator: Translator) ->
     assert translations1 == translations2
 
 
-@patch("httpx.Client.get")
 def test_get_original_details_404_cached(
     mock_get: Mock, translator: Translator
 ) -> None:
@@ -1133,7 +1109,6 @@ def test_get_original_details_404_cached(
         ),
     ],
 )
-@patch("httpx.Client.get")
 def test_get_original_details_returns_none_when_resource_not_found(
     mock_get: Mock,
     translator: Translator,
@@ -1147,16 +1122,13 @@ def test_get_original_details_returns_none_when_resource_not_found(
     mock_get.assert_called_once_with(endpoint, params=None)
 
 
-@patch("httpx.Client.get")
 def test_get_original_details_episode_returns_none_when_series_not_found(
     mock_get: Mock,
     translator: Translator,
     mock_episode_details_response: dict[str, Any],
 ) -> None:
     """Test episode details return None when its series is unavailable."""
-    episode_response = Mock()
-    episode_response.raise_for_status.return_value = None
-    episode_response.json.return_value = mock_episode_details_response
+    episode_response = json_response(mock_episode_details_response)
     mock_get.side_effect = [episode_response, mock_not_found_error()]
 
     tmdb_ids = TmdbIds(tmdb_id=99999, media_type="tv", season=1, episode=1)
@@ -1168,7 +1140,6 @@ def test_get_original_details_episode_returns_none_when_series_not_found(
     ]
 
 
-@patch("httpx.Client.get")
 def test_find_tmdb_id_404_cached(mock_get: Mock, translator: Translator) -> None:
     """Test that find_tmdb_id_by_external_id properly caches 404 responses as None."""
     # Mock 404 HTTP error
@@ -1259,7 +1230,6 @@ class TestSelectBestImage:
             ],
         }
 
-    @patch("httpx.Client.get")
     def test_select_best_image_poster_exact_match(
         self,
         mock_get: Mock,
@@ -1277,7 +1247,6 @@ class TestSelectBestImage:
         assert result.iso_639_1 == "en"
         assert result.iso_3166_1 == "US"
 
-    @patch("httpx.Client.get")
     def test_select_best_image_clearlogo_exact_match(
         self,
         mock_get: Mock,
@@ -1295,7 +1264,6 @@ class TestSelectBestImage:
         assert result.iso_639_1 == "ja"
         assert result.iso_3166_1 == "JP"
 
-    @patch("httpx.Client.get")
     def test_select_best_image_movie_uses_movie_images_path(
         self,
         mock_get: Mock,
@@ -1313,7 +1281,6 @@ class TestSelectBestImage:
         assert result is not None
         assert result.file_path == "/poster_en_us.jpg"
 
-    @patch("httpx.Client.get")
     def test_select_best_image_season_poster(
         self,
         mock_get: Mock,
@@ -1345,7 +1312,6 @@ class TestSelectBestImage:
         assert result is not None
         assert result.file_path == "/season1_poster.jpg"
 
-    @patch("httpx.Client.get")
     def test_select_best_image_preference_order(
         self,
         mock_get: Mock,
@@ -1367,7 +1333,6 @@ class TestSelectBestImage:
         assert result.iso_639_1 == "en"
         assert result.iso_3166_1 == "US"
 
-    @patch("httpx.Client.get")
     def test_select_best_image_no_match_returns_none(
         self,
         mock_get: Mock,
@@ -1383,7 +1348,6 @@ class TestSelectBestImage:
 
         assert result is None
 
-    @patch("httpx.Client.get")
     def test_select_best_image_skips_null_language(
         self,
         mock_get: Mock,
@@ -1417,7 +1381,6 @@ class TestSelectBestImage:
         # Should skip null and return en-US
         assert result.file_path == "/poster_en.jpg"
 
-    @patch("httpx.Client.get")
     def test_select_best_image_skips_malformed_language_codes(
         self,
         mock_get: Mock,
@@ -1438,7 +1401,6 @@ class TestSelectBestImage:
         assert result.iso_639_1 == "en"
         assert result.iso_3166_1 == "US"
 
-    @patch("httpx.Client.get")
     def test_select_best_image_handles_404(
         self,
         mock_get: Mock,
@@ -1452,7 +1414,6 @@ class TestSelectBestImage:
 
         assert result is None
 
-    @patch("httpx.Client.get")
     def test_select_best_image_caching(
         self,
         mock_get: Mock,
@@ -1474,7 +1435,6 @@ class TestSelectBestImage:
 
         assert result1 == result2
 
-    @patch("httpx.Client.get")
     def test_select_best_image_empty_array(
         self,
         mock_get: Mock,
@@ -1489,7 +1449,6 @@ class TestSelectBestImage:
 
         assert result is None
 
-    @patch("httpx.Client.get")
     def test_select_best_image_different_language_combinations(
         self,
         mock_get: Mock,
@@ -1519,7 +1478,7 @@ class TestSelectBestImage:
                 {"file_path": "/path2.jpg", "iso_639_1": "pt", "iso_3166_1": "BR"}
             ],
         }
-        mock_get.return_value.json.return_value = response_pt_br
+        configure_image_response(mock_get, response_pt_br)
         result = translator.select_best_image(tmdb_ids, ["pt-BR"], kind="poster")
         assert result is not None
         assert result.iso_639_1 == "pt"
@@ -1533,7 +1492,7 @@ class TestSelectBestImage:
                 {"file_path": "/path3.png", "iso_639_1": "zh", "iso_3166_1": "CN"}
             ],
         }
-        mock_get.return_value.json.return_value = response_zh_cn
+        configure_image_response(mock_get, response_zh_cn)
         result = translator.select_best_image(tmdb_ids, ["zh-CN"], kind="clearlogo")
         assert result is not None
         assert result.iso_639_1 == "zh"
@@ -1547,13 +1506,12 @@ class TestSelectBestImage:
                 {"file_path": "/path4.jpg", "iso_639_1": "es", "iso_3166_1": "MX"}
             ],
         }
-        mock_get.return_value.json.return_value = response_es_mx
+        configure_image_response(mock_get, response_es_mx)
         result = translator.select_best_image(tmdb_ids, ["es-MX"], kind="poster")
         assert result is not None
         assert result.iso_639_1 == "es"
         assert result.iso_3166_1 == "MX"
 
-    @patch("httpx.Client.get")
     def test_select_best_image_invalid_kind(
         self,
         mock_get: Mock,
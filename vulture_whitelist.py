@@ -34,6 +34,9 @@ _.selected_file_path
 # Event handler methods are called by watchdog
 _.on_any_event
 
+# ElementTree serializes an element's tail, so parsed documents clear it
+_.tail
+
 
 # Test mock attributes that vulture may not detect
 _.return_value